@@ -0,0 +1,91 @@
+"""pycift_ingest_benchmark
+
+    * Description
+        An ingest benchmark of the result DB (rows per second of 'TIMELINE')
+            - Model.create() per row (the previous way of writing records)
+            - DatabaseManager.insert() with the buffered writer (BulkWriter) per batch size
+
+    * Usage
+        python pycift_ingest_benchmark.py [the number of rows (default: 1000000)]
+"""
+
+import os
+import sys
+import time
+import tempfile
+from pycift.common_defines import *
+from pycift.report.db_models_amazon_alexa import DatabaseManager, Timeline
+
+# Model.create() is slow, so it is measured with fewer rows
+CREATE_ROWS = 20000
+BATCH_SIZES = (1000, 10000, 50000)
+
+
+def make_row(i):
+    """Make a Timeline row similar to records of 'ACTIVITIES'
+    """
+    return dict(
+        date='2018-01-{:02}'.format(i % 28 + 1),
+        time='12:{:02}:{:02}.{:03}'.format(i // 60 % 60, i % 60, i % 1000),
+        epoch=1514808000000 + i,
+        timezone='UTC+09:00',
+        MACB='M...',
+        source='ALEXA',
+        sourcetype='Cloud',
+        type='Activity',
+        host='G0911234567',
+        short='hello',
+        desc='what time is it {}'.format(i),
+        extra='https://pitangui.amazon.com/api/utterance/audio/data?id={}'.format(i),
+        filename='activities.json',
+        format='JSON'
+    )
+
+
+def run(path_db, num_rows, batch_size=None):
+    """Write rows and return rows per second
+    """
+    if os.path.exists(path_db):
+        os.remove(path_db)
+
+    if batch_size is None:
+        db_mgr = DatabaseManager(path_db, delete_db=False)
+    else:
+        db_mgr = DatabaseManager(path_db, delete_db=False, batch_size=batch_size)
+
+    start = time.perf_counter()
+    if batch_size is None:
+        for i in range(num_rows):
+            Timeline.create(**make_row(i))
+    else:
+        for i in range(num_rows):
+            db_mgr.insert(Timeline, **make_row(i))
+    skipped = db_mgr.close()
+    elapsed = time.perf_counter() - start
+
+    db_mgr = DatabaseManager(path_db, delete_db=False)
+    count = Timeline.select().count()
+    db_mgr.close()
+
+    if count + skipped != num_rows:
+        print("Unexpected number of rows ({} of {})".format(count, num_rows))
+    return num_rows / elapsed
+
+
+def main():
+    num_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+
+    with tempfile.TemporaryDirectory() as base_dir:
+        path_db = os.path.join(base_dir, RESULT_DB_AMAZON_ALEXA)
+
+        rate = run(path_db, min(num_rows, CREATE_ROWS))
+        print("Timeline.create()              {:>9} rows {:>10.0f} rows/s".format(min(num_rows, CREATE_ROWS), rate))
+
+        for batch_size in BATCH_SIZES:
+            rate = run(path_db, num_rows, batch_size)
+            print("insert() (batch_size {:>6})   {:>9} rows {:>10.0f} rows/s".format(batch_size, num_rows, rate))
+    return
+
+
+if __name__ == "__main__":
+    main()
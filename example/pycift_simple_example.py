@@ -68,6 +68,9 @@ def main():
     else:
         d, t = PtUtils.get_current_date_and_time()
         base_dir = "./({}_{})_{}".format(d, t.replace(":", "."), base)
+
+    # Write the progress log into the result directory
+    configure_logging(level=logging.DEBUG, path_log=os.path.join(base_dir, PROGRESS_LOG_FILE))
     # ------------------------------------------------------------------
 
     # ------------------------------------------------------------------
@@ -110,10 +113,7 @@ def main():
             cift.close()
     # ------------------------------------------------------------------
 
-    filename = "last_progress_log.txt"
-    if os.path.exists(filename) is True:
-        new_path = "{}\\{}".format(base_dir, filename)
-        PtUtils.copy_file(filename, new_path)
+    shutdown_logging()
     return
 
 
@@ -9,10 +9,12 @@ import time
 import logging
 import json
 import re
+import collections
+from concurrent.futures import ProcessPoolExecutor
 from urllib.parse import urlparse, parse_qs
 
 from pycift.common_defines import *
-from pycift.utility.pt_utils import PtUtils
+from pycift.utility.pt_utils import PtUtils, GzipStatus
 from pycift.utility.browser_automation import BrowserAutomation
 from pycift.utility.chromium_main_cache import ChromiumMainCache, MainCacheEntry
 from pycift.utility.chromium_simple_cache import ChromiumSimpleCache, SimpleCacheEntry
@@ -33,6 +35,9 @@ URL_PREFIX_ALEXA_AUDIO_RAW = "https://alexa.amazon.com/api/utterance/audio/data?
 URL_PREFIX_ALEXA_CONVERSATION_AUDIO = "https://project-wink-mss-na.amazon.com/v1/media/{}"
 URL_PREFIX_ALEXA_CONVERSATION_AUDIO_RAW = "https://project-wink-mss-na.amazon.com/v1/media/"
 
+# Leading bytes of JSON bodies (for sniffing while decompressing cached responses)
+JSON_PREFIXES = (b'{', b'[')
+
 
 # # ===================================================================
 # Enumerations
@@ -351,7 +356,7 @@ class AmazonAlexaInterface:
         self.options = []
 
         # Progress logging manager
-        self.prglog_mgr = logging.getLogger(__name__)
+        self.prglog_mgr = GET_LOGGER(__name__)
 
     def basic_config(self, path_base_dir, browser_driver, options=[]):
         """Set the result DB path
@@ -364,10 +369,10 @@ class AmazonAlexaInterface:
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): Set the basic configurations".format(GET_MY_NAME()))
+        self.prglog_mgr.info("Set the basic configurations")
 
         if browser_driver not in CIFTBrowserDrive:
-            self.prglog_mgr.debug("{}(): {} not in CIFTBrowserDrive".format(GET_MY_NAME(), browser_driver))
+            self.prglog_mgr.debug("%s not in CIFTBrowserDrive", browser_driver)
             return False
 
         self.browser_drive = browser_driver
@@ -383,7 +388,7 @@ class AmazonAlexaInterface:
                 return
 
         self.path_base_dir = path_base_dir
-        self.prglog_mgr.info("{}(): Output path is {}".format(GET_MY_NAME(), path_base_dir))
+        self.prglog_mgr.info("Output path is %s", path_base_dir)
 
         if len(options) != 0:
             for opt in options:
@@ -391,7 +396,7 @@ class AmazonAlexaInterface:
                     self.options.append(opt)
 
         if len(self.options) != 0:
-            self.prglog_mgr.info("{}(): Enabled options - {}".format(GET_MY_NAME(), self.options))
+            self.prglog_mgr.info("Enabled options - %s", self.options)
         return True
 
     def add_input(self, op, *args):
@@ -404,19 +409,19 @@ class AmazonAlexaInterface:
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): Add a new input".format(GET_MY_NAME()))
+        self.prglog_mgr.info("Add a new input")
         if op == CIFTOperation.CLOUD:
-            self.prglog_mgr.info("{}(): OPERATION({}) ID({})".format(GET_MY_NAME(), op.name, args[0]))
+            self.prglog_mgr.info("OPERATION(%s) ID(%s)", op.name, args[0])
         else:
-            self.prglog_mgr.info("{}(): OPERATION({}) ARGS({})".format(GET_MY_NAME(), op.name, args))
+            self.prglog_mgr.info("OPERATION(%s) ARGS(%s)", op.name, args)
 
         if op not in CIFTOperation:
-            self.prglog_mgr.debug("{}(): {} not in CIFTOperation".format(GET_MY_NAME(), op))
+            self.prglog_mgr.debug("%s not in CIFTOperation", op)
             return False
 
         if len(args) == 0:
             self.prglog_mgr.debug(
-                "{}(): At least one argument is required".format(GET_MY_NAME(), op)
+                "At least one argument is required"
             )
             return False
 
@@ -432,14 +437,14 @@ class AmazonAlexaInterface:
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): Run modules for processing user inputs".format(GET_MY_NAME()))
+        self.prglog_mgr.info("Run modules for processing user inputs")
 
         if self.browser_drive is None or self.path_base_dir == "":
-            self.prglog_mgr.debug("{}(): basic_config() should be called".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("basic_config() should be called")
             return False
 
         if len(self.inputs) == 0:
-            self.prglog_mgr.debug("{}(): There is no input to be processed".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("There is no input to be processed")
             return False
 
         for item in self.inputs:
@@ -457,12 +462,12 @@ class AmazonAlexaInterface:
             elif op is CIFTOperation.COMPANION_APP_ANDROID or \
                  op is CIFTOperation.COMPANION_APP_IOS or \
                  op is CIFTOperation.COMPANION_BROWSER_CHROME:
-                companion = AmazonAlexaClient(self.path_base_dir)
+                companion = AmazonAlexaClient(self.path_base_dir, self.options)
                 companion.run(op, item[1])
                 companion.close()
 
             else:
-                self.prglog_mgr.info("{}(): Not supported operation '{}'".format(GET_MY_NAME(), op.name))
+                self.prglog_mgr.info("Not supported operation '%s'", op.name)
                 continue
 
         db_mgr = DatabaseManager("{}/{}".format(self.path_base_dir, RESULT_DB_AMAZON_ALEXA), delete_db=False)
@@ -474,7 +479,7 @@ class AmazonAlexaInterface:
         """Post-process
 
         """
-        self.prglog_mgr.info("{}()".format(GET_MY_NAME()))
+        self.prglog_mgr.info("")
 
         # Add post-processes
         return
@@ -486,6 +491,7 @@ class AmazonAlexaParser:
     Attributes:
         path_base_dir (str): The directory path for storing result files
         db_mgr (DatabaseManager): The database module
+        saved_bodies (dict): {(API, SHA1 of a body): saved path} of deduplicated bodies (cf. process_api())
 
         prglog_mgr (logging): The progress log manager using the standard Python logging module
     """
@@ -498,11 +504,49 @@ class AmazonAlexaParser:
         self.db_mgr = DatabaseManager(
             "{}/{}".format(path_base_dir, RESULT_DB_AMAZON_ALEXA), delete_db
         )
+        self.saved_bodies = dict()
 
         # Progress logging manager
-        self.prglog_mgr = logging.getLogger(__name__)
+        self.prglog_mgr = GET_LOGGER(__name__)
+
+    def add_duplicate_source(self, op, api, url, sha1, response_time=None):
+        """Insert a record into 'ACQUIRED_FILE' table for a duplicate of an already processed body
+
+        Args:
+            op (CIFTOperation): The current operation
+            api (CIFTAmazonAlexaAPI): The current Amazon Alexa API
+            url (str): The URL related to this duplicate
+            sha1 (str): SHA1 of the body
+            response_time (int): Unix millisecond time when the (cached) response was received
 
-    def process_api(self, op, api, url, value, filemode=True, base_path=""):
+        Returns:
+            True or False
+        """
+        path = self.saved_bodies[(api, sha1)]
+        self.prglog_mgr.info("Duplicate of %s", path)
+
+        operation_id = self.db_mgr.get_operation_id(op)
+
+        d, t = PtUtils.get_file_created_date_and_time(path)
+        saved_timestamp = "{} {}".format(d, t)
+        modified_timestamp = "-"
+        if response_time is not None:
+            d, t = PtUtils.convert_unix_millisecond_to_str(response_time)
+            modified_timestamp = "{} {}".format(d, t)
+
+        self.db_mgr.add_acquired_file(
+            operation_id=operation_id,
+            src_path=url,
+            desc=api.desc,
+            saved_path=path,
+            sha1=sha1,
+            saved_timestamp=saved_timestamp,
+            modified_timestamp=modified_timestamp,
+            timezone=PtUtils.get_timezone()
+        )
+        return True
+
+    def process_api(self, op, api, url, value, filemode=True, base_path="", response_time=None, dedup=False):
         """Process the cloud native data acquired by APIs or saved within companion devices
 
         Args:
@@ -512,11 +556,14 @@ class AmazonAlexaParser:
             value (str): JSON data itself or the path of JSON file
             filemode (bool): If True, 'value' is the path of JSON file
             base_path (str): The base path for saving data
+            response_time (int): Unix millisecond time when the (cached) response was received
+            dedup (bool): If True, a body already processed in this run is not parsed again
+                          (only an 'ACQUIRED_FILE' record pointing to the saved copy is added)
 
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): OP({}) API({})".format(GET_MY_NAME(), op.name, api.name))
+        self.prglog_mgr.info("OP(%s) API(%s)", op.name, api.name)
 
         operation_id = -1
         source_id = -1
@@ -527,11 +574,18 @@ class AmazonAlexaParser:
             path = value
             data = open(path).read()
 
+        sha1 = PtUtils.hash_sha1(data.encode('utf-8'))
+
+        # The same body is often cached in more than one location
+        # (keyed by API as well, since other APIs can return the same body, e.g. '{}' or an error)
+        if dedup is True and (api, sha1) in self.saved_bodies:
+            return self.add_duplicate_source(op, api, url, sha1, response_time)
+
         # Read JSON format
         try:
             data_temp = json.loads(data)
         except ValueError:
-            self.prglog_mgr.debug("{}(): Invalid JSON format".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("Invalid JSON format")
             return False
 
         # --------------------------------------------
@@ -544,40 +598,44 @@ class AmazonAlexaParser:
         # name = name.replace("https___", "")
         # path = "{}/{}.json".format(base_path, name)
 
-        self.prglog_mgr.info("{}(): Saved path is {}".format(GET_MY_NAME(), path))
+        self.prglog_mgr.info("Saved path is %s", path)
         PtUtils.save_string_to_file(path, data)
 
+        if dedup is True:
+            self.saved_bodies[(api, sha1)] = path
+
         # --------------------------------------------
         # Insert a record into 'ACQUIRED_FILE' table
         #
-        query = Operation.select().where(Operation.type == op.name)
-
-        if len(query) == 1:
-            operation_id = query[0].id
+        operation_id = self.db_mgr.get_operation_id(op)
 
         d, t = PtUtils.get_file_created_date_and_time(path)
         saved_timestamp = "{} {}".format(d, t)
-        d, t = PtUtils.get_file_modified_date_and_time(path)
-        modified_timestamp = "{} {}".format(d, t)
+        modified_timestamp = "-"
+        if response_time is not None:
+            d, t = PtUtils.convert_unix_millisecond_to_str(response_time)
+            modified_timestamp = "{} {}".format(d, t)
 
-        AcquiredFile.create(
+        source_id = self.db_mgr.add_acquired_file(
             operation_id=operation_id,
             src_path=url,
             desc=api.desc,
             saved_path=path,
-            sha1=PtUtils.hash_sha1(data.encode('utf-8')),
+            sha1=sha1,
             saved_timestamp=saved_timestamp,
-            modified_timestamp="-",
+            modified_timestamp=modified_timestamp,
             timezone=PtUtils.get_timezone()
         )
 
-        source_id = AcquiredFile.select().order_by(AcquiredFile.id.desc()).get()
+        # The source context for handlers (no need to read the record again)
+        _format = "Chromium Simple Cache + JSON" if op == CIFTOperation.COMPANION_APP_ANDROID else "JSON"
+        src = CIFTSource(source_id, op, url, api.desc, path, PtUtils.get_timezone(), _format)
         #
         # End of this segment
         # --------------------------------------------
 
         if api == CIFTAmazonAlexaAPI.UNKNOWN:
-            self.prglog_mgr.info("{}(): UNSUPPORTED API - {}".format(GET_MY_NAME(), url))
+            self.prglog_mgr.info("UNSUPPORTED API - %s", url)
             return True
 
         # Process JSON data
@@ -589,7 +647,8 @@ class AmazonAlexaParser:
             #
             auth = data.get('authentication')
             if auth is not None:
-                Account.create(
+                self.db_mgr.insert(
+                    Account,
                     customer_email=auth.get('customerEmail'),
                     customer_name=auth.get('customerName'),
                     customer_id=auth.get('customerId'),
@@ -606,7 +665,8 @@ class AmazonAlexaParser:
             # Insert a record into 'ACCOUNT' table
             #
             for account in data.get('accounts'):
-                Account.create(
+                self.db_mgr.insert(
+                    Account,
                     customer_email=account.get('email'),
                     customer_name=account.get('fullName'),
                     customer_id=account.get('id'),
@@ -625,7 +685,8 @@ class AmazonAlexaParser:
                 name = "{} {}".format(account.get('firstName'), account.get('lastName'))
                 number = "+{}{}".format(account.get('phoneCountryCode'), account.get('phoneNumber'))
 
-                Account.create(
+                self.db_mgr.insert(
+                    Account,
                     customer_name=name,
                     phone_number=number,
                     comms_id=account.get('commsId'),
@@ -641,7 +702,8 @@ class AmazonAlexaParser:
             # Insert a record into 'CONTACT' table
             #
             for entry in data:
-                Contact.create(
+                self.db_mgr.insert(
+                    Contact,
                     first_name=entry.get("name").get("firstName"),
                     last_name=entry.get("name").get("lastName"),
                     number=entry.get("number"),
@@ -661,7 +723,8 @@ class AmazonAlexaParser:
             # Insert a record into 'SETTING_WIFI' table
             #
             for value in data.get('values'):
-                SettingWifi.create(
+                self.db_mgr.insert(
+                    SettingWifi,
                     ssid=value.get('ssid'),
                     security_method=value.get('securityMethod'),
                     pre_shared_key=value.get('preSharedKey'),
@@ -678,14 +741,16 @@ class AmazonAlexaParser:
             #
             origin = data.get('origin')
             if origin is not None:
-                SettingMisc.create(
+                self.db_mgr.insert(
+                    SettingMisc,
                     name='traffic_origin_address',
                     value=origin.get('label'),
                     source_id=source_id
                 )
 
             for waypoint in data.get('waypoints'):
-                SettingMisc.create(
+                self.db_mgr.insert(
+                    SettingMisc,
                     name='traffic_waypoint',
                     value=waypoint.get('label'),
                     source_id=source_id
@@ -693,7 +758,8 @@ class AmazonAlexaParser:
 
             destination = data.get('destination')
             if origin is not None:
-                SettingMisc.create(
+                self.db_mgr.insert(
+                    SettingMisc,
                     name='traffic_destination_address',
                     value=destination.get('label'),
                     source_id=source_id
@@ -709,7 +775,8 @@ class AmazonAlexaParser:
             #
             for account in data.get('householdAccountList'):
                 if account.get('getCalendarAccountsResponse') is not None:
-                    SettingMisc.create(
+                    self.db_mgr.insert(
+                        SettingMisc,
                         name='calendar_account',
                         value=account.get('getCalendarAccountsResponse'),
                         source_id=source_id
@@ -728,7 +795,8 @@ class AmazonAlexaParser:
                     continue
 
                 if word.get('wakeWord') is not None:
-                    SettingMisc.create(
+                    self.db_mgr.insert(
+                        SettingMisc,
                         name='wake_word',
                         value=word.get('wakeWord'),
                         device_serial_number=word.get('deviceSerialNumber'),
@@ -745,7 +813,8 @@ class AmazonAlexaParser:
             #
             for bluetooth in data.get('bluetoothStates'):
                 if bluetooth.get('pairedDeviceList') is not None:
-                    SettingMisc.create(
+                    self.db_mgr.insert(
+                        SettingMisc,
                         name='paired_bluetooth_device',
                         value=bluetooth.get('pairedDeviceList'),
                         device_serial_number=bluetooth.get('deviceSerialNumber'),
@@ -762,7 +831,8 @@ class AmazonAlexaParser:
             #
             for service in data.get('services'):
                 if service.get('serviceName') is not None:
-                    SettingMisc.create(
+                    self.db_mgr.insert(
+                        SettingMisc,
                         name='third_party_service',
                         value=service.get('serviceName'),
                         source_id=source_id
@@ -777,7 +847,8 @@ class AmazonAlexaParser:
             # Insert a record into 'ALEXA_DEVICE' table
             #
             for device in data.get('devices'):
-                AlexaDevice.create(
+                self.db_mgr.insert(
+                    AlexaDevice,
                     device_account_name=device.get('accountName'),
                     device_family=device.get('deviceFamily'),
                     device_account_id=device.get('deviceAccountId'),
@@ -798,7 +869,8 @@ class AmazonAlexaParser:
             # Insert a record into 'ALEXA_DEVICE' table
             #
             for df in data.get('devicePreferences'):
-                AlexaDevice.create(
+                self.db_mgr.insert(
+                    AlexaDevice,
                     device_account_id=df.get('deviceAccountId'),
                     device_serial_number=df.get('deviceSerialNumber'),
                     device_type=df.get('deviceType'),
@@ -816,51 +888,51 @@ class AmazonAlexaParser:
             return True
 
         if api == CIFTAmazonAlexaAPI.COMPATIBLE_DEVICES:
-            return self.process_api_phoenix(op, api, url, source_id, data)
+            return self.process_api_phoenix(op, api, url, src, data)
 
         if api == CIFTAmazonAlexaAPI.TASK_LIST or api == CIFTAmazonAlexaAPI.SHOPPING_LIST:
-            return self.process_api_todos(op, api, url, source_id, data)
+            return self.process_api_todos(op, api, url, src, data)
 
         if api == CIFTAmazonAlexaAPI.NOTIFICATIONS:
-            return self.process_api_notifications(op, api, url, source_id, data)
+            return self.process_api_notifications(op, api, url, src, data)
 
         if api == CIFTAmazonAlexaAPI.CARDS:
-            return self.process_api_cards(op, api, url, source_id, data)
+            return self.process_api_cards(op, api, url, src, data)
 
         if api == CIFTAmazonAlexaAPI.ACTIVITIES:
-            return self.process_api_activities(op, api, url, source_id, data)
+            return self.process_api_activities(op, api, url, src, data)
 
         if api == CIFTAmazonAlexaAPI.MEDIA_HISTORY:
-            return self.process_api_media_history(op, api, url, source_id, data)
+            return self.process_api_media_history(op, api, url, src, data)
 
         if api == CIFTAmazonAlexaAPI.SKILLS:
-            return self.process_api_skills(op, api, url, source_id, data)
+            return self.process_api_skills(op, api, url, src, data)
 
         if api == CIFTAmazonAlexaAPI.ACTIVITY_DIALOG_ITEM:
-            return self.process_api_activity_dialog_items(op, api, url, source_id, data)
+            return self.process_api_activity_dialog_items(op, api, url, src, data)
 
         if api == CIFTAmazonAlexaAPI.NAMED_LIST:
-            return self.process_api_namedlists(op, api, url, source_id, data)
+            return self.process_api_namedlists(op, api, url, src, data)
 
         if api == CIFTAmazonAlexaAPI.COMMS_CONVERSATION:
-            return self.process_api_conversations(op, api, url, source_id, data)
+            return self.process_api_conversations(op, api, url, src, data)
 
         return True
 
-    def process_api_phoenix(self, op, api, url, source_id, data):
+    def process_api_phoenix(self, op, api, url, src, data):
         """Process the cloud native data acquired by APIs or saved within companion devices
 
         Args:
             op (CIFTOperation): The current operation
             api (CIFTAmazonAlexaAPI): The current Amazon Alexa API
             url (str): The URL related to this operation
-            source_id (int): The source ID for referencing an acquired file
+            src (CIFTSource): The acquired file (source) of this data
             data (str): JSON data
 
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): OP({})".format(GET_MY_NAME(), op.name))
+        self.prglog_mgr.info("OP(%s)", op.name)
 
         # --------------------------------------------
         # Insert a record into 'COMPATIBLE_DEVICE' table
@@ -870,7 +942,7 @@ class AmazonAlexaParser:
             try:
                 temp = json.loads(data.get('networkDetail'))
             except ValueError:
-                self.prglog_mgr.debug("{}(): Invalid JSON format ('networkDetail')".format(GET_MY_NAME()))
+                self.prglog_mgr.debug("Invalid JSON format ('networkDetail')")
                 return False
             else:
                 # pprint.pprint(temp)
@@ -880,21 +952,17 @@ class AmazonAlexaParser:
             root = (data.get('locationDetails').get('locationDetails')
                     .get('Default_Location').get('amazonBridgeDetails').get('amazonBridgeDetails'))
             if root is None:
-                self.prglog_mgr.debug("{}(): Not found JSON path".format(GET_MY_NAME()))
+                self.prglog_mgr.debug("Not found JSON path")
                 return False
         except:
-            self.prglog_mgr.debug("{}(): Not found JSON path".format(GET_MY_NAME()))
-            return False
-
-        query = AcquiredFile.select().where(AcquiredFile.id == source_id)
-        if len(query) == 0:
+            self.prglog_mgr.debug("Not found JSON path")
             return False
 
         source = op.name
-        source_type = query[0].desc
-        filename = query[0].saved_path
-        timezone = PtUtils.get_timezone()
-        _format = "Chromium Simple Cache + JSON" if op == CIFTOperation.COMPANION_APP_ANDROID else "JSON"
+        source_type = src.desc
+        filename = src.saved_path
+        timezone = src.timezone
+        _format = src.format
 
         # Traverse all registered devices
         for key, value in root.items():
@@ -925,7 +993,8 @@ class AmazonAlexaParser:
                 # -------------------------
                 # 'COMPATIBLE_DEVICE' table
                 # -------------------------
-                CompatibleDevice.create(
+                self.db_mgr.insert(
+                    CompatibleDevice,
                     name=app.get('friendlyName'),
                     manufacture=app.get('manufacturerName'),
                     model=app.get('modelName'),
@@ -939,7 +1008,7 @@ class AmazonAlexaParser:
                     appliance_id=app.get('applianceId'),
                     alexa_device_serial_number=alexa_device_serial_number,
                     alexa_device_type=alexa_device_type,
-                    source=source_id
+                    source=src.id
                 )
 
                 # -------------------------
@@ -992,8 +1061,9 @@ class AmazonAlexaParser:
                         macb = "...B"
                         _type = "Created"
 
-                    Timeline.create(
-                        date=b_dt[0], time=b_dt[1], timezone=timezone,
+                    self.db_mgr.insert(
+                        Timeline,
+                        date=b_dt[0], time=b_dt[1], epoch=b, timezone=timezone,
                         MACB=macb, source=source, sourcetype=source_type, type=_type,
                         host=alexa_device_serial_number,
                         short=short if short != "" else "-",
@@ -1014,8 +1084,9 @@ class AmazonAlexaParser:
                         macb = "M..."
                         _type = "Last Seen"
 
-                    Timeline.create(
-                        date=m_dt[0], time=m_dt[1], timezone=timezone,
+                    self.db_mgr.insert(
+                        Timeline,
+                        date=m_dt[0], time=m_dt[1], epoch=m, timezone=timezone,
                         MACB=macb, source=source, sourcetype=source_type, type=_type,
                         host=alexa_device_serial_number,
                         short=short if short != "" else "-",
@@ -1032,8 +1103,9 @@ class AmazonAlexaParser:
                     macb = "..C."
                     _type = "Name Modified"
 
-                    Timeline.create(
-                        date=c_dt[0], time=c_dt[1], timezone=timezone,
+                    self.db_mgr.insert(
+                        Timeline,
+                        date=c_dt[0], time=c_dt[1], epoch=c, timezone=timezone,
                         MACB=macb, source=source, sourcetype=source_type, type=_type,
                         host=alexa_device_serial_number,
                         short=short if short != "" else "-",
@@ -1047,38 +1119,34 @@ class AmazonAlexaParser:
         # --------------------------------------------
         return True
 
-    def process_api_todos(self, op, api, url, source_id, data):
+    def process_api_todos(self, op, api, url, src, data):
         """Process the cloud native data acquired by APIs or saved within companion devices
 
         Args:
             op (CIFTOperation): The current operation
             api (CIFTAmazonAlexaAPI): The current Amazon Alexa API
             url (str): The URL related to this operation
-            source_id (int): The source ID for referencing an acquired file
+            src (CIFTSource): The acquired file (source) of this data
             data (str): JSON data
 
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): OP({})".format(GET_MY_NAME(), op.name))
+        self.prglog_mgr.info("OP(%s)", op.name)
         # --------------------------------------------
         # Insert a record into 'TIMELINE' table
         #
-        query = AcquiredFile.select().where(AcquiredFile.id == source_id)
-        if len(query) == 0:
-            return False
-
         source = op.name
-        source_type = query[0].desc
-        filename = query[0].saved_path
-        timezone = PtUtils.get_timezone()
-        _format = "Chromium Simple Cache + JSON" if op == CIFTOperation.COMPANION_APP_ANDROID else "JSON"
+        source_type = src.desc
+        filename = src.saved_path
+        timezone = src.timezone
+        _format = src.format
 
         if data.get('values') is None:
             if data.get('createdDate') is not None:
                 data['values'] = [data]
             else:
-                self.prglog_mgr.debug("{}(): Invalid '{}'".format(GET_MY_NAME(), api.name))
+                self.prglog_mgr.debug("Invalid '%s'", api.name)
                 return False
 
         for value in data.get('values'):
@@ -1119,8 +1187,9 @@ class AmazonAlexaParser:
                     macb = "...B"
                     _type = "Created"
 
-                Timeline.create(
-                    date=b_dt[0], time=b_dt[1], timezone=timezone,
+                self.db_mgr.insert(
+                    Timeline,
+                    date=b_dt[0], time=b_dt[1], epoch=b, timezone=timezone,
                     MACB=macb, source=source, sourcetype=source_type, type=_type,
                     user=value.get('customerId'),  # host="",
                     short=short if short != "" else "-",
@@ -1141,8 +1210,9 @@ class AmazonAlexaParser:
                     macb = "M..."
                     _type = "Last Updated"
 
-                Timeline.create(
-                    date=m_dt[0], time=m_dt[1], timezone=timezone,
+                self.db_mgr.insert(
+                    Timeline,
+                    date=m_dt[0], time=m_dt[1], epoch=m, timezone=timezone,
                     MACB=macb, source=source, sourcetype=source_type, type=_type,
                     user=value.get('customerId'),  # host="",
                     short=short if short != "" else "-",
@@ -1159,8 +1229,9 @@ class AmazonAlexaParser:
                 macb = "..C."
                 _type = "Last Local Updated"
 
-                Timeline.create(
-                    date=c_dt[0], time=c_dt[1], timezone=timezone,
+                self.db_mgr.insert(
+                    Timeline,
+                    date=c_dt[0], time=c_dt[1], epoch=c, timezone=timezone,
                     MACB=macb, source=source, sourcetype=source_type, type=_type,
                     user=value.get('customerId'),  # host="",
                     short=short if short != "" else "-",
@@ -1174,32 +1245,28 @@ class AmazonAlexaParser:
         # --------------------------------------------
         return True
 
-    def process_api_notifications(self, op, api, url, source_id, data):
+    def process_api_notifications(self, op, api, url, src, data):
         """Process the cloud native data acquired by APIs or saved within companion devices
 
         Args:
             op (CIFTOperation): The current operation
             api (CIFTAmazonAlexaAPI): The current Amazon Alexa API
             url (str): The URL related to this operation
-            source_id (int): The source ID for referencing an acquired file
+            src (CIFTSource): The acquired file (source) of this data
             data (str): JSON data
 
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): OP({})".format(GET_MY_NAME(), op.name))
+        self.prglog_mgr.info("OP(%s)", op.name)
         # --------------------------------------------
         # Insert a record into 'TIMELINE' table
         #
-        query = AcquiredFile.select().where(AcquiredFile.id == source_id)
-        if len(query) == 0:
-            return False
-
         source = op.name
-        source_type = query[0].desc
-        filename = query[0].saved_path
-        timezone = PtUtils.get_timezone()
-        _format = "Chromium Simple Cache + JSON" if op == CIFTOperation.COMPANION_APP_ANDROID else "JSON"
+        source_type = src.desc
+        filename = src.saved_path
+        timezone = src.timezone
+        _format = src.format
         macb = "...B"
         _type = "Created"
 
@@ -1207,7 +1274,7 @@ class AmazonAlexaParser:
             if data.get('notification') is not None:
                 data['notifications'] = [data]
             else:
-                self.prglog_mgr.debug("{}(): Invalid '{}'".format(GET_MY_NAME(), api.name))
+                self.prglog_mgr.debug("Invalid '%s'", api.name)
                 return False
 
         for noti in data.get('notifications'):
@@ -1224,8 +1291,9 @@ class AmazonAlexaParser:
             notes = noti.get('status')
             extra = "-"
 
-            Timeline.create(
-                date=b_dt[0], time=b_dt[1], timezone=timezone,
+            self.db_mgr.insert(
+                Timeline,
+                date=b_dt[0], time=b_dt[1], epoch=noti.get('createdDate'), timezone=timezone,
                 MACB=macb, source=source, sourcetype=source_type, type=_type,
                 host=noti.get('deviceSerialNumber'),
                 short=short if short != "" else "-",
@@ -1239,33 +1307,29 @@ class AmazonAlexaParser:
         # --------------------------------------------
         return True
 
-    def process_api_cards(self, op, api, url, source_id, data):
+    def process_api_cards(self, op, api, url, src, data):
         """Process the cloud native data acquired by APIs or saved within companion devices
 
         Args:
             op (CIFTOperation): The current operation
             api (CIFTAmazonAlexaAPI): The current Amazon Alexa API
             url (str): The URL related to this operation
-            source_id (int): The source ID for referencing an acquired file
+            src (CIFTSource): The acquired file (source) of this data
             data (str): JSON data
 
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): OP({})".format(GET_MY_NAME(), op.name))
+        self.prglog_mgr.info("OP(%s)", op.name)
         # --------------------------------------------
         # Insert a record into 'TIMELINE' table
         #
-        query = AcquiredFile.select().where(AcquiredFile.id == source_id)
-        if len(query) == 0:
-            return False
-
         source = op.name
-        source_type = query[0].desc
+        source_type = src.desc
         # filename = query[0].src_path
-        filename = query[0].saved_path
-        timezone = PtUtils.get_timezone()
-        _format = "Chromium Simple Cache + JSON" if op == CIFTOperation.COMPANION_APP_ANDROID else "JSON"
+        filename = src.saved_path
+        timezone = src.timezone
+        _format = src.format
         macb = "...B"
         _type = "Created"
 
@@ -1273,7 +1337,7 @@ class AmazonAlexaParser:
             if data.get('cardType') is not None:
                 data['cards'] = [data]
             else:
-                self.prglog_mgr.debug("{}(): Invalid '{}'".format(GET_MY_NAME(), api.name))
+                self.prglog_mgr.debug("Invalid '%s'", api.name)
                 return False
 
         for card in data.get('cards'):
@@ -1315,8 +1379,9 @@ class AmazonAlexaParser:
             if notes == "": notes = "-"
             if extra == "": extra = "-"
 
-            Timeline.create(
-                date=b_dt[0], time=b_dt[1], timezone=timezone,
+            self.db_mgr.insert(
+                Timeline,
+                date=b_dt[0], time=b_dt[1], epoch=card.get('creationTimestamp'), timezone=timezone,
                 MACB=macb, source=source, sourcetype=source_type, type=_type,
                 user=card.get('registeredCustomerId'),
                 host=card.get('sourceDevice').get('serialNumber'),
@@ -1331,32 +1396,28 @@ class AmazonAlexaParser:
         # --------------------------------------------
         return True
 
-    def process_api_activities(self, op, api, url, source_id, data):
+    def process_api_activities(self, op, api, url, src, data):
         """Process the cloud native data acquired by APIs or saved within companion devices
 
         Args:
             op (CIFTOperation): The current operation
             api (CIFTAmazonAlexaAPI): The current Amazon Alexa API
             url (str): The URL related to this operation
-            source_id (int): The source ID for referencing an acquired file
+            src (CIFTSource): The acquired file (source) of this data
             data (str): JSON data
 
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): OP({})".format(GET_MY_NAME(), op.name))
+        self.prglog_mgr.info("OP(%s)", op.name)
         # --------------------------------------------
         # Insert a record into 'TIMELINE' table
         #
-        query = AcquiredFile.select().where(AcquiredFile.id == source_id)
-        if len(query) == 0:
-            return False
-
         source = op.name
-        source_type = query[0].desc
-        filename = query[0].saved_path
-        timezone = PtUtils.get_timezone()
-        _format = "Chromium Simple Cache + JSON" if op == CIFTOperation.COMPANION_APP_ANDROID else "JSON"
+        source_type = src.desc
+        filename = src.saved_path
+        timezone = src.timezone
+        _format = src.format
         macb = "...B"
         _type = "Created"
 
@@ -1364,7 +1425,7 @@ class AmazonAlexaParser:
             if data.get('activity') is not None:
                 data['activities'] = [data.get('activity')]
             else:
-                self.prglog_mgr.debug("{}(): Invalid '{}'".format(GET_MY_NAME(), api.name))
+                self.prglog_mgr.debug("Invalid '%s'", api.name)
                 return False
 
         for act in data.get('activities'):
@@ -1397,8 +1458,9 @@ class AmazonAlexaParser:
             if desc == "":
                 desc = "-"
 
-            Timeline.create(
-                date=b_dt[0], time=b_dt[1], timezone=timezone,
+            self.db_mgr.insert(
+                Timeline,
+                date=b_dt[0], time=b_dt[1], epoch=act.get('creationTimestamp'), timezone=timezone,
                 MACB=macb, source=source, sourcetype=source_type, type=_type,
                 user=act.get('registeredCustomerId'),
                 host=act.get('sourceDeviceIds')[0].get('serialNumber'),
@@ -1413,32 +1475,28 @@ class AmazonAlexaParser:
         # --------------------------------------------
         return True
 
-    def process_api_activity_dialog_items(self, op, api, url, source_id, data):
+    def process_api_activity_dialog_items(self, op, api, url, src, data):
         """Process the cloud native data acquired by APIs or saved within companion devices
 
         Args:
             op (CIFTOperation): The current operation
             api (CIFTAmazonAlexaAPI): The current Amazon Alexa API
             url (str): The URL related to this operation
-            source_id (int): The source ID for referencing an acquired file
+            src (CIFTSource): The acquired file (source) of this data
             data (str): JSON data
 
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): OP({})".format(GET_MY_NAME(), op.name))
+        self.prglog_mgr.info("OP(%s)", op.name)
         # --------------------------------------------
         # Insert a record into 'TIMELINE' table
         #
-        query = AcquiredFile.select().where(AcquiredFile.id == source_id)
-        if len(query) == 0:
-            return False
-
         source = op.name
-        source_type = query[0].desc
-        filename = query[0].saved_path
-        timezone = PtUtils.get_timezone()
-        _format = "Chromium Simple Cache + JSON" if op == CIFTOperation.COMPANION_APP_ANDROID else "JSON"
+        source_type = src.desc
+        filename = src.saved_path
+        timezone = src.timezone
+        _format = src.format
         macb = "...B"
         _type = "Created"
 
@@ -1502,8 +1560,9 @@ class AmazonAlexaParser:
             else:
                 host = "{}".format(temp.get('deviceSerialNumber'))
 
-            Timeline.create(
-                date=b_dt[0], time=b_dt[1], timezone=timezone,
+            self.db_mgr.insert(
+                Timeline,
+                date=b_dt[0], time=b_dt[1], epoch=act.get('timestamp'), timezone=timezone,
                 MACB=macb, source=source, sourcetype=source_type, type=_type,
                 user=act.get('registeredUserId'),
                 host=host,
@@ -1518,32 +1577,28 @@ class AmazonAlexaParser:
         # --------------------------------------------
         return True
 
-    def process_api_media_history(self, op, api, url, source_id, data):
+    def process_api_media_history(self, op, api, url, src, data):
         """Process the cloud native data acquired by APIs or saved within companion devices
 
         Args:
             op (CIFTOperation): The current operation
             api (CIFTAmazonAlexaAPI): The current Amazon Alexa API
             url (str): The URL related to this operation
-            source_id (int): The source ID for referencing an acquired file
+            src (CIFTSource): The acquired file (source) of this data
             data (str): JSON data
 
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): OP({})".format(GET_MY_NAME(), op.name))
+        self.prglog_mgr.info("OP(%s)", op.name)
         # --------------------------------------------
         # Insert a record into 'TIMELINE' table
         #
-        query = AcquiredFile.select().where(AcquiredFile.id == source_id)
-        if len(query) == 0:
-            return False
-
         source = op.name
-        source_type = query[0].desc
-        filename = query[0].saved_path
-        timezone = PtUtils.get_timezone()
-        _format = "Chromium Simple Cache + JSON" if op == CIFTOperation.COMPANION_APP_ANDROID else "JSON"
+        source_type = src.desc
+        filename = src.saved_path
+        timezone = src.timezone
+        _format = src.format
         macb = "...B"
         _type = "Started"
 
@@ -1568,8 +1623,9 @@ class AmazonAlexaParser:
             if m.get('historicalId') is not None:
                 extra = "Historical ID: \"{}\"".format(m.get('historicalId'))
 
-            Timeline.create(
-                date=b_dt[0], time=b_dt[1], timezone=timezone,
+            self.db_mgr.insert(
+                Timeline,
+                date=b_dt[0], time=b_dt[1], epoch=m.get('startTime'), timezone=timezone,
                 MACB=macb, source=source, sourcetype=source_type, type=_type,
                 host=device_serial_number,
                 short=short if short != "" else "-",
@@ -1600,8 +1656,9 @@ class AmazonAlexaParser:
             notes = notes.replace("\n", " ")
             extra = extra.replace("\n", " ")
 
-            Timeline.create(
-                date=b_dt[0], time=b_dt[1], timezone=timezone,
+            self.db_mgr.insert(
+                Timeline,
+                date=b_dt[0], time=b_dt[1], epoch=s.get('startTime'), timezone=timezone,
                 MACB=macb, source=source, sourcetype=source_type, type=_type,
                 host=device_serial_number,
                 short=short if short != "" else "-",
@@ -1615,20 +1672,20 @@ class AmazonAlexaParser:
         # --------------------------------------------
         return True
 
-    def process_api_skills(self, op, api, url, source_id, data):
+    def process_api_skills(self, op, api, url, src, data):
         """Process the cloud native data acquired by APIs or saved within companion devices
 
         Args:
             op (CIFTOperation): The current operation
             api (CIFTAmazonAlexaAPI): The current Amazon Alexa API
             url (str): The URL related to this operation
-            source_id (int): The source ID for referencing an acquired file
+            src (CIFTSource): The acquired file (source) of this data
             data (str): JSON data
 
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): OP({})".format(GET_MY_NAME(), op.name))
+        self.prglog_mgr.info("OP(%s)", op.name)
         # --------------------------------------------
         # Insert a record into 'SKILL' table
         #
@@ -1653,7 +1710,8 @@ class AmazonAlexaParser:
                 d, t = PtUtils.convert_unix_millisecond_to_str(int(release_date) * 1000)
                 release_date = "{} {}".format(d, t)
 
-                Skill.create(
+                self.db_mgr.insert(
+                    Skill,
                     title=skill.get("title"),
                     developer_name=skill.get("developerInfo").get("name"),
                     account_linked='True' if skill.get('entitlementInfo').get("accountLinked") is True else 'False',
@@ -1662,27 +1720,27 @@ class AmazonAlexaParser:
                     desc=skill.get("productDetails").get("description"),
                     vendor_id=skill.get("productDetails").get("vendorId"),
                     skill_id=skill.get("productMetadata").get("skillId"),
-                    source=source_id
+                    source=src.id
                 )
         #
         # End of this segment
         # --------------------------------------------
         return True
 
-    def process_api_namedlists(self, op, api, url, source_id, data):
+    def process_api_namedlists(self, op, api, url, src, data):
         """Process the cloud native data acquired by APIs or saved within companion devices
 
         Args:
             op (CIFTOperation): The current operation
             api (CIFTAmazonAlexaAPI): The current Amazon Alexa API
             url (str): The URL related to this operation
-            source_id (int): The source ID for referencing an acquired file
+            src (CIFTSource): The acquired file (source) of this data
             data (str): JSON data
 
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): OP({})".format(GET_MY_NAME(), op.name))
+        self.prglog_mgr.info("OP(%s)", op.name)
 
         # Discriminate the API type (main or sub)
         items = False
@@ -1695,15 +1753,11 @@ class AmazonAlexaParser:
         # --------------------------------------------
         # Insert a record into 'TIMELINE' table
         #
-        query = AcquiredFile.select().where(AcquiredFile.id == source_id)
-        if len(query) == 0:
-            return False
-
         source = op.name
-        source_type = query[0].desc
-        filename = query[0].saved_path
-        timezone = PtUtils.get_timezone()
-        _format = "Chromium Simple Cache + JSON" if op == CIFTOperation.COMPANION_APP_ANDROID else "JSON"
+        source_type = src.desc
+        filename = src.saved_path
+        timezone = src.timezone
+        _format = src.format
 
         if items is False:
             # https://alexa.amazon.com/api/namedLists => Named lists
@@ -1745,8 +1799,9 @@ class AmazonAlexaParser:
                         macb = "...B"
                         _type = "Created"
 
-                    Timeline.create(
-                        date=b_dt[0], time=b_dt[1], timezone=timezone,
+                    self.db_mgr.insert(
+                        Timeline,
+                        date=b_dt[0], time=b_dt[1], epoch=b, timezone=timezone,
                         MACB=macb, source=source, sourcetype=source_type, type=_type,
                         user=user,  # host="",
                         short=short if short != "" else "-",
@@ -1762,8 +1817,9 @@ class AmazonAlexaParser:
                     macb = "M..."
                     _type = "Updated"
 
-                    Timeline.create(
-                        date=m_dt[0], time=m_dt[1], timezone=timezone,
+                    self.db_mgr.insert(
+                        Timeline,
+                        date=m_dt[0], time=m_dt[1], epoch=m, timezone=timezone,
                         MACB=macb, source=source, sourcetype=source_type, type=_type,
                         user=user,  # host="",
                         short=short if short != "" else "-",
@@ -1806,8 +1862,9 @@ class AmazonAlexaParser:
                         macb = "...B"
                         _type = "Created"
 
-                    Timeline.create(
-                        date=b_dt[0], time=b_dt[1], timezone=timezone,
+                    self.db_mgr.insert(
+                        Timeline,
+                        date=b_dt[0], time=b_dt[1], epoch=b, timezone=timezone,
                         MACB=macb, source=source, sourcetype=source_type, type=_type,
                         user=user,  # host="",
                         short=short if short != "" else "-",
@@ -1823,8 +1880,9 @@ class AmazonAlexaParser:
                     macb = "M..."
                     _type = "Updated"
 
-                    Timeline.create(
-                        date=m_dt[0], time=m_dt[1], timezone=timezone,
+                    self.db_mgr.insert(
+                        Timeline,
+                        date=m_dt[0], time=m_dt[1], epoch=m, timezone=timezone,
                         MACB=macb, source=source, sourcetype=source_type, type=_type,
                         user=user,  # host="",
                         short=short if short != "" else "-",
@@ -1838,20 +1896,20 @@ class AmazonAlexaParser:
         # --------------------------------------------
         return True
 
-    def process_api_conversations(self, op, api, url, source_id, data):
+    def process_api_conversations(self, op, api, url, src, data):
         """Process the cloud native data acquired by APIs or saved within companion devices
 
         Args:
             op (CIFTOperation): The current operation
             api (CIFTAmazonAlexaAPI): The current Amazon Alexa API
             url (str): The URL related to this operation
-            source_id (int): The source ID for referencing an acquired file
+            src (CIFTSource): The acquired file (source) of this data
             data (str): JSON data
 
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): OP({})".format(GET_MY_NAME(), op.name))
+        self.prglog_mgr.info("OP(%s)", op.name)
 
         # Discriminate the API type (main or sub)
         messages = False
@@ -1861,15 +1919,11 @@ class AmazonAlexaParser:
         # --------------------------------------------
         # Insert a record into 'TIMELINE' table
         #
-        query = AcquiredFile.select().where(AcquiredFile.id == source_id)
-        if len(query) == 0:
-            return False
-
         source = op.name
-        source_type = query[0].desc
-        filename = query[0].saved_path
-        timezone = PtUtils.get_timezone()
-        _format = "Chromium Simple Cache + JSON" if op == CIFTOperation.COMPANION_APP_ANDROID else "JSON"
+        source_type = src.desc
+        filename = src.saved_path
+        timezone = src.timezone
+        _format = src.format
 
         if messages is False:
             # https://alexa-comms-mobile-service.amazon.com/users/{commsId}/conversations
@@ -1885,8 +1939,10 @@ class AmazonAlexaParser:
                     entry.get('lastMessageId'), entry.get('lastSequenceId')
                 )
 
-                Timeline.create(
+                self.db_mgr.insert(
+                    Timeline,
                     date=dt[0], time=dt[1], timezone=timezone,
+                    epoch=PtUtils.convert_iso8602_to_unix_millisecond(entry.get('lastModified')),
                     MACB=macb, source=source, sourcetype=source_type, type=_type,
                     short=short if short != "" else "-",
                     desc=desc if desc != "" else "-",
@@ -1921,8 +1977,10 @@ class AmazonAlexaParser:
                             URL_PREFIX_ALEXA_CONVERSATION_AUDIO.format(entry.get("payload").get("mediaId"))
                         )
 
-                Timeline.create(
+                self.db_mgr.insert(
+                    Timeline,
                     date=dt[0], time=dt[1], timezone=timezone,
+                    epoch=PtUtils.convert_iso8602_to_unix_millisecond(entry.get('time')),
                     MACB=macb, source=source, sourcetype=source_type, type=_type,
                     short=short if short != "" else "-",
                     desc=desc if desc != "" else "-",
@@ -1935,20 +1993,20 @@ class AmazonAlexaParser:
         # --------------------------------------------
         return True
 
-    def process_api_template(self, op, api, url, source_id, data):
+    def process_api_template(self, op, api, url, src, data):
         """Process the cloud native data acquired by APIs or saved within companion devices
 
         Args:
             op (CIFTOperation): The current operation
             api (CIFTAmazonAlexaAPI): The current Amazon Alexa API
             url (str): The URL related to this operation
-            source_id (int): The source ID for referencing an acquired file
+            src (CIFTSource): The acquired file (source) of this data
             data (str): JSON data
 
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): OP({})".format(GET_MY_NAME(), op.name))
+        self.prglog_mgr.info("OP(%s)", op.name)
 
     def process_client_file(self, op, cf, value, filemode=True, base_path=""):
         """Process client files (SQLite DB, XML, binarycookies...) managed by companion applications
@@ -1963,7 +2021,7 @@ class AmazonAlexaParser:
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): OP({}) FILE({})".format(GET_MY_NAME(), op.name, cf.name))
+        self.prglog_mgr.info("OP(%s) FILE(%s)", op.name, cf.name)
 
         # Read data to buffer (if necessary)
         if filemode is False:
@@ -1971,7 +2029,7 @@ class AmazonAlexaParser:
         else:
             path = value
             if not os.path.exists(path):
-                self.prglog_mgr.debug("{}(): The path does not exist ({})".format(GET_MY_NAME(), path))
+                self.prglog_mgr.debug("The path does not exist (%s)", path)
                 return False
             data = open(path, 'rb').read()
 
@@ -1998,23 +2056,20 @@ class AmazonAlexaParser:
         # name = PtUtils.get_valid_filename(cf.path)
         # path = "{}/{}".format(base_path, name)
 
-        self.prglog_mgr.info("{}(): Saved path is {}".format(GET_MY_NAME(), path))
+        self.prglog_mgr.info("Saved path is %s", path)
         PtUtils.save_bytes_to_file(path, data)
 
         # --------------------------------------------
         # Insert a record into 'ACQUIRED_DATA' table
         #
-        query = Operation.select().where(Operation.type == op.name)
-
-        if len(query) == 1:
-            operation_id = query[0].id
+        operation_id = self.db_mgr.get_operation_id(op)
 
         d, t = PtUtils.get_file_created_date_and_time(path)
         saved_timestamp = "{} {}".format(d, t)
         # d, t = PtUtils.get_file_modified_date_and_time(path)
         # modified_timestamp = "{} {}".format(d, t)
 
-        AcquiredFile.create(
+        source_id = self.db_mgr.add_acquired_file(
             operation_id=operation_id,
             src_path=cf.path,
             desc=cf.desc,
@@ -2025,7 +2080,9 @@ class AmazonAlexaParser:
             timezone=PtUtils.get_timezone()
         )
 
-        source_id = AcquiredFile.select().order_by(AcquiredFile.id.desc()).get()
+        # The source context for handlers (no need to read the record again)
+        _format = CIFTSource.FILE_FORMATS.get(cf.sig, "-")
+        src = CIFTSource(source_id, op, cf.path, cf.desc, path, PtUtils.get_timezone(), _format)
         #
         # End of this segment
         # --------------------------------------------
@@ -2039,49 +2096,49 @@ class AmazonAlexaParser:
 
         # ---------------------------------------------------------
         if cf == CIFTAmazonAlexaClientFile.ANDROID_DATASTORE:
-            return self.process_client_file_android_datastore(op, cf, source_id, path)
+            return self.process_client_file_android_datastore(op, cf, src, path)
 
         # ---------------------------------------------------------
         if cf == CIFTAmazonAlexaClientFile.ANDROID_MAP_DATA_STORAGE or \
            cf == CIFTAmazonAlexaClientFile.ANDROID_MAP_DATA_STORAGE_V2:
-            return self.process_client_file_android_map_data_storage(op, cf, source_id, path)
+            return self.process_client_file_android_map_data_storage(op, cf, src, path)
 
         # ---------------------------------------------------------
         if cf == CIFTAmazonAlexaClientFile.ANDROID_COOKIES:
-            return self.process_client_file_android_cookies(op, cf, source_id, path)
+            return self.process_client_file_android_cookies(op, cf, src, path)
 
         # ---------------------------------------------------------
         if cf == CIFTAmazonAlexaClientFile.ANDROID_EVENTSFILE:
-            return self.process_client_file_android_eventsfile(op, cf, source_id, path)
+            return self.process_client_file_android_eventsfile(op, cf, src, path)
 
         # ---------------------------------------------------------
         if cf == CIFTAmazonAlexaClientFile.IOS_LOCALDATA:
-            return self.process_client_file_ios_localdata(op, cf, source_id, path)
+            return self.process_client_file_ios_localdata(op, cf, src, path)
 
         # ---------------------------------------------------------
         if cf == CIFTAmazonAlexaClientFile.IOS_COMMS:
-            return self.process_client_file_ios_comms(op, cf, source_id, path)
+            return self.process_client_file_ios_comms(op, cf, src, path)
 
         # ---------------------------------------------------------
         if cf == CIFTAmazonAlexaClientFile.IOS_COOKIES:
-            return self.process_client_file_ios_cookies(op, cf, source_id, path)
+            return self.process_client_file_ios_cookies(op, cf, src, path)
 
         return True
 
-    def process_client_file_android_datastore(self, op, cf, source_id, value, filemode=True):
+    def process_client_file_android_datastore(self, op, cf, src, value, filemode=True):
         """Process Android Alexa app's DataStore.db
 
         Args:
             op (CIFTOperation): The current operation
             cf (CIFTAmazonAlexaClientFile): The current Amazon Alexa app related file
-            source_id (int): The source ID for referencing an acquired file
+            src (CIFTSource): The acquired file (source) of this data
             value (str): SQLite data itself or the path of a SQLite file
             filemode (bool): If True, 'value' is the file path
 
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): OP({}) FILE({})".format(GET_MY_NAME(), op.name, cf.name))
+        self.prglog_mgr.info("OP(%s) FILE(%s)", op.name, cf.name)
 
         # Read data to buffer (if necessary)
         if filemode is True:
@@ -2095,19 +2152,15 @@ class AmazonAlexaParser:
             db = SqliteDatabase(path)
             tables = db.get_tables()
         except:
-            self.prglog_mgr.debug("{}(): Invalid SQLite".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("Invalid SQLite")
             return False
 
         # Set common values
-        query = AcquiredFile.select().where(AcquiredFile.id == source_id)
-        if len(query) == 0:
-            return False
-
         source = op.name
-        source_type = query[0].desc
-        filename = query[0].saved_path
-        timezone = PtUtils.get_timezone()
-        _format = "SQLite DB"
+        source_type = src.desc
+        filename = src.saved_path
+        timezone = src.timezone
+        _format = src.format
 
         # =======================================================================
         # Type 1 (old) ----------------------------------------------------------
@@ -2126,7 +2179,7 @@ class AmazonAlexaParser:
                 try:
                     data = json.loads(value)
                 except ValueError:
-                    self.prglog_mgr.debug("{}(): Invalid JSON format".format(GET_MY_NAME()))
+                    self.prglog_mgr.debug("Invalid JSON format")
                     continue
 
                 # --------------------------------------------
@@ -2136,7 +2189,7 @@ class AmazonAlexaParser:
                     if data.get('createdDate') is not None:
                         data = [data]
                     else:
-                        self.prglog_mgr.debug("{}(): Invalid '{}'".format(GET_MY_NAME(), key))
+                        self.prglog_mgr.debug("Invalid '%s'", key)
                         return False
 
                 for value in data:
@@ -2178,8 +2231,9 @@ class AmazonAlexaParser:
                             macb = "...B"
                             _type = "Created"
 
-                        Timeline.create(
-                            date=b_dt[0], time=b_dt[1], timezone=timezone,
+                        self.db_mgr.insert(
+                            Timeline,
+                            date=b_dt[0], time=b_dt[1], epoch=b, timezone=timezone,
                             MACB=macb, source=source, sourcetype=source_type, type=_type,
                             user=value.get('customerId'),  # host="",
                             short=short if short != "" else "-",
@@ -2200,8 +2254,9 @@ class AmazonAlexaParser:
                             macb = "M..."
                             _type = "Last Updated"
 
-                        Timeline.create(
-                            date=m_dt[0], time=m_dt[1], timezone=timezone,
+                        self.db_mgr.insert(
+                            Timeline,
+                            date=m_dt[0], time=m_dt[1], epoch=m, timezone=timezone,
                             MACB=macb, source=source, sourcetype=source_type, type=_type,
                             user=value.get('customerId'),  # host="",
                             short=short if short != "" else "-",
@@ -2218,8 +2273,9 @@ class AmazonAlexaParser:
                         macb = "..C."
                         _type = "Last Local Updated"
 
-                        Timeline.create(
-                            date=c_dt[0], time=c_dt[1], timezone=timezone,
+                        self.db_mgr.insert(
+                            Timeline,
+                            date=c_dt[0], time=c_dt[1], epoch=c, timezone=timezone,
                             MACB=macb, source=source, sourcetype=source_type, type=_type,
                             user=value.get('customerId'),  # host="",
                             short=short if short != "" else "-",
@@ -2254,7 +2310,7 @@ class AmazonAlexaParser:
             try:
                 data = json.loads(value)
             except ValueError:
-                self.prglog_mgr.debug("{}(): Invalid JSON format".format(GET_MY_NAME()))
+                self.prglog_mgr.debug("Invalid JSON format")
                 continue
 
             # --------------------------------------------
@@ -2298,8 +2354,9 @@ class AmazonAlexaParser:
                         macb = "...B"
                         _type = "Created"
 
-                    Timeline.create(
-                        date=b_dt[0], time=b_dt[1], timezone=timezone,
+                    self.db_mgr.insert(
+                        Timeline,
+                        date=b_dt[0], time=b_dt[1], epoch=b, timezone=timezone,
                         MACB=macb, source=source, sourcetype=source_type, type=_type,
                         user=user,  # host="",
                         short=short if short != "" else "-",
@@ -2315,8 +2372,9 @@ class AmazonAlexaParser:
                     macb = "M..."
                     _type = "Updated"
 
-                    Timeline.create(
-                        date=m_dt[0], time=m_dt[1], timezone=timezone,
+                    self.db_mgr.insert(
+                        Timeline,
+                        date=m_dt[0], time=m_dt[1], epoch=m, timezone=timezone,
                         MACB=macb, source=source, sourcetype=source_type, type=_type,
                         user=user,  # host="",
                         short=short if short != "" else "-",
@@ -2347,7 +2405,7 @@ class AmazonAlexaParser:
             try:
                 data = json.loads(value)
             except ValueError:
-                self.prglog_mgr.debug("{}(): Invalid JSON format".format(GET_MY_NAME()))
+                self.prglog_mgr.debug("Invalid JSON format")
                 continue
 
             list_name = ""
@@ -2393,8 +2451,9 @@ class AmazonAlexaParser:
                         macb = "...B"
                         _type = "Created"
 
-                    Timeline.create(
-                        date=b_dt[0], time=b_dt[1], timezone=timezone,
+                    self.db_mgr.insert(
+                        Timeline,
+                        date=b_dt[0], time=b_dt[1], epoch=b, timezone=timezone,
                         MACB=macb, source=source, sourcetype=source_type, type=_type,
                         user=user,  # host="",
                         short=short if short != "" else "-",
@@ -2410,8 +2469,9 @@ class AmazonAlexaParser:
                     macb = "M..."
                     _type = "Updated"
 
-                    Timeline.create(
-                        date=m_dt[0], time=m_dt[1], timezone=timezone,
+                    self.db_mgr.insert(
+                        Timeline,
+                        date=m_dt[0], time=m_dt[1], epoch=m, timezone=timezone,
                         MACB=macb, source=source, sourcetype=source_type, type=_type,
                         user=user,  # host="",
                         short=short if short != "" else "-",
@@ -2427,20 +2487,20 @@ class AmazonAlexaParser:
 
         return True
 
-    def process_client_file_android_map_data_storage(self, op, cf, source_id, value, filemode=True):
+    def process_client_file_android_map_data_storage(self, op, cf, src, value, filemode=True):
         """Process Android Alexa app's map_data_storage.db
 
         Args:
             op (CIFTOperation): The current operation
             cf (CIFTAmazonAlexaClientFile): The current Amazon Alexa app related file
-            source_id (int): The source ID for referencing an acquired file
+            src (CIFTSource): The acquired file (source) of this data
             value (str): SQLite data itself or the path of a SQLite file
             filemode (bool): If True, 'value' is the file path
 
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): OP({}) FILE({})".format(GET_MY_NAME(), op.name, cf.name))
+        self.prglog_mgr.info("OP(%s) FILE(%s)", op.name, cf.name)
 
         # Read data to buffer (if necessary)
         if filemode is True:
@@ -2454,19 +2514,15 @@ class AmazonAlexaParser:
             db = SqliteDatabase(path)
             tables = db.get_tables()
         except:
-            self.prglog_mgr.debug("{}(): Invalid SQLite".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("Invalid SQLite")
             return False
 
         # Set common values
-        query = AcquiredFile.select().where(AcquiredFile.id == source_id)
-        if len(query) == 0:
-            return False
-
         source = op.name
-        source_type = query[0].desc
-        filename = query[0].saved_path
-        timezone = PtUtils.get_timezone()
-        _format = "SQLite DB"
+        source_type = src.desc
+        filename = src.saved_path
+        timezone = src.timezone
+        _format = src.format
 
         # Type 1 (old) ----------------------------------------------------------------------
         if cf == CIFTAmazonAlexaClientFile.ANDROID_MAP_DATA_STORAGE:
@@ -2503,8 +2559,9 @@ class AmazonAlexaParser:
                 notes = notes.replace("\n", " ")
                 extra = extra.replace("\n", " ")
 
-                Timeline.create(
-                    date=m_dt[0], time=m_dt[1], timezone=timezone,
+                self.db_mgr.insert(
+                    Timeline,
+                    date=m_dt[0], time=m_dt[1], epoch=record.get('account_timestamp'), timezone=timezone,
                     MACB=macb, source=source, sourcetype=source_type, type=_type,
                     # user="", host="",
                     short=short if short != "" else "-",
@@ -2547,8 +2604,9 @@ class AmazonAlexaParser:
                 notes = notes.replace("\n", " ")
                 extra = extra.replace("\n", " ")
 
-                Timeline.create(
-                    date=m_dt[0], time=m_dt[1], timezone=timezone,
+                self.db_mgr.insert(
+                    Timeline,
+                    date=m_dt[0], time=m_dt[1], epoch=record.get('device_data_timestamp'), timezone=timezone,
                     MACB=macb, source=source, sourcetype=source_type, type=_type,
                     # user="", host="",
                     short=short if short != "" else "-",
@@ -2591,8 +2649,9 @@ class AmazonAlexaParser:
                 notes = notes.replace("\n", " ")
                 extra = extra.replace("\n", " ")
 
-                Timeline.create(
-                    date=m_dt[0], time=m_dt[1], timezone=timezone,
+                self.db_mgr.insert(
+                    Timeline,
+                    date=m_dt[0], time=m_dt[1], epoch=record.get('token_timestamp'), timezone=timezone,
                     MACB=macb, source=source, sourcetype=source_type, type=_type,
                     short=short if short != "" else "-",
                     desc=desc if desc != "" else "-",
@@ -2634,8 +2693,9 @@ class AmazonAlexaParser:
                 notes = notes.replace("\n", " ")
                 extra = extra.replace("\n", " ")
 
-                Timeline.create(
-                    date=m_dt[0], time=m_dt[1], timezone=timezone,
+                self.db_mgr.insert(
+                    Timeline,
+                    date=m_dt[0], time=m_dt[1], epoch=record.get('userdata_timestamp'), timezone=timezone,
                     MACB=macb, source=source, sourcetype=source_type, type=_type,
                     short=short if short != "" else "-",
                     desc=desc if desc != "" else "-",
@@ -2651,20 +2711,20 @@ class AmazonAlexaParser:
             # Data decryption is required
             return True
 
-    def process_client_file_android_cookies(self, op, cf, source_id, value, filemode=True):
+    def process_client_file_android_cookies(self, op, cf, src, value, filemode=True):
         """Process Android Alexa app's Cookies
 
         Args:
             op (CIFTOperation): The current operation
             cf (CIFTAmazonAlexaClientFile): The current Amazon Alexa app related file
-            source_id (int): The source ID for referencing an acquired file
+            src (CIFTSource): The acquired file (source) of this data
             value (str): SQLite data itself or the path of a SQLite file
             filemode (bool): If True, 'value' is the file path
 
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): OP({}) FILE({})".format(GET_MY_NAME(), op.name, cf.name))
+        self.prglog_mgr.info("OP(%s) FILE(%s)", op.name, cf.name)
 
         # Read data to buffer (if necessary)
         if filemode is True:
@@ -2678,12 +2738,7 @@ class AmazonAlexaParser:
             db = SqliteDatabase(path)
             tables = db.get_tables()
         except:
-            self.prglog_mgr.debug("{}(): Invalid SQLite".format(GET_MY_NAME()))
-            return False
-
-        # Set common values
-        query = AcquiredFile.select().where(AcquiredFile.id == source_id)
-        if len(query) == 0:
+            self.prglog_mgr.debug("Invalid SQLite")
             return False
 
         # ----------------------------------------------------------------------
@@ -2703,29 +2758,30 @@ class AmazonAlexaParser:
             value += "\"{}\": \"{}\",\n".format(row.get('name'), row.get('value'))
 
         if value != "":
-            Credential.create(
+            self.db_mgr.insert(
+                Credential,
                 type="Android Cookie",
                 domain=".amazon.*",
                 value=value[:-2],
-                source_id=source_id
+                source_id=src.id
             )
 
         return True
 
-    def process_client_file_android_eventsfile(self, op, cf, source_id, value, filemode=True):
+    def process_client_file_android_eventsfile(self, op, cf, src, value, filemode=True):
         """Process Android Alexa app's eventsFile
 
         Args:
             op (CIFTOperation): The current operation
             cf (CIFTAmazonAlexaClientFile): The current Amazon Alexa app related file
-            source_id (int): The source ID for referencing an acquired file
+            src (CIFTSource): The acquired file (source) of this data
             value (str): Event data itself or the path of an event file
             filemode (bool): If True, 'value' is the file path
 
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): OP({}) FILE({})".format(GET_MY_NAME(), op.name, cf.name))
+        self.prglog_mgr.info("OP(%s) FILE(%s)", op.name, cf.name)
 
         # Read data to buffer (if necessary)
         if filemode is True:
@@ -2737,15 +2793,11 @@ class AmazonAlexaParser:
         # --------------------------------------------
         # Insert a record into 'TIMELINE' table
         #
-        query = AcquiredFile.select().where(AcquiredFile.id == source_id)
-        if len(query) == 0:
-            return False
-
         source = op.name
-        source_type = query[0].desc
-        filename = query[0].saved_path
-        timezone = PtUtils.get_timezone()
-        _format = "JSON"
+        source_type = src.desc
+        filename = src.saved_path
+        timezone = src.timezone
+        _format = src.format
         macb = "...B"
         _type = "Created"
 
@@ -2755,7 +2807,7 @@ class AmazonAlexaParser:
                 try:
                     data = json.loads(line)
                 except ValueError:
-                    self.prglog_mgr.debug("{}(): Invalid JSON format".format(GET_MY_NAME()))
+                    self.prglog_mgr.debug("Invalid JSON format")
                     continue
 
                 # Get 'date and time'
@@ -2776,8 +2828,9 @@ class AmazonAlexaParser:
                 if notes == "": notes = "-"
                 if extra == "": extra = "-"
 
-                Timeline.create(
-                    date=b_dt[0], time=b_dt[1], timezone=timezone,
+                self.db_mgr.insert(
+                    Timeline,
+                    date=b_dt[0], time=b_dt[1], epoch=data.get('timestamp'), timezone=timezone,
                     MACB=macb, source=source, sourcetype=source_type, type=_type,
                     short=short if short != "" else "-",
                     desc=desc if desc != "" else "-",
@@ -2788,20 +2841,20 @@ class AmazonAlexaParser:
 
         return True
 
-    def process_client_file_ios_localdata(self, op, cf, source_id, value, filemode=True):
+    def process_client_file_ios_localdata(self, op, cf, src, value, filemode=True):
         """Process iOS Alexa app's LocalData.db
 
         Args:
             op (CIFTOperation): The current operation
             cf (CIFTAmazonAlexaClientFile): The current Amazon Alexa app related file
-            source_id (int): The source ID for referencing an acquired file
+            src (CIFTSource): The acquired file (source) of this data
             value (str): SQLite data itself or the path of a SQLite file
             filemode (bool): If True, 'value' is the file path
 
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): OP({}) FILE({})".format(GET_MY_NAME(), op.name, cf.name))
+        self.prglog_mgr.info("OP(%s) FILE(%s)", op.name, cf.name)
 
         # Read data to buffer (if necessary)
         if filemode is True:
@@ -2815,19 +2868,15 @@ class AmazonAlexaParser:
             db = SqliteDatabase(path)
             tables = db.get_tables()
         except:
-            self.prglog_mgr.debug("{}(): Invalid SQLite".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("Invalid SQLite")
             return False
 
         # Set common values
-        query = AcquiredFile.select().where(AcquiredFile.id == source_id)
-        if len(query) == 0:
-            return False
-
         source = op.name
-        source_type = query[0].desc
-        filename = query[0].saved_path
-        timezone = PtUtils.get_timezone()
-        _format = "SQLite DB"
+        source_type = src.desc
+        filename = src.saved_path
+        timezone = src.timezone
+        _format = src.format
 
         # =======================================================================
         # Type 1 (old) ----------------------------------------------------------
@@ -2845,7 +2894,7 @@ class AmazonAlexaParser:
             try:
                 data = json.loads(value)
             except ValueError:
-                self.prglog_mgr.debug("{}(): Invalid JSON format".format(GET_MY_NAME()))
+                self.prglog_mgr.debug("Invalid JSON format")
                 continue
 
             # --------------------------------------------
@@ -2855,7 +2904,7 @@ class AmazonAlexaParser:
                 if data.get('createdDate') is not None:
                     data = [data]
                 else:
-                    self.prglog_mgr.debug("{}(): Invalid '{}'".format(GET_MY_NAME(), key))
+                    self.prglog_mgr.debug("Invalid '%s'", key)
                     return False
 
             for value in data:
@@ -2897,8 +2946,9 @@ class AmazonAlexaParser:
                         macb = "...B"
                         _type = "Created"
 
-                    Timeline.create(
-                        date=b_dt[0], time=b_dt[1], timezone=timezone,
+                    self.db_mgr.insert(
+                        Timeline,
+                        date=b_dt[0], time=b_dt[1], epoch=b, timezone=timezone,
                         MACB=macb, source=source, sourcetype=source_type, type=_type,
                         user=value.get('customerId'),  # host="",
                         short=short if short != "" else "-",
@@ -2919,8 +2969,9 @@ class AmazonAlexaParser:
                         macb = "M..."
                         _type = "Last Updated"
 
-                    Timeline.create(
-                        date=m_dt[0], time=m_dt[1], timezone=timezone,
+                    self.db_mgr.insert(
+                        Timeline,
+                        date=m_dt[0], time=m_dt[1], epoch=m, timezone=timezone,
                         MACB=macb, source=source, sourcetype=source_type, type=_type,
                         user=value.get('customerId'),  # host="",
                         short=short if short != "" else "-",
@@ -2937,8 +2988,9 @@ class AmazonAlexaParser:
                     macb = "..C."
                     _type = "Last Local Updated"
 
-                    Timeline.create(
-                        date=c_dt[0], time=c_dt[1], timezone=timezone,
+                    self.db_mgr.insert(
+                        Timeline,
+                        date=c_dt[0], time=c_dt[1], epoch=c, timezone=timezone,
                         MACB=macb, source=source, sourcetype=source_type, type=_type,
                         user=value.get('customerId'),  # host="",
                         short=short if short != "" else "-",
@@ -2973,7 +3025,7 @@ class AmazonAlexaParser:
             try:
                 data = json.loads(value)
             except ValueError:
-                self.prglog_mgr.debug("{}(): Invalid JSON format".format(GET_MY_NAME()))
+                self.prglog_mgr.debug("Invalid JSON format")
                 continue
 
             # --------------------------------------------
@@ -3017,8 +3069,9 @@ class AmazonAlexaParser:
                         macb = "...B"
                         _type = "Created"
 
-                    Timeline.create(
-                        date=b_dt[0], time=b_dt[1], timezone=timezone,
+                    self.db_mgr.insert(
+                        Timeline,
+                        date=b_dt[0], time=b_dt[1], epoch=b, timezone=timezone,
                         MACB=macb, source=source, sourcetype=source_type, type=_type,
                         user=user,  # host="",
                         short=short if short != "" else "-",
@@ -3034,8 +3087,9 @@ class AmazonAlexaParser:
                     macb = "M..."
                     _type = "Updated"
 
-                    Timeline.create(
-                        date=m_dt[0], time=m_dt[1], timezone=timezone,
+                    self.db_mgr.insert(
+                        Timeline,
+                        date=m_dt[0], time=m_dt[1], epoch=m, timezone=timezone,
                         MACB=macb, source=source, sourcetype=source_type, type=_type,
                         user=user,  # host="",
                         short=short if short != "" else "-",
@@ -3066,7 +3120,7 @@ class AmazonAlexaParser:
             try:
                 data = json.loads(value)
             except ValueError:
-                self.prglog_mgr.debug("{}(): Invalid JSON format".format(GET_MY_NAME()))
+                self.prglog_mgr.debug("Invalid JSON format")
                 continue
 
             list_name = ""
@@ -3112,8 +3166,9 @@ class AmazonAlexaParser:
                         macb = "...B"
                         _type = "Created"
 
-                    Timeline.create(
-                        date=b_dt[0], time=b_dt[1], timezone=timezone,
+                    self.db_mgr.insert(
+                        Timeline,
+                        date=b_dt[0], time=b_dt[1], epoch=b, timezone=timezone,
                         MACB=macb, source=source, sourcetype=source_type, type=_type,
                         user=user,  # host="",
                         short=short if short != "" else "-",
@@ -3129,8 +3184,9 @@ class AmazonAlexaParser:
                     macb = "M..."
                     _type = "Updated"
 
-                    Timeline.create(
-                        date=m_dt[0], time=m_dt[1], timezone=timezone,
+                    self.db_mgr.insert(
+                        Timeline,
+                        date=m_dt[0], time=m_dt[1], epoch=m, timezone=timezone,
                         MACB=macb, source=source, sourcetype=source_type, type=_type,
                         user=user,  # host="",
                         short=short if short != "" else "-",
@@ -3146,20 +3202,20 @@ class AmazonAlexaParser:
 
         return True
 
-    def process_client_file_ios_comms(self, op, cf, source_id, value, filemode=True):
+    def process_client_file_ios_comms(self, op, cf, src, value, filemode=True):
         """Process iOS Alexa app's AlexaMobileiOSComms.sqlite
 
         Args:
             op (CIFTOperation): The current operation
             cf (CIFTAmazonAlexaClientFile): The current Amazon Alexa app related file
-            source_id (int): The source ID for referencing an acquired file
+            src (CIFTSource): The acquired file (source) of this data
             value (str): SQLite data itself or the path of a SQLite file
             filemode (bool): If True, 'value' is the file path
 
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): OP({}) FILE({})".format(GET_MY_NAME(), op.name, cf.name))
+        self.prglog_mgr.info("OP(%s) FILE(%s)", op.name, cf.name)
 
         # Read data to buffer (if necessary)
         if filemode is True:
@@ -3173,19 +3229,15 @@ class AmazonAlexaParser:
             db = SqliteDatabase(path)
             tables = db.get_tables()
         except:
-            self.prglog_mgr.debug("{}(): Invalid SQLite".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("Invalid SQLite")
             return False
 
         # Set common values
-        query = AcquiredFile.select().where(AcquiredFile.id == source_id)
-        if len(query) == 0:
-            return False
-
         source = op.name
-        source_type = query[0].desc
-        filename = query[0].saved_path
-        timezone = PtUtils.get_timezone()
-        _format = "SQLite DB"
+        source_type = src.desc
+        filename = src.saved_path
+        timezone = src.timezone
+        _format = src.format
         macb = "...B"
         _type = "Created"
 
@@ -3213,8 +3265,10 @@ class AmazonAlexaParser:
 
             extra = extra.replace("\n", " ")
 
-            Timeline.create(
+            self.db_mgr.insert(
+                Timeline,
                 date=b_dt[0], time=b_dt[1], timezone=timezone,
+                epoch=PtUtils.convert_iso8602_to_unix_millisecond(row.get('ZMESSAGETIME')),
                 MACB=macb, source=source, sourcetype=source_type, type=_type,
                 short=short if short != "" else "-",
                 desc=desc if desc != "" else "-",
@@ -3225,20 +3279,20 @@ class AmazonAlexaParser:
 
         return True
 
-    def process_client_file_ios_cookies(self, op, cf, source_id, value, filemode=True):
+    def process_client_file_ios_cookies(self, op, cf, src, value, filemode=True):
         """Process iOS Alexa app's Cookies.binarycookies
 
         Args:
             op (CIFTOperation): The current operation
             cf (CIFTAmazonAlexaClientFile): The current Amazon Alexa app related file
-            source_id (int): The source ID for referencing an acquired file
+            src (CIFTSource): The acquired file (source) of this data
             value (str): Binarycookie data itself or the path of a Binarycookie file
             filemode (bool): If True, 'value' is the file path
 
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): OP({}) FILE({})".format(GET_MY_NAME(), op.name, cf.name))
+        self.prglog_mgr.info("OP(%s) FILE(%s)", op.name, cf.name)
 
         # Read data to buffer (if necessary)
         if filemode is True:
@@ -3256,11 +3310,12 @@ class AmazonAlexaParser:
             if not domain.startswith(".amazon."):
                 continue
 
-            Credential.create(
+            self.db_mgr.insert(
+                Credential,
                 type="iOS Cookie",
                 domain=domain,
                 value=value,
-                source_id=source_id
+                source_id=src.id
             )
 
         return True
@@ -3278,7 +3333,7 @@ class AmazonAlexaParser:
             db = SqliteDatabase(path)
             tables = db.get_tables()
         except:
-            self.prglog_mgr.debug("{}(): Invalid SQLite".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("Invalid SQLite")
             return False
         else:
             query = "Select * from DataItem"
@@ -3326,7 +3381,7 @@ class AmazonAlexaParser:
         try:
             cursor = db.execute_sql(query)
         except Exception as e:
-            self.prglog_mgr.debug("{}(): {}".format(GET_MY_NAME(), e))
+            self.prglog_mgr.debug("%s", e)
             return []
 
         ncols = len(cursor.description)
@@ -3345,7 +3400,7 @@ class AmazonAlexaParser:
         """Post-process
 
         """
-        self.prglog_mgr.info("{}()".format(GET_MY_NAME()))
+        self.prglog_mgr.info("")
 
         self.db_mgr.close()
         return
@@ -3389,7 +3444,7 @@ class AmazonAlexaCloud:
             self.auto = BrowserAutomation(browser_driver=browser_driver)
 
         # Progress logging manager
-        self.prglog_mgr = logging.getLogger(__name__)
+        self.prglog_mgr = GET_LOGGER(__name__)
 
     def run_with_idpw(self, user_id, user_pw):
         """Get data from the cloud after connecting to its server using ID/PW
@@ -3401,13 +3456,13 @@ class AmazonAlexaCloud:
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): Get data from the cloud".format(GET_MY_NAME()))
+        self.prglog_mgr.info("Get data from the cloud")
 
         if user_id == "" or user_pw == "":
-            self.prglog_mgr.debug("{}(): Invalid ID or PW".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("Invalid ID or PW")
             return False
         else:
-            self.prglog_mgr.info("{}(): ID({})".format(GET_MY_NAME(), user_id))
+            self.prglog_mgr.info("ID(%s)", user_id)
 
         # Set ID and PW
         self.user_id = user_id
@@ -3419,14 +3474,14 @@ class AmazonAlexaCloud:
 
             # Create a session with ID and PW
             if self.create_session() is False:
-                self.prglog_mgr.debug("{}(): Creating a session failed".format(GET_MY_NAME()))
+                self.prglog_mgr.debug("Creating a session failed")
                 return False
 
         try:
             # Call the internal APIs
             self.call_api()
         except Exception as e:
-            self.prglog_mgr.debug("{}(): Exception from call_api() - ({})".format(GET_MY_NAME(), e))
+            self.prglog_mgr.debug("Exception from call_api() - (%s)", e)
             return False
 
         return True
@@ -3445,29 +3500,29 @@ class AmazonAlexaCloud:
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): Get data from the cloud".format(GET_MY_NAME()))
+        self.prglog_mgr.info("Get data from the cloud")
 
         if cookies.get("session-id") is None:
-            self.prglog_mgr.debug("{}(): 'session-id' is required".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("'session-id' is required")
             return False
 
         if cookies.get("ubid-main") is None:
-            self.prglog_mgr.debug("{}(): 'ubid-main' is required".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("'ubid-main' is required")
             return False
 
         if cookies.get("sess-at-main") is None:
-            self.prglog_mgr.debug("{}(): 'sess-at-main' is required".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("'sess-at-main' is required")
             return False
 
         if cookies.get("at-main") is None:
-            self.prglog_mgr.debug("{}(): 'at-main' is required".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("'at-main' is required")
             return False
 
         if cookies.get("x-main") is None:
-            self.prglog_mgr.debug("{}(): 'x-main' is required for calling 'SKILLS' API".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("'x-main' is required for calling 'SKILLS' API")
             return False
 
-        self.prglog_mgr.info("{}(): Try to connect with cookies".format(GET_MY_NAME()))
+        self.prglog_mgr.info("Try to connect with cookies")
 
 
         # Set headers and cookies
@@ -3476,14 +3531,14 @@ class AmazonAlexaCloud:
 
         # Test token values of cookies
         if self.test_credential() is False:
-            self.prglog_mgr.debug("{}(): Invalid authentication tokens".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("Invalid authentication tokens")
             return False
 
         try:
             # Call the internal APIs
             self.call_api()
         except Exception as e:
-            self.prglog_mgr.debug("{}(): Exception from call_api() - ({})".format(GET_MY_NAME(), e))
+            self.prglog_mgr.debug("Exception from call_api() - (%s)", e)
             return False
 
         return True
@@ -3494,7 +3549,7 @@ class AmazonAlexaCloud:
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): Get data from the cloud".format(GET_MY_NAME()))
+        self.prglog_mgr.info("Get data from the cloud")
 
         comms_id = ""  # for calling 'CONVERSATION' API
 
@@ -3564,16 +3619,15 @@ class AmazonAlexaCloud:
                     # Read JSON format
                     data = PtUtils.read_json(data)
                     if data is None:
-                        self.prglog_mgr.debug("{}(): Invalid JSON format".format(GET_MY_NAME()))
+                        self.prglog_mgr.debug("Invalid JSON format")
                         break
 
                     # For getting more 'CARDS'
                     value = data['nextQueryTime']
                     if value == -1:
                         break
-                    self.prglog_mgr.info("{}(): \'nextQueryTime\' is {}".format(
-                        GET_MY_NAME(), PtUtils.convert_unix_millisecond_to_str(value))
-                    )
+                    if self.prglog_mgr.isEnabledFor(logging.INFO):
+                        self.prglog_mgr.info("'nextQueryTime' is %s", PtUtils.convert_unix_millisecond_to_str(value))
                     url = api.url.format(value)
                     continue
 
@@ -3583,7 +3637,7 @@ class AmazonAlexaCloud:
                     # Read JSON format
                     data = PtUtils.read_json(data)
                     if data is None:
-                        self.prglog_mgr.debug("{}(): Invalid JSON format".format(GET_MY_NAME()))
+                        self.prglog_mgr.debug("Invalid JSON format")
                         break
 
                     # For getting more 'ACTIVITIES'
@@ -3616,9 +3670,8 @@ class AmazonAlexaCloud:
                     item_idx = 0
                     if iter_value is None:
                         break
-                    self.prglog_mgr.info("{}(): \'startDate\' is {}".format(
-                        GET_MY_NAME(), PtUtils.convert_unix_millisecond_to_str(iter_value))
-                    )
+                    if self.prglog_mgr.isEnabledFor(logging.INFO):
+                        self.prglog_mgr.info("'startDate' is %s", PtUtils.convert_unix_millisecond_to_str(iter_value))
                     api = CIFTAmazonAlexaAPI.ACTIVITIES
                     url = api.url.format(iter_value)
                     continue
@@ -3630,7 +3683,7 @@ class AmazonAlexaCloud:
                     # Read JSON format
                     data = PtUtils.read_json(data)
                     if data is None:
-                        self.prglog_mgr.debug("{}(): Invalid JSON format".format(GET_MY_NAME()))
+                        self.prglog_mgr.debug("Invalid JSON format")
                         break
 
                     # For getting detailed entries of each named list
@@ -3651,7 +3704,7 @@ class AmazonAlexaCloud:
                     # Read JSON format
                     data = PtUtils.read_json(data)
                     if data is None:
-                        self.prglog_mgr.debug("{}(): Invalid JSON format".format(GET_MY_NAME()))
+                        self.prglog_mgr.debug("Invalid JSON format")
                         break
 
                     # For getting 'commsId' of this account
@@ -3666,7 +3719,7 @@ class AmazonAlexaCloud:
                     # Read JSON format
                     data = PtUtils.read_json(data)
                     if data is None:
-                        self.prglog_mgr.debug("{}(): Invalid JSON format".format(GET_MY_NAME()))
+                        self.prglog_mgr.debug("Invalid JSON format")
                         break
 
                     # For getting detailed entries of each conversation
@@ -3685,6 +3738,7 @@ class AmazonAlexaCloud:
 
         # -----------------------------------------------------------------------------
         # Traverse all alexa devices registered at the cloud service
+        self.parser.db_mgr.flush()
         query = (AlexaDevice
                  .select(AlexaDevice.device_serial_number, AlexaDevice.device_type)
                  .group_by(AlexaDevice.device_serial_number))
@@ -3737,12 +3791,15 @@ class AmazonAlexaCloud:
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): Download voice data from Amazon Alexa cloud service".format(GET_MY_NAME()))
+        self.prglog_mgr.info("Download voice data from Amazon Alexa cloud service")
+
+        # Buffered rows have to be written before querying
+        self.parser.db_mgr.flush()
 
         query = (Timeline
                  .select(Timeline.date, Timeline.time, Timeline.timezone, Timeline.desc, Timeline.extra)
                  .where(Timeline.extra.contains(URL_PREFIX_ALEXA_AUDIO_RAW))
-                 .order_by(Timeline.date.desc(), Timeline.time.desc()))
+                 .order_by(Timeline.epoch.desc()))
 
         # [To-do]
         # Downloading conversation (audio message) voice files is not supported currently,
@@ -3757,7 +3814,7 @@ class AmazonAlexaCloud:
         #          .order_by(Timeline.date.asc(), Timeline.time.asc()))
 
         if len(query) == 0:
-            self.prglog_mgr.debug("{}(): There is no Voice related URL".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("There is no Voice related URL")
             return False
 
         path = "{}/VOICE/".format(self.path_base_dir)
@@ -3783,7 +3840,7 @@ class AmazonAlexaCloud:
                 voice_id = voice_url.replace(URL_PREFIX_ALEXA_AUDIO_RAW, "")
                 items = voice_id.split(":")
                 if len(items) != 5:
-                    self.prglog_mgr.debug("{}(): Invalid Voice ID ({})".format(GET_MY_NAME(), voice_id))
+                    self.prglog_mgr.debug("Invalid Voice ID (%s)", voice_id)
                     continue
 
                 type = items[0]
@@ -3794,7 +3851,7 @@ class AmazonAlexaCloud:
                 # Get a timestamp from voice ID
                 items = date.split("/")
                 if len(items) != 7:
-                    self.prglog_mgr.debug("{}(): Invalid Voice ID ({})".format(GET_MY_NAME(), voice_id))
+                    self.prglog_mgr.debug("Invalid Voice ID (%s)", voice_id)
                     continue
 
                 created_timestamp = "{}-{}-{}T{}:{}:{}Z".format(items[1], items[2], items[3], items[4], items[6], tsec)
@@ -3821,7 +3878,7 @@ class AmazonAlexaCloud:
 
             if os.path.exists(path) is True:
                 self.prglog_mgr.info(
-                    "{}(): Already downloaded file ({}) -> Go to the next file".format(GET_MY_NAME(), name)
+                    "Already downloaded file (%s) -> Go to the next file", name
                 )
                 continue
 
@@ -3832,30 +3889,26 @@ class AmazonAlexaCloud:
                 continue
 
             if os.path.exists(path):
-                self.prglog_mgr.info("{}(): Saved path is {}".format(GET_MY_NAME(), path))
-                data = open(path, 'rb').read()
+                self.prglog_mgr.info("Saved path is %s", path)
             else:
                 continue
 
             # --------------------------------------------
             # Insert a record into 'ACQUIRED_FILE' table
             #
-            operation_id = -1
-            query = Operation.select().where(Operation.type == CIFTOperation.CLOUD.name)
-            if len(query) == 1:
-                operation_id = query[0].id
+            operation_id = self.parser.db_mgr.get_operation_id(CIFTOperation.CLOUD)
 
             d, t = PtUtils.get_file_created_date_and_time(path)
             saved_timestamp = "{} {}".format(d, t)
             # d, t = PtUtils.get_file_modified_date_and_time(path)
             # modified_timestamp = "{} {}".format(d, t)
 
-            AcquiredFile.create(
+            self.parser.db_mgr.add_acquired_file(
                 operation_id=operation_id,
                 src_path=voice_url,
                 desc="Voice Data",
                 saved_path=path,
-                sha1=PtUtils.hash_sha1(data),
+                sha1=PtUtils.hash_sha1(path, filemode=True),
                 saved_timestamp=saved_timestamp,
                 modified_timestamp="-",
                 timezone=PtUtils.get_timezone()
@@ -3869,7 +3922,7 @@ class AmazonAlexaCloud:
         Returns:
             True and False
         """
-        self.prglog_mgr.info("{}()".format(GET_MY_NAME()))
+        self.prglog_mgr.info("")
 
         url = "https://alexa.amazon.com"
         if self.auto.visit(url) is False:
@@ -3900,13 +3953,13 @@ class AmazonAlexaCloud:
         # self.prglog_mgr.info("{}(): The current page's title is '{}'".format(GET_MY_NAME(), title))
 
         if page_source.find("Your password is incorrect") > 0:
-            self.prglog_mgr.info("{}(): Login failed - Your password is incorrect".format(GET_MY_NAME()))
+            self.prglog_mgr.info("Login failed - Your password is incorrect")
             return False
 
         if title != "Amazon Alexa":  # Experimental
             # The following codes are working, but the login fails...
             self.auto.browser.save_screenshot('screenshot-captcha.png')
-            self.prglog_mgr.info("{}(): Login failed - You may handle the CAPTCHA system".format(GET_MY_NAME(), title))
+            self.prglog_mgr.info("Login failed - You may handle the CAPTCHA system")
             captcha_guess = input("Enter a CAPTCHA: ")
 
             # Try to login with ID and PW
@@ -3923,14 +3976,14 @@ class AmazonAlexaCloud:
             self.auto.browser.save_screenshot('screenshot-debug-2.png')
 
             title = self.auto.browser.title
-            self.prglog_mgr.info("{}(): The current page's title is '{}'".format(GET_MY_NAME(), title))
+            self.prglog_mgr.info("The current page's title is '%s'", title)
 
             if title != "Amazon Alexa":
-                self.prglog_mgr.info("{}(): Login failed".format(GET_MY_NAME()))
+                self.prglog_mgr.info("Login failed")
                 return False
 
         # Post-processes
-        self.prglog_mgr.info("{}(): Logged in successfully".format(GET_MY_NAME()))
+        self.prglog_mgr.info("Logged in successfully")
         self.auto.update_cookies()
         self.auto.close()
         return True
@@ -3941,7 +3994,7 @@ class AmazonAlexaCloud:
         Returns:
             True and False
         """
-        self.prglog_mgr.info("{}()".format(GET_MY_NAME()))
+        self.prglog_mgr.info("")
 
         text = self.auto.get_text(CIFTAmazonAlexaAPI.BOOTSTRAP.url)
         if text is None:
@@ -3956,9 +4009,9 @@ class AmazonAlexaCloud:
 
         """
         if self.user_id != "":
-            self.prglog_mgr.info("{}(): ID({})".format(GET_MY_NAME(), self.user_id))
+            self.prglog_mgr.info("ID(%s)", self.user_id)
         else:
-            self.prglog_mgr.info("{}()".format(GET_MY_NAME()))
+            self.prglog_mgr.info("")
 
         if self.auto is not None:
             self.auto.close()
@@ -3976,23 +4029,29 @@ class AmazonAlexaClient:
 
     Attributes:
         path_base_dir (str): The directory path for storing result files
+        options (list of CIFTOption): Set of detailed options
         parser (AmazonAlexaParser)
 
         prglog_mgr (logging): The progress log manager using the standard Python logging module
     """
 
-    def __init__(self, path_base_dir):
+    def __init__(self, path_base_dir, options=[]):
         """The constructor
+
+        Args:
+            path_base_dir (str): The directory path for storing result files
+            options (list of CIFTOption): Set of detailed options
         """
         self.parser = AmazonAlexaParser(path_base_dir, delete_db=False)
         # self.parser = AmazonAlexaParser(path_base_dir, delete_db=True)
 
         # class variables
+        self.options = options
         self.path_base_dir = "{}/{}/{}".format(path_base_dir, EVIDENCE_LIBRARY, __class__.__name__)
         PtUtils.make_dir(self.path_base_dir)
 
         # Progress logging manager
-        self.prglog_mgr = logging.getLogger(__name__)
+        self.prglog_mgr = GET_LOGGER(__name__)
 
     def run(self, op, path):
         """Search and interpret Amazon Alexa related data stored within companion devices
@@ -4005,18 +4064,18 @@ class AmazonAlexaClient:
             True or False
         """
         self.prglog_mgr.info(
-            "{}(): Process Amazon Alexa related data stored within companion clients".format(GET_MY_NAME())
+            "Process Amazon Alexa related data stored within companion clients"
         )
 
         if not isinstance(op, CIFTOperation):
-            self.prglog_mgr.debug("{}(): Invalid operation ({})".format(GET_MY_NAME(), op))
+            self.prglog_mgr.debug("Invalid operation (%s)", op)
             return False
 
         if os.path.exists(path) is False:
-            self.prglog_mgr.debug("{}(): Invalid path ({})".format(GET_MY_NAME(), path))
+            self.prglog_mgr.debug("Invalid path (%s)", path)
             return False
         else:
-            self.prglog_mgr.info("{}(): OP({}) PATH({})".format(GET_MY_NAME(), op.name, path))
+            self.prglog_mgr.info("OP(%s) PATH(%s)", op.name, path)
 
         ret = False
 
@@ -4047,7 +4106,7 @@ class AmazonAlexaClient:
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}()".format(GET_MY_NAME()))
+        self.prglog_mgr.info("")
 
         # --------------------------------
         # [Cookies]
@@ -4131,7 +4190,7 @@ class AmazonAlexaClient:
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}()".format(GET_MY_NAME()))
+        self.prglog_mgr.info("")
 
         # --------------------------------
         # [LocalData.db]
@@ -4180,10 +4239,10 @@ class AmazonAlexaClient:
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): OP({}) PATH({})".format(GET_MY_NAME(), op.name, path))
+        self.prglog_mgr.info("OP(%s) PATH(%s)", op.name, path)
 
         if not os.path.exists(path):
-            self.prglog_mgr.debug("{}(): The path does not exist ({})".format(GET_MY_NAME(), path))
+            self.prglog_mgr.debug("The path does not exist (%s)", path)
             return False
 
         # --------------------------------------------
@@ -4192,29 +4251,30 @@ class AmazonAlexaClient:
         name = PtUtils.hash_sha1(name.encode('utf-8'))
         path_dst = "{}/{}.{}".format(self.path_base_dir, name, ext)
 
-        self.prglog_mgr.info("{}(): Saved path is {}".format(GET_MY_NAME(), path_dst))
-        PtUtils.copy_file(path, path_dst)
+        # The source is read once for copying and hashing
+        path_dst, hashes, _ = PtUtils.copy_file_and_hash(path, path_dst)
+        if path_dst is None:
+            self.prglog_mgr.debug("Unable to copy the file (%s)", path)
+            return False
+
+        self.prglog_mgr.info("Saved path is %s", path_dst)
 
         # --------------------------------------------
         # Insert a record into 'ACQUIRED_DATA' table
         #
-        operation_id = -1
-        query = Operation.select().where(Operation.type == op.name)
-
-        if len(query) == 1:
-            operation_id = query[0].id
+        operation_id = self.parser.db_mgr.get_operation_id(op)
 
         d, t = PtUtils.get_file_created_date_and_time(path_dst)
         saved_timestamp = "{} {}".format(d, t)
         # d, t = PtUtils.get_file_modified_date_and_time(path_dst)
         # modified_timestamp = "{} {}".format(d, t)
 
-        AcquiredFile.create(
+        self.parser.db_mgr.add_acquired_file(
             operation_id=operation_id,
             src_path=path,
             desc=desc,
             saved_path=path_dst,
-            sha1=PtUtils.hash_sha1(path_dst, filemode=True),
+            sha1=hashes['sha1'],
             saved_timestamp=saved_timestamp,
             modified_timestamp="-",
             timezone=PtUtils.get_timezone()
@@ -4222,6 +4282,22 @@ class AmazonAlexaClient:
 
         return True
 
+    @staticmethod
+    def get_audio_extension(head):
+        """Get the extension of audio data by the magic
+
+        Args:
+            head (bytes): The leading bytes (at least 8 bytes)
+
+        Returns:
+            The extension (str)
+        """
+        if head[4:8].startswith(SIG_MP4):
+            return "m4a"
+        elif head[0:2].startswith(SIG_MP3):
+            return "mp3"
+        return "unknown-format"
+
     def acquire_cached_voice_data_android(self, op, path):
         """Acquire file(s) with user-defined conditions
 
@@ -4232,12 +4308,12 @@ class AmazonAlexaClient:
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): OP({}) PATH({})".format(GET_MY_NAME(), op.name, path))
+        self.prglog_mgr.info("OP(%s) PATH(%s)", op.name, path)
 
         base_path = path
 
         if not os.path.exists(base_path):
-            self.prglog_mgr.debug("{}(): The path does not exist ({})".format(GET_MY_NAME(), path))
+            self.prglog_mgr.debug("The path does not exist (%s)", path)
             return False
 
         for file_name in os.listdir(base_path):
@@ -4250,52 +4326,42 @@ class AmazonAlexaClient:
             if file_size < 128:
                 continue
 
-            try:
-                file_object = open(file_path, 'rb')
-            except IOError as exception:
-                self.prglog_mgr.debug("{}(): Exception occurred".format(GET_MY_NAME()))
-                continue
-
-            data = file_object.read()
-            file_object.close()
-
-            if data[4:8].startswith(SIG_MP4):
-                ext = "m4a"
-            elif data[0:2].startswith(SIG_MP3):
-                ext = "mp3"
-            else:
-                self.prglog_mgr.info("{}(): Unknown audio format".format(GET_MY_NAME()))
-                ext = "unknown-format"
-
             # --------------------------------------------
             # Save this data to Evidence Library
+            # (the extension is decided by the magic of the first chunk while copying and hashing)
             name = "{} {}".format(file_path, PtUtils.get_random())
             name = PtUtils.hash_sha1(name.encode('utf-8'))
-            path_dst = "{}/{}.{}".format(self.path_base_dir, name, ext)
 
-            self.prglog_mgr.info("{}(): Saved path is {}".format(GET_MY_NAME(), path_dst))
-            PtUtils.copy_file(file_path, path_dst)
+            path_dst, hashes, head = PtUtils.copy_file_and_hash(
+                file_path,
+                lambda head: "{}/{}.{}".format(self.path_base_dir, name, self.get_audio_extension(head))
+            )
+            if path_dst is None:
+                self.prglog_mgr.debug("Exception occurred")
+                continue
+
+            ext = self.get_audio_extension(head)
+            if ext == "unknown-format":
+                self.prglog_mgr.info("Unknown audio format")
+
+            self.prglog_mgr.info("Saved path is %s", path_dst)
 
             # --------------------------------------------
             # Insert a record into 'ACQUIRED_DATA' table
             #
-            operation_id = -1
-            query = Operation.select().where(Operation.type == op.name)
-
-            if len(query) == 1:
-                operation_id = query[0].id
+            operation_id = self.parser.db_mgr.get_operation_id(op)
 
             d, t = PtUtils.get_file_created_date_and_time(path_dst)
             saved_timestamp = "{} {}".format(d, t)
             # d, t = PtUtils.get_file_modified_date_and_time(path_dst)
             # modified_timestamp = "{} {}".format(d, t)
 
-            AcquiredFile.create(
+            self.parser.db_mgr.add_acquired_file(
                 operation_id=operation_id,
                 src_path=file_path,
                 desc="Cached voice data ({})".format(ext),
                 saved_path=path_dst,
-                sha1=PtUtils.hash_sha1(path_dst, filemode=True),
+                sha1=hashes['sha1'],
                 saved_timestamp=saved_timestamp,
                 modified_timestamp="-",
                 timezone=PtUtils.get_timezone()
@@ -4313,12 +4379,12 @@ class AmazonAlexaClient:
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): OP({}) PATH({})".format(GET_MY_NAME(), op.name, path))
+        self.prglog_mgr.info("OP(%s) PATH(%s)", op.name, path)
 
         base_path = path
 
         if not os.path.exists(base_path):
-            self.prglog_mgr.debug("{}(): The path does not exist ({})".format(GET_MY_NAME(), path))
+            self.prglog_mgr.debug("The path does not exist (%s)", path)
             return False
 
         for file_name in os.listdir(base_path):
@@ -4331,52 +4397,42 @@ class AmazonAlexaClient:
             if file_size < 128:
                 continue
 
-            try:
-                file_object = open(file_path, 'rb')
-            except IOError as exception:
-                self.prglog_mgr.debug("{}(): Exception occurred".format(GET_MY_NAME()))
-                continue
-
-            data = file_object.read()
-            file_object.close()
-
-            if data[4:8].startswith(SIG_MP4):
-                ext = "m4a"
-            elif data[0:2].startswith(SIG_MP3):
-                ext = "mp3"
-            else:
-                self.prglog_mgr.info("{}(): Unknown audio format".format(GET_MY_NAME()))
-                ext = "unknown-format"
-
             # --------------------------------------------
             # Save this data to Evidence Library
+            # (the extension is decided by the magic of the first chunk while copying and hashing)
             name = "{} {}".format(file_path, PtUtils.get_random())
             name = PtUtils.hash_sha1(name.encode('utf-8'))
-            path_dst = "{}/{}.{}".format(self.path_base_dir, name, ext)
 
-            self.prglog_mgr.info("{}(): Saved path is {}".format(GET_MY_NAME(), path_dst))
-            PtUtils.copy_file(file_path, path_dst)
+            path_dst, hashes, head = PtUtils.copy_file_and_hash(
+                file_path,
+                lambda head: "{}/{}.{}".format(self.path_base_dir, name, self.get_audio_extension(head))
+            )
+            if path_dst is None:
+                self.prglog_mgr.debug("Exception occurred")
+                continue
+
+            ext = self.get_audio_extension(head)
+            if ext == "unknown-format":
+                self.prglog_mgr.info("Unknown audio format")
+
+            self.prglog_mgr.info("Saved path is %s", path_dst)
 
             # --------------------------------------------
             # Insert a record into 'ACQUIRED_DATA' table
             #
-            operation_id = -1
-            query = Operation.select().where(Operation.type == op.name)
-
-            if len(query) == 1:
-                operation_id = query[0].id
+            operation_id = self.parser.db_mgr.get_operation_id(op)
 
             d, t = PtUtils.get_file_created_date_and_time(path_dst)
             saved_timestamp = "{} {}".format(d, t)
             # d, t = PtUtils.get_file_modified_date_and_time(path_dst)
             # modified_timestamp = "{} {}".format(d, t)
 
-            AcquiredFile.create(
+            self.parser.db_mgr.add_acquired_file(
                 operation_id=operation_id,
                 src_path=file_path,
                 desc="Cached voice data ({})".format(ext),
                 saved_path=path_dst,
-                sha1=PtUtils.hash_sha1(path_dst, filemode=True),
+                sha1=hashes['sha1'],
                 saved_timestamp=saved_timestamp,
                 modified_timestamp="-",
                 timezone=PtUtils.get_timezone()
@@ -4407,10 +4463,10 @@ class AmazonAlexaClient:
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}()".format(GET_MY_NAME()))
+        self.prglog_mgr.info("")
 
         if not os.path.exists(path):
-            self.prglog_mgr.debug("{}(): The path does not exist ({})".format(GET_MY_NAME(), path))
+            self.prglog_mgr.debug("The path does not exist (%s)", path)
             return False
 
         path_root = path
@@ -4418,66 +4474,80 @@ class AmazonAlexaClient:
         chrome_cache = ChromiumMainCache()
         chrome_cache.set_url_pattern('https://[a-z-]+.amazon.com/(api|app)/')
 
-        if chrome_cache.parse(path_root) is False:
-            return False
+        workers = 1
+        if CIFTOption.PARALLEL_PROCESSING in self.options:
+            workers = os.cpu_count() or 1
 
-        cache_entry = MainCacheEntry()
+        carving = CIFTOption.CARVE_DELETED_CACHE_ENTRIES in self.options
 
-        # Traverse all cache entries relating to Amazon Alexa
-        for cache_entry in chrome_cache.cache_entries:
-            url = cache_entry.key
+        candidates = []
+        if chrome_cache.parse(path_root, workers) is True:
+            candidates = chrome_cache.cache_entries
+        elif carving is False:
+            chrome_cache.close()
+            return False
 
-            # Check all data streams
-            for idx in range(len(cache_entry.data_stream_addresses)):
-                data_stream_size = cache_entry.data_stream_sizes[idx]
-                data_stream_addr = cache_entry.data_stream_addresses[idx]
+        cache_entry = MainCacheEntry()
 
-                if data_stream_addr == 0:
-                    break
+        if carving is True:
+            # Entries evicted or deleted from the index may still remain within data files
+            # (also tried when 'index' is missing or broken, then all blocks are unreferenced)
+            recovered = list(chrome_cache.carve_entries(pattern=chrome_cache.url_pattern, path_root=path_root))
+            self.prglog_mgr.info("%s recovered cache entries", len(recovered))
+            candidates = candidates + recovered
+
+        # Skip failed or non-JSON responses by the HTTP response info (stream 0) before reading bodies
+        cache_entries = []
+        for cache_entry in candidates:
+            response_info = chrome_cache.get_response_info(cache_entry)
+            if response_info is not None and self.check_response_info(response_info) is False:
+                continue
+            cache_entries.append(cache_entry)
 
-                if data_stream_size < 8:
-                    continue
+        # Traverse all data streams of cache entries relating to Amazon Alexa
+        # (data files stay mapped during the traversal, and streams are read in (file, offset) order)
+        for cache_entry, idx, data in chrome_cache.iter_data_streams(cache_entries):
+            url = cache_entry.key
 
-                data_file = path_root + "/{}".format(data_stream_addr.filename)
+            if idx == 0 and cache_entry.response_info is not None:
+                continue  # HTTP response info
 
-                try:
-                    file_object = open(data_file, 'rb')
-                    if data_stream_addr.block_offset is not None:
-                        file_object.seek(data_stream_addr.block_offset, os.SEEK_SET)
-                except IOError as exception:
-                    self.prglog_mgr.debug("{}(): Cannot open the file ({})".format(GET_MY_NAME(), data_file))
-                    continue
+            if len(data) < 8:
+                continue
 
-                data = file_object.read(data_stream_size)
-                file_object.close()
+            if data[0:2] != SIG_GZIP:
+                continue
 
-                if not data[0:2].startswith(SIG_GZIP):
-                    continue
+            # Process JSON format only (decompression stops early for other contents)
+            body, status = PtUtils.decompress_gzip_incremental(data, prefixes=JSON_PREFIXES)
+            if status == GzipStatus.TRUNCATED:
+                self.prglog_mgr.debug("Truncated gzip stream (%s bytes recovered)", len(body))
+                continue
 
-                body = PtUtils.decompress_gzip(data)
-                if len(body) < 4:
-                    continue
+            if status != GzipStatus.OK or len(body) < 4:
+                continue
 
-                if not (body[0:1] == b'{' or body[0:1] == b'['):
-                    continue  # Process JSON format only
+            try:
+                body = body.decode("utf-8")
+            except UnicodeDecodeError:
+                self.prglog_mgr.debug("Invalid JSON format")
+                continue
 
-                try:
-                    body = body.decode("utf-8")
-                except UnicodeDecodeError:
-                    self.prglog_mgr.debug("{}(): Invalid JSON format".format(GET_MY_NAME()))
-                    continue
+            # Check if this JSON is supported by the 'Parser' module
+            api = self.identify_alexa_api(url)
 
-                # Check if this JSON is supported by the 'Parser' module
-                api = self.identify_alexa_api(url)
+            response_time = None
+            if cache_entry.response_info is not None:
+                response_time = cache_entry.response_info.response_time
 
-                # Parse JSON format and Save the result to DB
-                try:
-                    self.parser.process_api(
-                        op, api, url=url, value=body, filemode=False,
-                        base_path=self.path_base_dir
-                    )
-                except:
-                    pass
+            # Parse JSON format and Save the result to DB
+            try:
+                self.parser.process_api(
+                    op, api, url=url, value=body, filemode=False,
+                    base_path=self.path_base_dir, response_time=response_time, dedup=True
+                )
+            except:
+                pass
 
         chrome_cache.close()
         return True
@@ -4501,59 +4571,110 @@ class AmazonAlexaClient:
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}()".format(GET_MY_NAME()))
+        self.prglog_mgr.info("")
 
         if not os.path.exists(path):
-            self.prglog_mgr.debug("{}(): The path does not exist ({})".format(GET_MY_NAME(), path))
+            self.prglog_mgr.debug("The path does not exist (%s)", path)
             return
 
         path_target = path
-        cache_entry = SimpleCacheEntry()
 
         # Traverse all files in a target directory
+        jobs = []
         for root, dirs, files in os.walk(path_target):
+            # The index (if any) gives last used times of entries without opening each file
+            index_entries = ChromiumSimpleCache.get_index_entries(root)
+            if index_entries is None:
+                index_entries = {}
+
             for file in files:
-                file_path = os.path.join(root, file)
+                if not ChromiumSimpleCache.is_entry_file(file):
+                    continue  # Only '<entry hash>_0' files have keys and response bodies
 
-                simple_cache = ChromiumSimpleCache()
+                index_entry = index_entries.get(file)
+                last_used_time = index_entry.last_used_time if index_entry is not None else None
+                jobs.append((os.path.join(root, file), last_used_time))
 
-                if simple_cache.parse(file_path) is False:
-                    continue
+        workers = 1
+        if CIFTOption.PARALLEL_PROCESSING in self.options:
+            workers = os.cpu_count() or 1
 
-                cache_entry = simple_cache.cache_entry
+        verify_crc32 = CIFTOption.VERIFY_CACHE_CRC32 in self.options
 
-                if cache_entry.key == "" or len(cache_entry.streams) == 0:
-                    continue
+        if workers > 1:
+            results = self.iter_simple_cache_results_parallel(jobs, workers, verify_crc32)
+        else:
+            results = (scan_simple_cache_files([job], verify_crc32) for job in jobs)
 
-                for stream in cache_entry.streams:
-                    if not stream.startswith(SIG_GZIP):
-                        continue
+        # Parse JSON bodies and save results to DB (only in this process)
+        for records in results:
+            for url, body, response_time in records:
+                # Check if this JSON is supported by the 'Parser' module
+                api = self.identify_alexa_api(url)
 
-                    body = PtUtils.decompress_gzip(stream)
-                    if len(body) < 4:
-                        continue
+                # Parse JSON format and Save the result to DB
+                try:
+                    self.parser.process_api(
+                        op, api, url=url, value=body,
+                        filemode=False, base_path=self.path_base_dir, response_time=response_time,
+                        dedup=True
+                    )
+                except:
+                    pass
 
-                    if not (body[0:1] == b'{' or body[0:1] == b'['):
-                        continue  # Process JSON format only
+        return True
 
-                    try:
-                        body = body.decode("utf-8")
-                    except UnicodeDecodeError:
-                        self.prglog_mgr.debug("{}(): Not valid JSON format".format(GET_MY_NAME()))
-                        continue
+    def iter_simple_cache_results_parallel(self, jobs, workers, verify_crc32=False):
+        """Scan simple cache entry files using a pool of worker processes
 
-                    # Check if this JSON is supported by the 'Parser' module
-                    api = self.identify_alexa_api(cache_entry.key)
+            - Workers parse entry files and decompress bodies (cf. scan_simple_cache_files())
+            - At most 'workers * 4' batches are pending at once, and results are yielded
+              in the order of jobs
+            - Workers are started by 'spawn' (cf. get_worker_context())
 
-                    # Parse JSON format and Save the result to DB
-                    try:
-                        self.parser.process_api(
-                            op, api, url=cache_entry.key, value=body,
-                            filemode=False, base_path=self.path_base_dir
-                        )
-                    except:
-                        pass
+        Args:
+            jobs (list): (file path, last used time) of entry files
+            workers (int): The number of worker processes
+            verify_crc32 (bool): If True, streams are verified by CRC32 in workers
+
+        Yields:
+            A list of (url, body, response_time)
+        """
+        self.prglog_mgr.info("%s files, %s workers", len(jobs), workers)
+
+        batch_size = 32
+        max_pending = workers * 4
+        pending = collections.deque()
+
+        with ProcessPoolExecutor(max_workers=workers, mp_context=get_worker_context()) as executor:
+            for idx in range(0, len(jobs), batch_size):
+                if len(pending) >= max_pending:
+                    yield pending.popleft().result()
+                pending.append(
+                    executor.submit(scan_simple_cache_files, jobs[idx: idx + batch_size], verify_crc32)
+                )
+
+            while pending:
+                yield pending.popleft().result()
+
+    @staticmethod
+    def check_response_info(response_info):
+        """Check if a cached response may have an Alexa API's JSON body
+
+        Args:
+            response_info (HttpResponseInfo): The HTTP response info of a cache entry
+
+        Returns:
+            True or False
+        """
+        if response_info.is_successful() is False:
+            return False
 
+        if response_info.may_be_json() is False:
+            return False
+
+        if response_info.may_be_gzip() is False:
+            return False  # Only gzip compressed bodies are processed
         return True
 
     def identify_alexa_api(self, url):
@@ -4565,7 +4686,7 @@ class AmazonAlexaClient:
         Returns:
             CIFTAmazonAlexaAPI
         """
-        self.prglog_mgr.info("{}(): {}".format(GET_MY_NAME(), url))
+        self.prglog_mgr.info("%s", url)
 
         for api in CIFTAmazonAlexaAPI:
             if api == CIFTAmazonAlexaAPI.UNKNOWN:
@@ -4615,9 +4736,72 @@ class AmazonAlexaClient:
         """Post-process
 
         """
-        self.prglog_mgr.info("{}()".format(GET_MY_NAME()))
+        self.prglog_mgr.info("")
 
         if self.parser is not None:
             self.parser.close()
         return
 
+
+
+def scan_simple_cache_files(jobs, verify_crc32=False):
+    """Extract JSON bodies from simple cache entry files (also the job of a worker process)
+
+    Args:
+        jobs (list): (file path, last used time) of entry files
+        verify_crc32 (bool): If True, streams not matching CRC32 of EOS records are skipped
+
+    Returns:
+        A list of (url, body (str), response_time)
+    """
+    prglog_mgr = GET_LOGGER(__name__)
+    records = []
+
+    for file_path, last_used_time in jobs:
+        simple_cache = ChromiumSimpleCache()
+
+        try:
+            if simple_cache.parse(file_path, verify_crc32) is False:
+                continue
+        except (OSError, ValueError):
+            continue
+
+        cache_entry = simple_cache.cache_entry
+
+        if cache_entry.key == "" or len(cache_entry.streams) == 0:
+            continue
+
+        # Skip failed or non-JSON responses by the HTTP response info (stream 0)
+        response_time = last_used_time
+        if cache_entry.response_info is not None:
+            if AmazonAlexaClient.check_response_info(cache_entry.response_info) is False:
+                continue
+            if cache_entry.response_info.response_time is not None:
+                response_time = cache_entry.response_info.response_time
+
+        for idx, stream in enumerate(cache_entry.streams):
+            if verify_crc32 is True and cache_entry.crc32_verified[idx] is False:
+                prglog_mgr.debug("Corrupted stream (%s)", file_path)
+                continue
+
+            if not stream.startswith(SIG_GZIP):
+                continue  # Only the leading bytes are read for checking
+
+            # Process JSON format only (decompression stops early for other contents)
+            body, status = PtUtils.decompress_gzip_incremental(stream.read(), prefixes=JSON_PREFIXES)
+            if status == GzipStatus.TRUNCATED:
+                prglog_mgr.debug("Truncated gzip stream (%s bytes recovered)", len(body))
+                continue
+
+            if status != GzipStatus.OK or len(body) < 4:
+                continue
+
+            try:
+                body = body.decode("utf-8")
+            except UnicodeDecodeError:
+                prglog_mgr.debug("Not valid JSON format")
+                continue
+
+            records.append((cache_entry.key, body, response_time))
+
+    return records
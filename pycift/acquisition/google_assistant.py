@@ -124,7 +124,7 @@ class GoogleAssistantInterface:
         self.options = []
 
         # Progress logging manager
-        self.prglog_mgr = logging.getLogger(__name__)
+        self.prglog_mgr = GET_LOGGER(__name__)
 
     def basic_config(self, path_base_dir, browser_driver, options=[]):
         """Set the result DB path
@@ -137,10 +137,10 @@ class GoogleAssistantInterface:
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): Set the basic configurations".format(GET_MY_NAME()))
+        self.prglog_mgr.info("Set the basic configurations")
 
         if browser_driver not in CIFTBrowserDrive:
-            self.prglog_mgr.debug("{}(): {} not in CIFTBrowserDrive".format(GET_MY_NAME(), browser_driver))
+            self.prglog_mgr.debug("%s not in CIFTBrowserDrive", browser_driver)
             return False
 
         self.browser_drive = browser_driver
@@ -156,7 +156,7 @@ class GoogleAssistantInterface:
                 return
 
         self.path_base_dir = path_base_dir
-        self.prglog_mgr.info("{}(): Output path is {}".format(GET_MY_NAME(), path_base_dir))
+        self.prglog_mgr.info("Output path is %s", path_base_dir)
 
         if len(options) != 0:
             for opt in options:
@@ -164,7 +164,7 @@ class GoogleAssistantInterface:
                     self.options.append(opt)
 
         if len(self.options) != 0:
-            self.prglog_mgr.info("{}(): Enabled options - {}".format(GET_MY_NAME(), self.options))
+            self.prglog_mgr.info("Enabled options - %s", self.options)
         return True
 
     def add_input(self, op, *args):
@@ -177,19 +177,19 @@ class GoogleAssistantInterface:
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): Add a new input".format(GET_MY_NAME()))
+        self.prglog_mgr.info("Add a new input")
         if op == CIFTOperation.CLOUD:
-            self.prglog_mgr.info("{}(): OPERATION({}) ID({})".format(GET_MY_NAME(), op.name, args[0]))
+            self.prglog_mgr.info("OPERATION(%s) ID(%s)", op.name, args[0])
         else:
-            self.prglog_mgr.info("{}(): OPERATION({}) ARGS({})".format(GET_MY_NAME(), op.name, args))
+            self.prglog_mgr.info("OPERATION(%s) ARGS(%s)", op.name, args)
 
         if op not in CIFTOperation:
-            self.prglog_mgr.debug("{}(): {} not in CIFTOperation".format(GET_MY_NAME(), op))
+            self.prglog_mgr.debug("%s not in CIFTOperation", op)
             return False
 
         if len(args) == 0:
             self.prglog_mgr.debug(
-                "{}(): At least one argument is required".format(GET_MY_NAME(), op)
+                "At least one argument is required"
             )
             return False
 
@@ -205,14 +205,14 @@ class GoogleAssistantInterface:
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): Run modules for processing user inputs".format(GET_MY_NAME()))
+        self.prglog_mgr.info("Run modules for processing user inputs")
 
         if self.browser_drive is None or self.path_base_dir == "":
-            self.prglog_mgr.debug("{}(): basic_config() should be called".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("basic_config() should be called")
             return False
 
         if len(self.inputs) == 0:
-            self.prglog_mgr.debug("{}(): There is no input to be processed".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("There is no input to be processed")
             return False
 
         for item in self.inputs:
@@ -235,7 +235,7 @@ class GoogleAssistantInterface:
                 companion.close()
 
             else:
-                self.prglog_mgr.info("{}(): Not supported operation '{}'".format(GET_MY_NAME(), op.name))
+                self.prglog_mgr.info("Not supported operation '%s'", op.name)
                 continue
 
         db_mgr = DatabaseManager("{}/{}".format(self.path_base_dir, RESULT_DB_GOOGLE_ASSISTANT), delete_db=False)
@@ -247,7 +247,7 @@ class GoogleAssistantInterface:
         """Post-process
 
         """
-        self.prglog_mgr.info("{}()".format(GET_MY_NAME()))
+        self.prglog_mgr.info("")
 
         # Add post-processes
         return
@@ -291,7 +291,7 @@ class GoogleAssistantCloud:
             self.auto = BrowserAutomation(browser_driver=browser_driver)
 
         # Progress logging manager
-        self.prglog_mgr = logging.getLogger(__name__)
+        self.prglog_mgr = GET_LOGGER(__name__)
 
     def run_with_idpw(self, user_id, user_pw):
         """Get data from the cloud after connecting to its server using ID/PW
@@ -303,13 +303,13 @@ class GoogleAssistantCloud:
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): Get data from the cloud".format(GET_MY_NAME()))
+        self.prglog_mgr.info("Get data from the cloud")
 
         if user_id == "" or user_pw == "":
-            self.prglog_mgr.debug("{}(): Invalid ID or PW".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("Invalid ID or PW")
             return False
         else:
-            self.prglog_mgr.info("{}(): ID({})".format(GET_MY_NAME(), user_id))
+            self.prglog_mgr.info("ID(%s)", user_id)
 
         # Set ID and PW
         self.user_id = user_id
@@ -321,14 +321,14 @@ class GoogleAssistantCloud:
 
             # Create a session with ID and PW
             if self.create_session() is False:
-                self.prglog_mgr.debug("{}(): Creating a session failed".format(GET_MY_NAME()))
+                self.prglog_mgr.debug("Creating a session failed")
                 return False
 
         try:
             # Call the internal APIs
             self.call_api()
         except Exception as e:
-            self.prglog_mgr.debug("{}(): Exception from call_api() - ({})".format(GET_MY_NAME(), e))
+            self.prglog_mgr.debug("Exception from call_api() - (%s)", e)
             return False
 
         return True
@@ -345,35 +345,35 @@ class GoogleAssistantCloud:
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): Get data from the cloud".format(GET_MY_NAME()))
+        self.prglog_mgr.info("Get data from the cloud")
 
         if cookies.get("SID") is None:
-            self.prglog_mgr.debug("{}(): 'SID' is required".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("'SID' is required")
             return False
 
         if cookies.get("SSID") is None:
-            self.prglog_mgr.debug("{}(): 'SSID' is required".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("'SSID' is required")
             return False
 
         if cookies.get("HSID") is None:
-            self.prglog_mgr.debug("{}(): 'HSID' is required".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("'HSID' is required")
             return False
 
-        self.prglog_mgr.info("{}(): Try to connect with cookies".format(GET_MY_NAME()))
+        self.prglog_mgr.info("Try to connect with cookies")
 
         # Set headers and cookies
         self.auto.cookies = cookies
 
         # Test token values of cookies
         if self.test_credential() is False:
-            self.prglog_mgr.debug("{}(): Invalid authentication tokens".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("Invalid authentication tokens")
             return False
 
         try:
             # Call the internal APIs
             self.call_api()
         except Exception as e:
-            self.prglog_mgr.debug("{}(): Exception from call_api() - ({})".format(GET_MY_NAME(), e))
+            self.prglog_mgr.debug("Exception from call_api() - (%s)", e)
             return False
 
         return True
@@ -384,7 +384,7 @@ class GoogleAssistantCloud:
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): Get data from the cloud".format(GET_MY_NAME()))
+        self.prglog_mgr.info("Get data from the cloud")
 
         # -----------------------------------------------------------------------------
         # Call internal APIs for getting user data
@@ -432,7 +432,7 @@ class GoogleAssistantCloud:
                 try:
                     data = json.loads(data[6:])
                 except ValueError:
-                    self.prglog_mgr.debug("{}(): Invalid JSPB format".format(GET_MY_NAME()))
+                    self.prglog_mgr.debug("Invalid JSPB format")
                     return False
 
                 if len(data) != 2:
@@ -446,7 +446,7 @@ class GoogleAssistantCloud:
                     ct = data[1]
                     if ct is None:
                         break
-                    self.prglog_mgr.info("{}(): \'ct\' is {}".format(GET_MY_NAME(), ct))
+                    self.prglog_mgr.info("'ct' is %s", ct)
                     url = api.url.format(ct)
                 continue
 
@@ -463,7 +463,10 @@ class GoogleAssistantCloud:
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): Download voice data from Google Assistant cloud service".format(GET_MY_NAME()))
+        self.prglog_mgr.info("Download voice data from Google Assistant cloud service")
+
+        # Buffered rows have to be written before querying
+        self.parser.db_mgr.flush()
 
         query = (Timeline
                  .select(Timeline.date, Timeline.time, Timeline.timezone, Timeline.desc, Timeline.extra)
@@ -471,7 +474,7 @@ class GoogleAssistantCloud:
                  .order_by(Timeline.date.desc(), Timeline.time.asc()))
 
         if len(query) == 0:
-            self.prglog_mgr.debug("{}(): There is no Voice related URL".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("There is no Voice related URL")
             return False
 
         path = "{}/VOICE/".format(self.path_base_dir)
@@ -511,7 +514,7 @@ class GoogleAssistantCloud:
 
             if os.path.exists(path) is True:
                 self.prglog_mgr.info(
-                    "{}(): Already downloaded file ({}) -> Go to the next file".format(GET_MY_NAME(), name)
+                    "Already downloaded file (%s) -> Go to the next file", name
                 )
                 continue
 
@@ -522,30 +525,26 @@ class GoogleAssistantCloud:
                 continue
 
             if os.path.exists(path):
-                self.prglog_mgr.info("{}(): Saved path is {}".format(GET_MY_NAME(), path))
-                data = open(path, 'rb').read()
+                self.prglog_mgr.info("Saved path is %s", path)
             else:
                 continue
 
             # --------------------------------------------
             # Insert a record into 'ACQUIRED_FILE' table
             #
-            operation_id = -1
-            query = Operation.select().where(Operation.type == CIFTOperation.CLOUD.name)
-            if len(query) == 1:
-                operation_id = query[0].id
+            operation_id = self.parser.db_mgr.get_operation_id(CIFTOperation.CLOUD)
 
             d, t = PtUtils.get_file_created_date_and_time(path)
             saved_timestamp = "{} {}".format(d, t)
             # d, t = PtUtils.get_file_modified_date_and_time(path)
             # modified_timestamp = "{} {}".format(d, t)
 
-            AcquiredFile.create(
+            self.parser.db_mgr.add_acquired_file(
                 operation_id=operation_id,
                 src_path=voice_url,
                 desc="Voice Data",
                 saved_path=path,
-                sha1=PtUtils.hash_sha1(data),
+                sha1=PtUtils.hash_sha1(path, filemode=True),
                 saved_timestamp=saved_timestamp,
                 modified_timestamp="-",
                 timezone=PtUtils.get_timezone()
@@ -559,7 +558,7 @@ class GoogleAssistantCloud:
         Returns:
             True and False
         """
-        self.prglog_mgr.info("{}()".format(GET_MY_NAME()))
+        self.prglog_mgr.info("")
 
         # url = "https://accounts.google.com/ServiceLogin"
         url = "https://www.google.com/accounts/Login?hl=en&continue=http://www.google.com/"
@@ -595,15 +594,15 @@ class GoogleAssistantCloud:
         # self.prglog_mgr.info("{}(): The current page's title is '{}'".format(GET_MY_NAME(), title))
 
         if page_source.find("Wrong password. Try again.") > 0:
-            self.prglog_mgr.info("{}(): Login failed - Your password is incorrect".format(GET_MY_NAME()))
+            self.prglog_mgr.info("Login failed - Your password is incorrect")
             return False
 
         if title != "Google":
-            self.prglog_mgr.info("{}(): Login failed".format(GET_MY_NAME()))
+            self.prglog_mgr.info("Login failed")
             return False
 
         # Post-processes
-        self.prglog_mgr.info("{}(): Logged in successfully".format(GET_MY_NAME()))
+        self.prglog_mgr.info("Logged in successfully")
         self.auto.update_cookies()
         self.auto.close()
         return True
@@ -614,7 +613,7 @@ class GoogleAssistantCloud:
         Returns:
             True and False
         """
-        self.prglog_mgr.info("{}()".format(GET_MY_NAME()))
+        self.prglog_mgr.info("")
 
         text = self.auto.get_text(CIFTGoogleAssistantAPI.ACTIVITIES.url)
         if text is None:
@@ -629,9 +628,9 @@ class GoogleAssistantCloud:
 
         """
         if self.user_id != "":
-            self.prglog_mgr.info("{}(): ID({})".format(GET_MY_NAME(), self.user_id))
+            self.prglog_mgr.info("ID(%s)", self.user_id)
         else:
-            self.prglog_mgr.info("{}()".format(GET_MY_NAME()))
+            self.prglog_mgr.info("")
 
         if self.auto is not None:
             self.auto.close()
@@ -661,7 +660,7 @@ class GoogleAssistantParser:
         )
 
         # Progress logging manager
-        self.prglog_mgr = logging.getLogger(__name__)
+        self.prglog_mgr = GET_LOGGER(__name__)
 
     def process_api(self, op, api, url, value, filemode=True, base_path=""):
         """Process the cloud native data acquired by APIs or saved within companion devices
@@ -677,7 +676,7 @@ class GoogleAssistantParser:
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): OP({}) API({})".format(GET_MY_NAME(), op.name, api.name))
+        self.prglog_mgr.info("OP(%s) API(%s)", op.name, api.name)
 
         operation_id = -1
         source_id = -1
@@ -690,13 +689,13 @@ class GoogleAssistantParser:
 
         # Read JSPB format
         if not data.startswith(")]}'"):
-            self.prglog_mgr.debug("{}(): Invalid JSPB format".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("Invalid JSPB format")
             return False
 
         try:
             data_temp = json.loads(data[6:])
         except ValueError:
-            self.prglog_mgr.debug("{}(): Invalid JSPB format".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("Invalid JSPB format")
             return False
 
         # --------------------------------------------
@@ -709,23 +708,20 @@ class GoogleAssistantParser:
         # # name = name.replace("https___", "")
         # path = "{}/{}.jspb".format(base_path, name)
 
-        self.prglog_mgr.info("{}(): Saved path is {}".format(GET_MY_NAME(), path))
+        self.prglog_mgr.info("Saved path is %s", path)
         PtUtils.save_string_to_file(path, data)
 
         # --------------------------------------------
         # Insert a record into 'ACQUIRED_FILE' table
         #
-        query = Operation.select().where(Operation.type == op.name)
-
-        if len(query) == 1:
-            operation_id = query[0].id
+        operation_id = self.db_mgr.get_operation_id(op)
 
         d, t = PtUtils.get_file_created_date_and_time(path)
         saved_timestamp = "{} {}".format(d, t)
         d, t = PtUtils.get_file_modified_date_and_time(path)
         modified_timestamp = "{} {}".format(d, t)
 
-        AcquiredFile.create(
+        source_id = self.db_mgr.add_acquired_file(
             operation_id=operation_id,
             src_path=url,
             desc=api.desc,
@@ -736,18 +732,20 @@ class GoogleAssistantParser:
             timezone=PtUtils.get_timezone()
         )
 
-        source_id = AcquiredFile.select().order_by(AcquiredFile.id.desc()).get()
+        # The source context for handlers (no need to read the record again)
+        _format = "Android Web Cache + JSPB" if op == CIFTOperation.COMPANION_APP_ANDROID else "JSPB"
+        src = CIFTSource(source_id, op, url, api.desc, path, PtUtils.get_timezone(), _format)
         #
         # End of this segment
         # --------------------------------------------
 
         if api == CIFTGoogleAssistantAPI.UNKNOWN:
-            self.prglog_mgr.info("{}(): UNSUPPORTED API - {}".format(GET_MY_NAME(), url))
+            self.prglog_mgr.info("UNSUPPORTED API - %s", url)
             return True
 
         # Process JSPB data
         if data_temp[0] is None:
-            self.prglog_mgr.info("{}(): There is no activity record in this JSPB file".format(GET_MY_NAME()))
+            self.prglog_mgr.info("There is no activity record in this JSPB file")
             return True
         else:
             data = data_temp[0]
@@ -756,15 +754,11 @@ class GoogleAssistantParser:
             # --------------------------------------------
             # Insert a record into 'TIMELINE' table
             #
-            query = AcquiredFile.select().where(AcquiredFile.id == source_id)
-            if len(query) == 0:
-                return False
-
             source = op.name
-            source_type = query[0].desc
-            filename = query[0].saved_path
-            timezone = PtUtils.get_timezone()
-            _format = "Android Web Cache + JSPB" if op == CIFTOperation.COMPANION_APP_ANDROID else "JSPB"
+            source_type = src.desc
+            filename = src.saved_path
+            timezone = src.timezone
+            _format = src.format
             macb = "...B"
             _type = "Created"
 
@@ -774,17 +768,17 @@ class GoogleAssistantParser:
                 # Check the record type
                 if 20 <= item_count <= 26:
                     self.prglog_mgr.info(
-                        "{}(): Activity record detected - item_count({}) - Full".format(GET_MY_NAME(), item_count)
+                        "Activity record detected - item_count(%s) - Full", item_count
                     )
                     record = [None] * 26
                 elif item_count == 10:
                     self.prglog_mgr.info(
-                        "{}(): Activity record detected - item_count({}) - Simple".format(GET_MY_NAME(), item_count)
+                        "Activity record detected - item_count(%s) - Simple", item_count
                     )
                     record = [None] * 10
                 else:
                     self.prglog_mgr.info(
-                        "{}(): Unknown activity record type - item_count({})".format(GET_MY_NAME(), item_count)
+                        "Unknown activity record type - item_count(%s)", item_count
                     )
                     continue
 
@@ -831,8 +825,9 @@ class GoogleAssistantParser:
                 notes = notes.replace("\n", " ")
                 extra = extra.replace("\n", " ")
 
-                Timeline.create(
-                    date=b_dt[0], time=b_dt[1], timezone=timezone,
+                self.db_mgr.insert(
+                    Timeline,
+                    date=b_dt[0], time=b_dt[1], epoch=int(record[4][:-3]), timezone=timezone,
                     MACB=macb, source=source, sourcetype=source_type, type=_type,
                     short=short if short != "" else "-",
                     desc=desc if desc != "" else "-",
@@ -860,7 +855,7 @@ class GoogleAssistantParser:
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): OP({}) FILE({})".format(GET_MY_NAME(), op.name, cf.name))
+        self.prglog_mgr.info("OP(%s) FILE(%s)", op.name, cf.name)
 
         # Read data to buffer (if necessary)
         if filemode is False:
@@ -868,7 +863,7 @@ class GoogleAssistantParser:
         else:
             path = value
             if not os.path.exists(path):
-                self.prglog_mgr.debug("{}(): The path does not exist ({})".format(GET_MY_NAME(), path))
+                self.prglog_mgr.debug("The path does not exist (%s)", path)
                 return False
             data = open(path, 'rb').read()
 
@@ -880,7 +875,7 @@ class GoogleAssistantParser:
         elif cf.sig == SIG_XML:
             ext = 'xml'
         else:
-            self.prglog_mgr.info("{}(): Not supported file format".format(GET_MY_NAME()))
+            self.prglog_mgr.info("Not supported file format")
             return False
 
         # --------------------------------------------
@@ -891,23 +886,20 @@ class GoogleAssistantParser:
         # name = PtUtils.get_valid_filename(cf.path)
         # path = "{}/{}".format(base_path, name)
 
-        self.prglog_mgr.info("{}(): Saved path is {}".format(GET_MY_NAME(), path))
+        self.prglog_mgr.info("Saved path is %s", path)
         PtUtils.save_bytes_to_file(path, data)
 
         # --------------------------------------------
         # Insert a record into 'ACQUIRED_DATA' table
         #
-        query = Operation.select().where(Operation.type == op.name)
-
-        if len(query) == 1:
-            operation_id = query[0].id
+        operation_id = self.db_mgr.get_operation_id(op)
 
         d, t = PtUtils.get_file_created_date_and_time(path)
         saved_timestamp = "{} {}".format(d, t)
         d, t = PtUtils.get_file_modified_date_and_time(path)
         modified_timestamp = "{} {}".format(d, t)
 
-        AcquiredFile.create(
+        source_id = self.db_mgr.add_acquired_file(
             operation_id=operation_id,
             src_path=cf.path,
             desc=cf.desc,
@@ -918,7 +910,9 @@ class GoogleAssistantParser:
             timezone=PtUtils.get_timezone()
         )
 
-        source_id = AcquiredFile.select().order_by(AcquiredFile.id.desc()).get()
+        # The source context for handlers (no need to read the record again)
+        _format = CIFTSource.FILE_FORMATS.get(cf.sig, "-")
+        src = CIFTSource(source_id, op, cf.path, cf.desc, path, PtUtils.get_timezone(), _format)
         #
         # End of this segment
         # --------------------------------------------
@@ -929,24 +923,24 @@ class GoogleAssistantParser:
 
         # ---------------------------------------------------------
         if cf == CIFTGoogleAssistantClientFile.IOS_COOKIES:
-            return self.process_client_file_ios_cookies(op, cf, source_id, path)
+            return self.process_client_file_ios_cookies(op, cf, src, path)
 
         return True
 
-    def process_client_file_ios_cookies(self, op, cf, source_id, value, filemode=True):
+    def process_client_file_ios_cookies(self, op, cf, src, value, filemode=True):
         """Process iOS GA app's Cookies
 
         Args:
             op (CIFTOperation): The current operation
             cf (CIFTGoogleAssistantClientFile): The current Google Assistant app related file
-            source_id (int): The source ID for referencing an acquired file
+            src (CIFTSource): The acquired file (source) of this data
             value (str): SQLite data itself or the path of a SQLite file
             filemode (bool): If True, 'value' is the file path
 
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): OP({}) FILE({})".format(GET_MY_NAME(), op.name, cf.name))
+        self.prglog_mgr.info("OP(%s) FILE(%s)", op.name, cf.name)
 
         # Read data to buffer (if necessary)
         if filemode is True:
@@ -964,11 +958,12 @@ class GoogleAssistantParser:
             if not domain.startswith(".google."):
                 continue
 
-            Credential.create(
+            self.db_mgr.insert(
+                Credential,
                 type="iOS Cookie",
                 domain=domain,
                 value=value,
-                source_id=source_id
+                source_id=src.id
             )
 
         return True
@@ -977,7 +972,7 @@ class GoogleAssistantParser:
         """Post-process
 
         """
-        self.prglog_mgr.info("{}()".format(GET_MY_NAME()))
+        self.prglog_mgr.info("")
 
         self.db_mgr.close()
         return
@@ -1006,7 +1001,7 @@ class GoogleAssistantClient:
         PtUtils.make_dir(self.path_base_dir)
 
         # Progress logging manager
-        self.prglog_mgr = logging.getLogger(__name__)
+        self.prglog_mgr = GET_LOGGER(__name__)
 
     def run(self, op, path):
         """Search and interpret Google Assistant related data stored within companion devices
@@ -1019,18 +1014,18 @@ class GoogleAssistantClient:
             True or False
         """
         self.prglog_mgr.info(
-            "{}(): Process Google Assistant related data stored within companion clients".format(GET_MY_NAME())
+            "Process Google Assistant related data stored within companion clients"
         )
 
         if not isinstance(op, CIFTOperation):
-            self.prglog_mgr.debug("{}(): Invalid operation ({})".format(GET_MY_NAME(), op))
+            self.prglog_mgr.debug("Invalid operation (%s)", op)
             return False
 
         if os.path.exists(path) is False:
-            self.prglog_mgr.debug("{}(): Invalid path ({})".format(GET_MY_NAME(), path))
+            self.prglog_mgr.debug("Invalid path (%s)", path)
             return False
         else:
-            self.prglog_mgr.info("{}(): OP({}) PATH({})".format(GET_MY_NAME(), op.name, path))
+            self.prglog_mgr.info("OP(%s) PATH(%s)", op.name, path)
 
         ret = False
 
@@ -1049,7 +1044,7 @@ class GoogleAssistantClient:
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}()".format(GET_MY_NAME()))
+        self.prglog_mgr.info("")
 
         # --------------------------------
         # [Cookies.binarycookies]
@@ -1066,7 +1061,7 @@ class GoogleAssistantClient:
         """Post-process
 
         """
-        self.prglog_mgr.info("{}()".format(GET_MY_NAME()))
+        self.prglog_mgr.info("")
 
         if self.parser is not None:
             self.parser.close()
@@ -3,10 +3,15 @@
     * Description
         Common defines for pycift modules
 """
+import atexit
 import logging
+import logging.handlers
+import multiprocessing
+import os
+import queue
 from ctypes import *
 from enum import Enum, IntEnum
-import inspect
+import sys
 
 # ===================================================================
 # DEBUGGING FLAGS
@@ -21,44 +26,193 @@ CIFT_DEBUG_CLOUD = False
 # STATIC FUNCTIONS
 #
 # GET_MY_NAME = lambda: inspect.stack()[1][3]  # Method name only
+def GET_CALLER_NAME(frame):
+    """Get 'Class.method' of a frame without building the whole stack (inspect.stack() reads source files)
+
+    Args:
+        frame (frame): The frame of the caller
+
+    Returns:
+        The name (str)
+    """
+    code = frame.f_code
+    qualname = getattr(code, 'co_qualname', None)  # Python 3.11+
+    if qualname is not None and '<locals>' not in qualname:
+        return qualname
+
+    self_object = frame.f_locals.get('self')
+    if self_object is not None:
+        return "{}.{}".format(self_object.__class__.__name__, code.co_name)
+    return code.co_name
+
+
 def GET_MY_NAME():
-    stack = inspect.stack()
-    the_class  = stack[1][0].f_locals["self"].__class__.__name__
-    the_method = stack[1][0].f_code.co_name
-    return "{}.{}".format(str(the_class), the_method)
+    return GET_CALLER_NAME(sys._getframe(1))
+
+
+class CIFTLogger(logging.LoggerAdapter):
+    """CIFTLogger class
+        - Prefixing messages with 'Class.method(): ' of the caller
+        - The caller is resolved only when a record is actually emitted, so use lazy arguments
+          (e.g. prglog_mgr.debug("Invalid entry %X", address)) instead of str.format()
+    """
+    IGNORED_FILES = (logging.LoggerAdapter.log.__code__.co_filename, __file__)
+
+    def __init__(self, logger):
+        super().__init__(logger, {})
+
+    def process(self, msg, kwargs):
+        frame = sys._getframe(1)
+        while frame is not None and frame.f_code.co_filename in self.IGNORED_FILES:
+            frame = frame.f_back
+
+        name = GET_CALLER_NAME(frame) if frame is not None else "<unknown>"
+        if msg:
+            return "{}(): {}".format(name, msg), kwargs
+        return "{}()".format(name), kwargs
+
+
+def GET_LOGGER(name):
+    """Get the progress log manager of a module
+
+    Args:
+        name (str): The module name (__name__)
+
+    Returns:
+        CIFTLogger
+    """
+    return CIFTLogger(logging.getLogger(name))
 
 
 # ===================================================================
 # GLOBAL LOGGING POLICY
 #
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s.%(msecs)03d    %(name)-38s %(levelname)-8s %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
+#   - Importing pycift does not configure logging nor create any file
+#   - Call configure_logging() once per case (e.g. at the start of a run)
+#   - Records are handed over to a queue and written by a background thread (QueueListener)
+#
+LOG_FORMAT = '%(asctime)s.%(msecs)03d    %(name)-38s %(levelname)-8s %(message)s'
+LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+PROGRESS_LOG_FILE = "last_progress_log.txt"
+
+_LOG_LISTENER = None
+_LOG_QUEUE_HANDLER = None
 
 
-def init_progress_log():
-    """Initialize the progress log file
+def configure_logging(level=logging.DEBUG, path_log=PROGRESS_LOG_FILE, module_levels=None, quiet=False):
+    """Configure the progress log (replacing the previous configuration made by this function)
+
+    Args:
+        level (int): The level of the root logger (e.g. logging.INFO)
+        path_log (str): The path of the progress log file (None: no log file)
+        module_levels (dict): Levels per logger name (e.g. {'pycift.utility': logging.WARNING})
+        quiet (bool): If True, only warnings and errors are printed to the console
+
+    Returns:
+        True or False
     """
-    root_logger = logging.getLogger()
+    global _LOG_LISTENER, _LOG_QUEUE_HANDLER
 
-    for h in root_logger.handlers:
-        if isinstance(h, logging.FileHandler):
-            root_logger.removeHandler(h)
+    shutdown_logging()
 
-    file_handler = logging.FileHandler("last_progress_log.txt", mode='w', encoding="utf-8")
-    file_handler.setLevel(logging.DEBUG)
-    log_formatter = logging.Formatter(
-        fmt='%(asctime)s.%(msecs)03d    %(name)-38s %(levelname)-8s %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
+    log_formatter = logging.Formatter(fmt=LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
+    handlers = []
+
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.WARNING if quiet is True else logging.DEBUG)
+    console_handler.setFormatter(log_formatter)
+    handlers.append(console_handler)
+
+    if path_log is not None:
+        try:
+            path_dir = os.path.dirname(os.path.abspath(path_log))
+            if os.path.isdir(path_dir) is False:
+                os.makedirs(path_dir)
+            file_handler = logging.FileHandler(path_log, mode='w', encoding="utf-8")
+        except (IOError, OSError):
+            return False
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(log_formatter)
+        handlers.append(file_handler)
+
+    _LOG_QUEUE_HANDLER = logging.handlers.QueueHandler(queue.SimpleQueue())
+    _LOG_LISTENER = logging.handlers.QueueListener(
+        _LOG_QUEUE_HANDLER.queue, *handlers, respect_handler_level=True
     )
-    file_handler.setFormatter(log_formatter)
-    root_logger.addHandler(file_handler)
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level)
+    root_logger.addHandler(_LOG_QUEUE_HANDLER)
+
+    if module_levels is not None:
+        for name, module_level in module_levels.items():
+            logging.getLogger(name).setLevel(module_level)
+
+    _LOG_LISTENER.start()
+    return True
+
+
+def shutdown_logging():
+    """Flush queued records and close handlers made by configure_logging()
+    """
+    global _LOG_LISTENER, _LOG_QUEUE_HANDLER
+
+    if _LOG_QUEUE_HANDLER is not None:
+        logging.getLogger().removeHandler(_LOG_QUEUE_HANDLER)
+        _LOG_QUEUE_HANDLER = None
+
+    if _LOG_LISTENER is not None:
+        _LOG_LISTENER.stop()  # Writes all pending records
+        for h in _LOG_LISTENER.handlers:
+            h.close()
+        _LOG_LISTENER = None
     return
 
 
-init_progress_log()
+def _reset_logging_in_child():
+    """Drop the queue handler in forked worker processes (the listener thread does not exist there)
+    """
+    global _LOG_LISTENER, _LOG_QUEUE_HANDLER
+
+    if _LOG_QUEUE_HANDLER is not None:
+        logging.getLogger().removeHandler(_LOG_QUEUE_HANDLER)
+    _LOG_QUEUE_HANDLER = None
+    _LOG_LISTENER = None
+
+
+def init_progress_log(path_log=PROGRESS_LOG_FILE):
+    """Initialize the progress log file (kept for compatibility, see configure_logging())
+
+    Args:
+        path_log (str): The path of the progress log file
+    """
+    configure_logging(path_log=path_log)
+    return
+
+
+atexit.register(shutdown_logging)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_logging_in_child)
+
+
+# ===================================================================
+# WORKER PROCESSES
+#   - Worker processes (PARALLEL_PROCESSING) are started by 'spawn' instead of 'fork' (the default on Linux)
+#   - A forked child copies locks of other threads (e.g. the listener thread of configure_logging())
+#     in whatever state they are, which may deadlock the child
+#   - Workers receive picklable arguments only (paths, addresses and patterns) and their log records
+#     are not written to the progress log
+#
+WORKER_START_METHOD = 'spawn'
+
+
+def get_worker_context():
+    """Get the multiprocessing context for worker processes (cf. ProcessPoolExecutor(mp_context=...))
+
+    Returns:
+        A multiprocessing context
+    """
+    return multiprocessing.get_context(WORKER_START_METHOD)
 
 
 # ===================================================================
@@ -100,6 +254,9 @@ class CIFTOption(IntEnum):
     """CIFTOption class
     """
     DOWNLOAD_VOICE_DATA = 0x00000001
+    PARALLEL_PROCESSING = 0x00000002  # Use worker processes for parsing large caches
+    CARVE_DELETED_CACHE_ENTRIES = 0x00000004  # Recover cache entries not reachable from the index
+    VERIFY_CACHE_CRC32 = 0x00000008  # Verify simple cache streams by CRC32 (corrupted streams are skipped)
 
 
 # ===================================================================
@@ -143,3 +300,41 @@ SIG_JSON = b'{"'
 SIG_MP4 = b'ftyp'
 SIG_MP3 = b'\xFF\xF3'
 
+
+# ===================================================================
+# SOURCE CONTEXT
+#
+class CIFTSource:
+    """CIFTSource class
+        - The acquired file (a record of 'ACQUIRED_FILE' table) passed from the point of acquisition
+          to parsing handlers, so that handlers do not query the table again (and can run without a DB)
+
+    Attributes:
+        id (int): The id of the record in 'ACQUIRED_FILE' table (-1 if it is not stored)
+        operation (CIFTOperation): The operation
+        src_path (str): The original path (or URL)
+        desc (str): The description
+        saved_path (str): The path of the saved copy
+        timezone (str): The timezone of the local system
+        format (str): The data format (e.g. 'JSON', 'SQLite DB')
+    """
+    __slots__ = ['id', 'operation', 'src_path', 'desc', 'saved_path', 'timezone', 'format']
+
+    # Data formats of client files by their signatures (cf. 'sig' of client file enumerations)
+    FILE_FORMATS = {
+        SIG_SQLITE: "SQLite DB",
+        SIG_XML: "XML",
+        SIG_BINARYCOOKIE: "Binarycookies",
+        SIG_JSON: "JSON"
+    }
+
+    def __init__(self, id, operation, src_path, desc, saved_path, timezone, format):
+        """The constructor
+        """
+        self.id = id
+        self.operation = operation
+        self.src_path = src_path
+        self.desc = desc
+        self.saved_path = saved_path
+        self.timezone = timezone
+        self.format = format
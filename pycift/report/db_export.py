@@ -0,0 +1,166 @@
+"""pycift.report.db_export
+
+    * Description
+        Streaming exporter for result DB tables
+        (CSV, gzip-compressed CSV and JSON Lines, tables are written in parallel threads)
+"""
+
+import csv
+import gzip
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from peewee import *
+from peewee import Func
+
+from pycift.common_defines import *
+
+
+class TableExporter:
+    """TableExporter class
+
+    Attributes:
+        db (SqliteDatabase): The result database (each thread uses its own connection)
+        workers (int): The number of threads
+        prglog_mgr (logging): The progress log manager using the standard Python logging module
+    """
+    # Output formats and their extensions
+    FORMATS = {
+        'csv': '.csv',
+        'csv.gz': '.csv.gz',
+        'jsonl': '.jsonl',
+        'jsonl.gz': '.jsonl.gz'
+    }
+
+    DEFAULT_WORKERS = 4
+
+    def __init__(self, db, workers=None):
+        """The constructor
+        """
+        self.db = db
+        if workers is None:
+            workers = min(self.DEFAULT_WORKERS, os.cpu_count() or 1)
+        self.workers = max(1, workers)
+        self.prglog_mgr = GET_LOGGER(__name__)
+
+    def export(self, tables, base, prefix, formats=('csv',)):
+        """Export tables (empty tables are skipped)
+
+        Args:
+            tables (list): (table name, SelectQuery) pairs
+            base (str): The base directory path
+            prefix (str): The prefix of output file names (e.g. cift_amazon_alexa)
+            formats (tuple): Output formats ('csv', 'csv.gz', 'jsonl' or 'jsonl.gz')
+
+        Returns:
+            A dict of {output path: the number of rows}
+        """
+        jobs = []
+        for fmt in formats:
+            if fmt not in self.FORMATS:
+                self.prglog_mgr.debug("Not supported format (%s)", fmt)
+                continue
+            for name, query in tables:
+                path = '{}/{}_{}{}'.format(base, prefix, name, self.FORMATS[fmt])
+                jobs.append((query, path, fmt))
+
+        results = dict()
+        if len(jobs) == 0:
+            return results
+
+        if self.workers == 1 or len(jobs) == 1:
+            for query, path, fmt in jobs:
+                count = self.export_query(query, path, fmt)
+                if count is not None:
+                    results[path] = count
+            return results
+
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(jobs))) as executor:
+            futures = [(path, executor.submit(self.export_query_in_thread, query, path, fmt))
+                       for query, path, fmt in jobs]
+            for path, future in futures:
+                count = future.result()
+                if count is not None:
+                    results[path] = count
+        return results
+
+    def export_query_in_thread(self, query, path, fmt):
+        """Export a query in a worker thread (the thread's own DB connection is closed at the end)
+
+        Args:
+            query (SelectQuery): The query
+            path (str): The output path
+            fmt (str): The output format
+
+        Returns:
+            The number of rows (int) or None (empty)
+        """
+        try:
+            return self.export_query(query, path, fmt)
+        finally:
+            self.db.close()
+
+    def export_query(self, query, path, fmt):
+        """Export a query by streaming rows from the cursor (constant memory)
+
+        Args:
+            query (SelectQuery): The query
+            path (str): The output path
+            fmt (str): The output format
+
+        Returns:
+            The number of rows (int) or None (empty)
+        """
+        # 'SELECT 1 ... LIMIT 1' instead of len(query) which fetches all rows
+        if not query.exists():
+            return None
+
+        header = self.get_header(query)
+
+        # Rows are read from the DB cursor one by one (not cached by peewee)
+        sql, params = query.sql()
+        rows = self.db.execute_sql(sql, params)
+
+        if fmt.endswith('.gz'):
+            fh = gzip.open(path, "wt", newline="\n", encoding="utf-8")
+        else:
+            fh = open(path, "w", newline="\n", encoding="utf-8")
+
+        count = 0
+        with fh:
+            if fmt.startswith('csv'):
+                writer = csv.writer(fh, delimiter=',', quotechar='"', quoting=csv.QUOTE_MINIMAL)
+                writer.writerow(header)
+                for row in rows:
+                    writer.writerow(row)
+                    count += 1
+            else:
+                for row in rows:
+                    fh.write(json.dumps(dict(zip(header, row)), ensure_ascii=False, default=str))
+                    fh.write("\n")
+                    count += 1
+
+        self.prglog_mgr.info("%s (%d rows)", path, count)
+        return count
+
+    @staticmethod
+    def get_header(query):
+        """Get column names of a query (same as playhouse.csv_utils.dump_csv())
+
+        Args:
+            query (SelectQuery): The query
+
+        Returns:
+            A list of column names
+        """
+        header = []
+        for idx, node in enumerate(query._select):
+            if node._alias:
+                header.append(node._alias)
+            elif isinstance(node, (Field, Func)):
+                header.append(node.name)
+            else:
+                header.append('col_%s' % idx)
+        return header
@@ -8,12 +8,13 @@ import logging
 
 from peewee import *
 from playhouse.sqlite_ext import PrimaryKeyAutoIncrementField
-from playhouse.csv_utils import dump_csv
 logger = logging.getLogger('peewee')
 logger.setLevel(logging.WARNING)
 
 from pycift.common_defines import *
 from pycift.utility.pt_utils import PtUtils
+from pycift.report.db_writer import BulkWriter
+from pycift.report.db_export import TableExporter
 
 # [ References for peewee ]
 # https://peewee.readthedocs.io/en/2.0.2/peewee/fields.html
@@ -237,7 +238,7 @@ class Timeline(Model):
     """
     - TIMELINE (Activities + Cards + Media + Task list + Shopping list + Notifications...)
         date | time | timezone | MACB | source | sourcetype | type | user | host |
-        short | desc | version | filename | inode | notes | format | extra
+        short | desc | version | filename | inode | notes | format | extra | epoch
     """
     date = TextField()
     time = TextField()
@@ -262,9 +263,17 @@ class Timeline(Model):
     format = TextField()
     extra = TextField(default="-")
 
+    # UTC unix milliseconds of 'date' and 'time' (for range queries and sorting)
+    epoch = BigIntegerField(null=True)
+
     class Meta:
         primary_key = False
         db_table = 'TIMELINE'
+        indexes = (
+            (('epoch',), False),
+            (('host', 'epoch'), False),
+            (('user', 'epoch'), False),
+        )
 
 
 class DatabaseManager(object):
@@ -272,16 +281,19 @@ class DatabaseManager(object):
 
     Attributes:
         db (SqliteDatabase): The module for handling SQLite database format
+        writer (BulkWriter): The buffered writer for insert()
+        operation_ids (dict): Cached ids of 'OPERATION' table (a static table)
     """
 
-    def __init__(self, db_path, delete_db=True):
+    def __init__(self, db_path, delete_db=True, batch_size=BulkWriter.DEFAULT_BATCH_SIZE):
         """The constructor
         """
         if CIFT_DEBUG is True and delete_db is True:
             PtUtils.delete_file(db_path)
 
+        # The rollback journal is kept in memory ('OFF' breaks ROLLBACK of explicit transactions)
         self.db = SqliteDatabase(db_path, pragmas=(
-            ('journal_mode', 'OFF'),
+            ('journal_mode', 'MEMORY'),
             ('synchronous', 'OFF')
             # ('cache_size', 10000),
             # ('mmap_size', 1024 * 1024 * 32)
@@ -289,6 +301,8 @@ class DatabaseManager(object):
 
         self.update_database()
         self.db.connect()
+        self.writer = BulkWriter(self.db, batch_size)
+        self.operation_ids = None
 
         # cursor = self.db.get_cursor()
         # # cursor.execute("PRAGMA journal_mode = OFF")
@@ -297,6 +311,7 @@ class DatabaseManager(object):
         # cursor.close()
 
         if len(self.db.get_tables(Operation)) != 0:
+            self.upgrade_tables()
             return
 
         self.db.create_tables([Operation, AcquiredFile,
@@ -333,20 +348,14 @@ class DatabaseManager(object):
         for op in CIFTOperation:
             Operation.create(type=op.name)
 
-    def dump_csv(self, base):
-        """Dump all tables to csv files
+    def get_export_queries(self):
+        """Get queries of all tables to be exported
 
-        Args:
-            base (str): The base directory path
+        Returns:
+            A list of (table name, SelectQuery) pairs
         """
-        # with open('{}/{}.csv'.format(base, Operation._meta.db_table), "w", newline="\n", encoding="utf-8") as fh:
-        #     query = Operation.select()
-        #     dump_csv(query, fh)
-
-        prefix = CIFT_AMAZON_ALEXA
-
         query = AcquiredFile \
-                .select(AcquiredFile.id,
+            .select(AcquiredFile.id,
                     Operation.type.alias('operation_type'),
                     AcquiredFile.src_path,
                     AcquiredFile.desc,
@@ -356,68 +365,154 @@ class DatabaseManager(object):
                     AcquiredFile.modified_timestamp,
                     AcquiredFile.timezone) \
             .join(Operation)
-        if len(query) > 0:
-            path = '{}/{}_{}.csv'.format(base, prefix, AcquiredFile._meta.db_table)
-            with open(path, "w", newline="\n", encoding="utf-8") as fh:
-                dump_csv(query, fh)
-
-        query = Credential.select()
-        if len(query) > 0:
-            path = '{}/{}_{}.csv'.format(base, prefix, Credential._meta.db_table)
-            with open(path, "w", newline="\n", encoding="utf-8") as fh:
-                dump_csv(query, fh)
-
-        query = Account.select()
-        if len(query) > 0:
-            path = '{}/{}_{}.csv'.format(base, prefix, Account._meta.db_table)
-            with open(path, "w", newline="\n", encoding="utf-8") as fh:
-                dump_csv(query, fh)
-
-        query = Contact.select()
-        if len(query) > 0:
-            path = '{}/{}_{}.csv'.format(base, prefix, Contact._meta.db_table)
-            with open(path, "w", newline="\n", encoding="utf-8") as fh:
-                dump_csv(query, fh)
-
-        query = SettingWifi.select()
-        if len(query) > 0:
-            path = '{}/{}_{}.csv'.format(base, prefix, SettingWifi._meta.db_table)
-            with open(path, "w", newline="\n", encoding="utf-8") as fh:
-                dump_csv(query, fh)
-
-        query = SettingMisc.select()
-        if len(query) > 0:
-            path = '{}/{}_{}.csv'.format(base, prefix, SettingMisc._meta.db_table)
-            with open(path, "w", newline="\n", encoding="utf-8") as fh:
-                dump_csv(query, fh)
-
-        query = AlexaDevice.select()
-        if len(query) > 0:
-            path = '{}/{}_{}.csv'.format(base, prefix, AlexaDevice._meta.db_table)
-            with open(path, "w", newline="\n", encoding="utf-8") as fh:
-                dump_csv(query, fh)
-
-        query = CompatibleDevice.select()
-        if len(query) > 0:
-            path = '{}/{}_{}.csv'.format(base, prefix, CompatibleDevice._meta.db_table)
-            with open(path, "w", newline="\n", encoding="utf-8") as fh:
-                dump_csv(query, fh)
-
-        query = Skill.select()
-        if len(query) > 0:
-            path = '{}/{}_{}.csv'.format(base, prefix, Skill._meta.db_table)
-            with open(path, "w", newline="\n", encoding="utf-8") as fh:
-                dump_csv(query, fh)
+
+        return [
+            (AcquiredFile._meta.db_table, query),
+            (Credential._meta.db_table, Credential.select()),
+            (Account._meta.db_table, Account.select()),
+            (Contact._meta.db_table, Contact.select()),
+            (SettingWifi._meta.db_table, SettingWifi.select()),
+            (SettingMisc._meta.db_table, SettingMisc.select()),
+            (AlexaDevice._meta.db_table, AlexaDevice.select()),
+            (CompatibleDevice._meta.db_table, CompatibleDevice.select()),
+            (Skill._meta.db_table, Skill.select()),
+            (Timeline._meta.db_table, Timeline.select())
+        ]
+
+    def export(self, base, formats=('csv',), workers=None):
+        """Export all tables (rows are streamed and tables are written in parallel threads)
+
+        Args:
+            base (str): The base directory path
+            formats (tuple): Output formats ('csv', 'csv.gz', 'jsonl' or 'jsonl.gz')
+            workers (int): The number of threads (None: default)
+
+        Returns:
+            A dict of {output path: the number of rows}
+        """
+        self.writer.flush()
+        exporter = TableExporter(self.db, workers)
+        return exporter.export(self.get_export_queries(), base, CIFT_AMAZON_ALEXA, formats)
+
+    def dump_csv(self, base):
+        """Dump all tables to csv files
+
+        Args:
+            base (str): The base directory path
+        """
+        # Each table used to be fetched twice (len(query) and dump_csv()) one after another
+        self.export(base, ('csv',))
+
+    def upgrade_tables(self):
+        """Upgrade tables of a result DB made by previous versions
+
+            - 'epoch' column and its indexes of 'TIMELINE' table
+              (filled from 'date' and 'time' of existing rows, new rows have the original values)
+        """
+        table = Timeline._meta.db_table
+        if table not in self.db.get_tables():
+            return
+
+        columns = [column.name for column in self.db.get_columns(table)]
+        if 'epoch' in columns:
+            return
+
+        self.db.execute_sql("ALTER TABLE {} ADD COLUMN epoch BIGINT".format(table))
+
+        # Fill the new column using 'date' and 'time' in one statement
+        # ('utc' modifier converts local time of this system, NULL for invalid values)
+        self.db.execute_sql(
+            "UPDATE {} SET epoch = "
+            "CAST(strftime('%s', date || ' ' || substr(time, 1, 8), 'utc') AS INTEGER) * 1000 + "
+            "CAST(substr(time, 10, 3) AS INTEGER)".format(table)
+        )
+
+        for fields, unique in Timeline._meta.indexes:
+            self.db.create_index(Timeline, list(fields), unique)
+
+    def get_timeline(self, start=None, end=None, host=None, user=None, descending=False):
+        """Get timeline records in a time window (using indexes on 'epoch', 'host' and 'user')
+
+        Args:
+            start (int): Unix millisecond time (inclusive, None: unlimited)
+            end (int): Unix millisecond time (exclusive, None: unlimited)
+            host (str): The device (e.g. the serial number of an Alexa device)
+            user (str): The user (e.g. a customer ID)
+            descending (bool): If True, the latest record comes first
+
+        Returns:
+            SelectQuery
+        """
+        self.writer.flush()
 
         query = Timeline.select()
-        if len(query) > 0:
-            path = '{}/{}_{}.csv'.format(base, prefix, Timeline._meta.db_table)
-            with open(path, "w", newline="\n", encoding="utf-8") as fh:
-                dump_csv(query, fh)
+        if host is not None:
+            query = query.where(Timeline.host == host)
+        if user is not None:
+            query = query.where(Timeline.user == user)
+        if start is not None:
+            query = query.where(Timeline.epoch >= start)
+        if end is not None:
+            query = query.where(Timeline.epoch < end)
+
+        return query.order_by(Timeline.epoch.desc() if descending is True else Timeline.epoch.asc())
+
+    def get_operation_id(self, op):
+        """Get the id of an operation (the table is read once and cached)
+
+        Args:
+            op (CIFTOperation): The operation
+
+        Returns:
+            The id (int) or -1
+        """
+        if self.operation_ids is None:
+            self.operation_ids = {record.type: record.id for record in Operation.select()}
+        return self.operation_ids.get(op.name, -1)
+
+    def add_acquired_file(self, **fields):
+        """Insert a record into 'ACQUIRED_FILE' table
+
+        Args:
+            fields (dict): Field names and values (operation_id, src_path, desc, saved_path...)
+
+        Returns:
+            The id of the new record (int)
+        """
+        # The id is returned by the INSERT itself (no more 'ORDER BY id DESC' query)
+        names = BulkWriter.resolve_field_names(AcquiredFile, tuple(fields))
+        return AcquiredFile.insert(**dict(zip(names, fields.values()))).execute()
+
+    def insert(self, model, **fields):
+        """Buffer a row to be written by the bulk writer (use model.create() if the instance is needed)
+
+        Args:
+            model (Model): The target model (e.g. Timeline)
+            fields (dict): Field names and values
+                - 'epoch' of Timeline has to be the original Unix millisecond time of 'date' and 'time'
+                  (parsing 'date' and 'time' is only a fallback, they are ambiguous during a DST transition)
+        """
+        if model is Timeline and fields.get('epoch') is None:
+            fields['epoch'] = PtUtils.convert_str_to_unix_millisecond(fields.get('date'), fields.get('time'))
+        self.writer.add(model, **fields)
+
+    def flush(self):
+        """Write all buffered rows
+            - Rows are written into this DB even if the models are bound to the DB of
+              another DatabaseManager (cf. BulkWriter.bind())
+
+        Returns:
+            The number of written rows (int)
+        """
+        return self.writer.flush()
 
     def close(self):
         """Close this module
 
+        Returns:
+            The number of rows rejected by the database (int, cf. BulkWriter.close())
         """
+        skipped = self.writer.close()
         self.db.close()
+        return skipped
 
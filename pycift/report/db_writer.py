@@ -0,0 +1,241 @@
+"""pycift.report.db_writer
+
+    * Description
+        Buffered writer for result DB models
+        (rows are accumulated per model in insertion order and written with insert_many() inside
+         explicit transactions)
+"""
+
+import logging
+from contextlib import contextmanager
+
+from peewee import *
+
+from pycift.common_defines import *
+
+
+class BulkWriter:
+    """BulkWriter class
+
+    Attributes:
+        db (SqliteDatabase): The result database (rows are always written here, cf. bind())
+        batch_size (int): The number of buffered rows that triggers flush()
+        buffers (dict): Buffered rows per model (in insertion order)
+        shapes (dict): Field name tuples of buffered rows per model
+        pending (int): The number of buffered rows
+        written (int): The number of rows written so far
+        skipped (int): The number of rows rejected by the database so far (e.g. NULL in a NOT NULL column)
+        prglog_mgr (logging): The progress log manager using the standard Python logging module
+    """
+    DEFAULT_BATCH_SIZE = 1000
+
+    # SQLITE_MAX_VARIABLE_NUMBER of SQLite builds before 3.32.0
+    SQLITE_MAX_VARIABLES = 999
+
+    def __init__(self, db, batch_size=DEFAULT_BATCH_SIZE):
+        """The constructor
+        """
+        self.db = db
+        self.batch_size = max(1, batch_size)
+        self.buffers = dict()
+        self.shapes = dict()
+        self.pending = 0
+        self.written = 0
+        self.skipped = 0
+        self.prglog_mgr = GET_LOGGER(__name__)
+
+    def __len__(self):
+        return self.pending
+
+    def add(self, model, **fields):
+        """Buffer a row (replacement of model.create(**fields) when the new instance is not needed)
+
+        Args:
+            model (Model): The target model
+            fields (dict): Field names and values
+        """
+        # One buffer per model keeps the insertion order of rows (= the order of create() calls)
+        rows = self.buffers.get(model)
+        if rows is None:
+            rows = self.buffers[model] = []
+            self.shapes[model] = set()
+        rows.append(fields)
+        self.shapes[model].add(tuple(fields))
+
+        self.pending += 1
+        if self.pending >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Write all buffered rows in a transaction
+
+        Returns:
+            The number of written rows (int)
+        """
+        if self.pending == 0:
+            return 0
+
+        buffers = self.buffers
+        shapes = self.shapes
+        self.buffers = dict()
+        self.shapes = dict()
+        self.pending = 0
+
+        skipped = self.skipped
+        count = 0
+        with self.db.atomic():
+            for model, rows in buffers.items():
+                rows = self.normalize_rows(model, rows, shapes[model])
+                with self.bind(model):
+                    count += self.write_rows(model, rows, len(rows[0]))
+
+        self.written += count
+        self.prglog_mgr.debug("%d rows", count)
+        if self.skipped > skipped:
+            self.prglog_mgr.warning("%d rows skipped (%d rows skipped so far)", self.skipped - skipped, self.skipped)
+        return count
+
+    @contextmanager
+    def bind(self, model):
+        """Bind a model to the database of this writer temporarily
+            - Models are shared by all DatabaseManager instances, and their 'database' member
+              refers to the database bound last (cf. DatabaseManager.update_database())
+
+        Args:
+            model (Model): The target model
+        """
+        database = model._meta.database
+        model._meta.database = self.db
+        try:
+            yield
+        finally:
+            model._meta.database = database
+
+    @classmethod
+    def normalize_rows(cls, model, rows, shapes):
+        """Make buffered rows of a model share the same field names (in the same order)
+            - Column names are resolved to field names
+            - Missing fields are filled with their default values (None if there is no default value)
+
+        Args:
+            model (Model): The target model
+            rows (list of dict): Buffered rows
+            shapes (set): Field (or column) name tuples of the rows
+
+        Returns:
+            A list of rows (dict)
+        """
+        resolved = {shape: cls.resolve_field_names(model, shape) for shape in shapes}
+
+        if len(shapes) == 1:
+            shape, field_names = resolved.popitem()
+            if field_names == shape:
+                return rows
+            return [dict(zip(field_names, row.values())) for row in rows]
+
+        # Field names in the order of the model
+        used = set()
+        for field_names in resolved.values():
+            used.update(field_names)
+        names = [field.name for field in model._meta.sorted_fields if field.name in used]
+        names += sorted(used.difference(names))  # Unknown names are reported by insert_many()
+
+        result = []
+        for row in rows:
+            values = dict(zip(resolved[tuple(row)], row.values()))
+            result.append({name: values[name] if name in values else cls.get_default(model, name)
+                           for name in names})
+        return result
+
+    @staticmethod
+    def get_default(model, name):
+        """Get the default value of a field
+
+        Args:
+            model (Model): The target model
+            name (str): The field name
+
+        Returns:
+            The default value or None
+        """
+        field = model._meta.fields.get(name)
+        if field is None or field.default is None:
+            return None
+        return field.default() if callable(field.default) else field.default
+
+    @staticmethod
+    def resolve_field_names(model, names):
+        """Resolve column names accepted by model.create() (e.g. 'source_id') to field names ('source')
+
+        Args:
+            model (Model): The target model
+            names (tuple): Field or column names
+
+        Returns:
+            Field names (tuple)
+        """
+        fields = model._meta.fields
+        columns = model._meta.columns
+        return tuple(name if name in fields or name not in columns else columns[name].name for name in names)
+
+    def write_rows(self, model, rows, num_fields):
+        """Write rows of a model with multi-row INSERT statements (within the current transaction)
+
+        Args:
+            model (Model): The target model
+            rows (list of dict): Rows sharing the same field names
+            num_fields (int): The number of fields per row
+
+        Returns:
+            The number of written rows (int)
+        """
+        # Fields having default values are added to each row by peewee
+        num_columns = max(num_fields, len(model._meta.fields))
+        step = max(1, self.SQLITE_MAX_VARIABLES // num_columns)
+        count = 0
+
+        for idx in range(0, len(rows), step):
+            chunk = rows[idx: idx + step]
+            try:
+                with self.db.atomic():
+                    model.insert_many(chunk).execute()
+                count += len(chunk)
+            except DatabaseError:
+                # Fall back to row by row inserts, so that one invalid row does not discard the chunk
+                count += self.write_rows_one_by_one(model, chunk)
+
+        return count
+
+    def write_rows_one_by_one(self, model, rows):
+        """Write rows one by one, skipping (and counting) invalid rows (e.g. NULL in a NOT NULL column)
+
+        Args:
+            model (Model): The target model
+            rows (list of dict): Rows to be written
+
+        Returns:
+            The number of written rows (int)
+        """
+        count = 0
+        for row in rows:
+            try:
+                with self.db.atomic():
+                    model.insert(**row).execute()
+                count += 1
+            except DatabaseError as exception:
+                # Rejected rows are logged in full, since they are not in the result DB
+                self.skipped += 1
+                self.prglog_mgr.warning("Skipped a row of %s (%s): %r", model._meta.db_table, exception, row)
+        return count
+
+    def close(self):
+        """Write all buffered rows and report rows rejected by the database
+
+        Returns:
+            The number of skipped rows (int)
+        """
+        self.flush()
+        if self.skipped > 0:
+            self.prglog_mgr.error("%d of %d rows were not written to the result DB (see the warnings above)",
+                                  self.skipped, self.written + self.skipped)
+        return self.skipped
@@ -8,23 +8,85 @@
 """
 
 import logging
-from struct import unpack
-from io import StringIO, BytesIO
+import struct
 from time import strftime, gmtime
 from pycift.common_defines import *
 
 
+class BinaryCookieRecord:
+    """BinaryCookieRecord class
+        - A structure for storing a cookie of a binarycookie file
+
+    Attributes:
+        domain (str): The domain
+        name (str): The cookie name
+        path (str): The cookie path
+        value (str): The cookie value
+        flags (int): The cookie flags (b(1): Secure, b(3): HttpOnly)
+        expiry_time (float): Unix time of expiry
+        creation_time (float): Unix time of creation
+    """
+    __slots__ = ['domain', 'name', 'path', 'value', 'flags', 'expiry_time', 'creation_time']
+
+    FLAG_NAMES = {
+        0: '',
+        1: 'Secure',
+        4: 'HttpOnly',
+        5: 'Secure | HttpOnly'
+    }
+
+    def __init__(self, domain, name, path, value, flags, expiry_time, creation_time):
+        """The constructor
+        """
+        self.domain = domain
+        self.name = name
+        self.path = path
+        self.value = value
+        self.flags = flags
+        self.expiry_time = expiry_time
+        self.creation_time = creation_time
+
+    @property
+    def flag_names(self):
+        """The cookie flags as a string (e.g. 'Secure | HttpOnly')"""
+        return self.FLAG_NAMES.get(self.flags, 'Unknown')
+
+    @property
+    def expiry_date(self):
+        """The expiry date (YYYY-MM-DD hh:mm:ss, UTC)"""
+        return strftime("%Y-%m-%d %H:%M:%S", gmtime(self.expiry_time))
+
+    @property
+    def creation_date(self):
+        """The creation date (YYYY-MM-DD hh:mm:ss, UTC)"""
+        return strftime("%Y-%m-%d %H:%M:%S", gmtime(self.creation_time))
+
+
 class BinaryCookie:
     """BinaryCookie class
 
     Attributes:
-        cookie_list (list): A list of cookie entries
+        cookie_list (list): A list of (domain, values) per page ('"name": "value",\\n' pairs)
+        cookies (list): A list of BinaryCookieRecord instances
         prglog_mgr (logging): The progress log manager using the standard Python logging module
     """
+    # Magic + number of pages (big-endian)
+    FILE_HEADER = struct.Struct('>4sI')
+
+    # Page header (00000100) + number of cookies
+    PAGE_HEADER = struct.Struct('<4sI')
+
+    # Size, unknown, flags, unknown, offsets of domain, name, path and value, end of cookie,
+    # expiry and creation time (Mac epoch)
+    COOKIE_HEADER = struct.Struct('<IIIIIIII8xdd')
+
+    # Unix time of 2001-01-01 (Mac epoch)
+    MAC_EPOCH = 978307200
 
     def __init__(self):
         self.cookie_list = []
-        self.prglog_mgr = logging.getLogger(__name__)
+        self.cookies = []
+        self.prglog_mgr = GET_LOGGER(__name__)
 
     def parse(self, file_path):
         """Parse a binarycookie file
@@ -32,118 +94,151 @@ class BinaryCookie:
         Args:
             file_path (str): The full path of the target file
         """
-        self.prglog_mgr.info("{}(): Parsing cache entries in \"{}\"".format(GET_MY_NAME(), file_path))
+        self.prglog_mgr.info("Parsing cache entries in \"%s\"", file_path)
 
         try:
-            file_object = open(file_path, 'rb')
+            with open(file_path, 'rb') as file_object:
+                data = file_object.read()
         except IOError as exception:
-            self.prglog_mgr.debug("{}(): Exception occurred".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("Exception occurred")
             return False
 
-        file_header = file_object.read(4)  # Magic ('cook')
-        if file_header != SIG_BINARYCOOKIE:
-            self.prglog_mgr.debug("{}(): Not a Cookies.binarycookie file".format(GET_MY_NAME()))
-            return False
+        return self.parse_data(data)
 
-        num_pages = unpack('>i', file_object.read(4))[0]  # Number of pages in the binary file: 4 bytes
+    def parse_data(self, data):
+        """Parse binarycookie data
 
-        page_sizes = []
-        for np in range(num_pages):
-            page_sizes.append(unpack('>i', file_object.read(4))[0])  # Each page size: 4 bytes*number of pages
+        Args:
+            data (bytes): The content of a binarycookie file
 
-        pages = []
-        for ps in page_sizes:
-            pages.append(file_object.read(ps))  # Grab individual pages and each page will contain >= one cookie
+        Returns:
+            True or False
+        """
+        if data[0:4] != SIG_BINARYCOOKIE:
+            self.prglog_mgr.debug("Not a Cookies.binarycookie file")
+            return False
 
-        for page in pages:
-            page = BytesIO(page)  # Converts the string to a file. So that we can use read/write operations easily.
-            page.read(4)  # page header: 4 bytes: Always 00000100
-            # Number of cookies in each page, first 4 bytes after the page header in every page.
-            num_cookies = unpack('<i', page.read(4))[0]
+        for page in self.iter_pages(data):
+            domain = ""
+            values = []
 
-            cookie_offsets = []
-            for nc in range(num_cookies):
-                # Every page contains >= one cookie. Fetch cookie starting point from page starting byte
-                cookie_offsets.append(unpack('<i', page.read(4))[0])
+            for cookie in page:
+                self.cookies.append(cookie)
+                domain = cookie.domain
+                values.append("\"{}\": \"{}\"".format(cookie.name, cookie.value))
 
-            page.read(4)  # end of page header: Always 00000000
+            self.cookie_list.append((domain, ",\n".join(values)))
 
-            cookie = ""
-            domain = ""
-            values = ""
-
-            for offset in cookie_offsets:
-                page.seek(offset)  # Move the page pointer to the cookie starting point
-                cookiesize = unpack('<i', page.read(4))[0]  # fetch cookie size
-                cookie = BytesIO(page.read(cookiesize))  # read the complete cookie
-
-                cookie.read(4)  # unknown
-
-                cookie_flags = ''
-                flags = unpack('<i', cookie.read(4))[0]
-                if flags == 0:
-                    cookie_flags = ''
-                elif flags == 1:
-                    cookie_flags = 'Secure'
-                elif flags == 4:
-                    cookie_flags = 'HttpOnly'
-                elif flags == 5:
-                    cookie_flags = 'Secure | HttpOnly'
-                else:
-                    cookie_flags = 'Unknown'
-
-                cookie.read(4)  # unknown
-
-                urloffset = unpack('<i', cookie.read(4))[0]  # cookie domain offset from cookie starting point
-                nameoffset = unpack('<i', cookie.read(4))[0]  # cookie name offset from cookie starting point
-                pathoffset = unpack('<i', cookie.read(4))[0]  # cookie path offset from cookie starting point
-                valueoffset = unpack('<i', cookie.read(4))[0]  # cookie value offset from cookie starting point
-
-                endofcookie = cookie.read(8)  # end of cookie
-
-                # Expiry date is in Mac epoch format: Starts from 1/Jan/2001
-                expiry_date_epoch = unpack('<d', cookie.read(8))[0] + 978307200
-                # 978307200 is unix epoch of  1/Jan/2001 //[:-1] strips the last space
-                # expiry_date = strftime("%a, %d %b %Y ", gmtime(expiry_date_epoch))[:-1]
-                expiry_date = strftime("%Y-%m-%d %H:%M:%S", gmtime(expiry_date_epoch))
-                # Cookies creation time
-                create_date_epoch = unpack('<d', cookie.read(8))[0] + 978307200
-                # create_date = strftime("%a, %d %b %Y ", gmtime(create_date_epoch))[:-1]
-                create_date = strftime("%Y-%m-%d %H:%M:%S", gmtime(create_date_epoch))
-
-                cookie.seek(urloffset - 4)  # fetch domain value from url offset
-                url = ''
-                u = cookie.read(1)
-                while unpack('<b', u)[0] != 0:
-                    url = url + u.decode("utf-8")
-                    u = cookie.read(1)
-
-                cookie.seek(nameoffset - 4)  # fetch cookie name from name offset
-                name = ''
-                n = cookie.read(1)
-                while unpack('<b', n)[0] != 0:
-                    name = name + n.decode("utf-8")
-                    n = cookie.read(1)
-
-                cookie.seek(pathoffset - 4)  # fetch cookie path from path offset
-                path = ''
-                pa = cookie.read(1)
-                while unpack('<b', pa)[0] != 0:
-                    path = path + pa.decode("utf-8")
-                    pa = cookie.read(1)
-
-                cookie.seek(valueoffset - 4)  # fetch cookie value from value offset
-                value = ''
-                va = cookie.read(1)
-                while unpack('<b', va)[0] != 0:
-                    value = value + va.decode("utf-8")
-                    va = cookie.read(1)
-
-                domain = url
-                values += "\"{}\": \"{}\",\n".format(name, value)
-
-            self.cookie_list.append((domain, values[:-2]))
-
-        file_object.close()
         return True
 
+    @classmethod
+    def iter_pages(cls, data):
+        """Iterate pages of binarycookie data
+
+        Args:
+            data (bytes): The content of a binarycookie file
+
+        Yields:
+            A list of BinaryCookieRecord instances (a page)
+        """
+        if len(data) < cls.FILE_HEADER.size:
+            return
+
+        magic, num_pages = cls.FILE_HEADER.unpack_from(data)
+        offset = cls.FILE_HEADER.size
+
+        if offset + num_pages * 4 > len(data):
+            return
+
+        page_sizes = struct.unpack_from('>{}I'.format(num_pages), data, offset)
+        offset += num_pages * 4
+
+        for page_size in page_sizes:
+            end = min(offset + page_size, len(data))
+            yield list(cls.iter_cookies(data, offset, end))
+            offset += page_size
+
+    @classmethod
+    def iter_cookies(cls, data, start, end):
+        """Iterate cookies of a page (offsets are resolved within the whole data without copying pages)
+
+        Args:
+            data (bytes): The content of a binarycookie file
+            start (int): The offset of the page
+            end (int): The end of the page
+
+        Yields:
+            A cookie (BinaryCookieRecord)
+        """
+        if start + cls.PAGE_HEADER.size > end:
+            return
+
+        _, num_cookies = cls.PAGE_HEADER.unpack_from(data, start)
+        if cls.PAGE_HEADER.size + num_cookies * 4 > end - start:
+            return
+
+        cookie_offsets = struct.unpack_from('<{}I'.format(num_cookies), data, start + cls.PAGE_HEADER.size)
+
+        for offset in cookie_offsets:
+            offset += start
+            if offset + cls.COOKIE_HEADER.size > end:
+                continue
+
+            size, _, flags, _, domain_offset, name_offset, path_offset, value_offset, \
+                expiry_time, creation_time = cls.COOKIE_HEADER.unpack_from(data, offset)
+
+            cookie_end = min(offset + size, end)
+
+            yield BinaryCookieRecord(
+                domain=cls.read_string(data, offset + domain_offset, cookie_end),
+                name=cls.read_string(data, offset + name_offset, cookie_end),
+                path=cls.read_string(data, offset + path_offset, cookie_end),
+                value=cls.read_string(data, offset + value_offset, cookie_end),
+                flags=flags,
+                expiry_time=expiry_time + cls.MAC_EPOCH,
+                creation_time=creation_time + cls.MAC_EPOCH
+            )
+
+    @staticmethod
+    def read_string(data, start, end):
+        """Read a NULL terminated string within a cookie
+
+        Args:
+            data (bytes): The content of a binarycookie file
+            start (int): The offset of the string
+            end (int): The end of the cookie
+
+        Returns:
+            The string (str)
+        """
+        stop = data.find(b'\x00', start, end)
+        if stop == -1:
+            stop = end
+        return data[start: stop].decode("utf-8", "replace")
+
+    @classmethod
+    def iter_files(cls, file_paths):
+        """Iterate cookies of binarycookie files (e.g. files of many iOS extractions)
+
+        Args:
+            file_paths (iterable): Full paths of binarycookie files
+
+        Yields:
+            (str, BinaryCookieRecord): The file path and a cookie
+        """
+        prglog_mgr = GET_LOGGER(__name__)
+
+        for file_path in file_paths:
+            try:
+                with open(file_path, 'rb') as file_object:
+                    data = file_object.read()
+            except IOError:
+                prglog_mgr.debug("Unable to open %s", file_path)
+                continue
+
+            if data[0:4] != SIG_BINARYCOOKIE:
+                continue
+
+            for page in cls.iter_pages(data):
+                for cookie in page:
+                    yield file_path, cookie
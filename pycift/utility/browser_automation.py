@@ -51,7 +51,7 @@ class BrowserAutomation:
         self.executable_path = ""
 
         # Progress logging manager
-        self.prglog_mgr = logging.getLogger(__name__)
+        self.prglog_mgr = GET_LOGGER(__name__)
 
         if sys.platform == "win32":
             if self.driver is CIFTBrowserDrive.PHANTOMJS:
@@ -78,7 +78,7 @@ class BrowserAutomation:
             headers = {}
 
         if not isinstance(headers, dict):
-            self.prglog_mgr.info("{}(): 'headers' must be dict, so it will be ignored".format(GET_MY_NAME()))
+            self.prglog_mgr.info("'headers' must be dict, so it will be ignored")
 
         self.headers = headers
 
@@ -141,7 +141,7 @@ class BrowserAutomation:
         """Create a virtual display
 
         """
-        self.prglog_mgr.info("{}()".format(GET_MY_NAME()))
+        self.prglog_mgr.info("")
 
         # display = Display(visible=1, size=(1920, 1280))
         display = Display(visible=0, size=(1024, 768))
@@ -176,7 +176,7 @@ class BrowserAutomation:
 
         """
         if self.browser is None:
-            self.prglog_mgr.debug("{}(): Exception - a WebDriver should be created".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("Exception - a WebDriver should be created")
         else:
             self.cookies = {}
             for item in self.browser.get_cookies():
@@ -192,18 +192,18 @@ class BrowserAutomation:
             True or False
         """
         if self.browser is None:
-            self.prglog_mgr.debug("{}(): Exception - a WebDriver should be created".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("Exception - a WebDriver should be created")
             return False
 
-        self.prglog_mgr.info("{}(): URL({})".format(GET_MY_NAME(), url))
+        self.prglog_mgr.info("URL(%s)", url)
 
         try:
             self.browser.get(url)
         except TimeoutException as e:
-            self.prglog_mgr.debug("{}(): TimeoutException".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("TimeoutException")
             return False
         except Exception as e:
-            self.prglog_mgr.debug("{}(): An exception occurred".format(GET_MY_NAME(), url))
+            self.prglog_mgr.debug("An exception occurred")
             return False
 
         time.sleep(0.5)
@@ -219,7 +219,7 @@ class BrowserAutomation:
         Returns:
             Bytes of returned messages (or None)
         """
-        self.prglog_mgr.info("{}(): URL({})".format(GET_MY_NAME(), url))
+        self.prglog_mgr.info("URL(%s)", url)
         cookies = {}
 
         if cc is None and self.cookies != {}:
@@ -233,11 +233,11 @@ class BrowserAutomation:
         try:
             r = requests.get(url, headers=self.headers, cookies=cookies, timeout=5)
         except Exception as e:
-            self.prglog_mgr.debug("{}(): Exception({})".format(GET_MY_NAME(), e))
+            self.prglog_mgr.debug("Exception(%s)", e)
             return False
 
         if r.status_code != 200:
-            self.prglog_mgr.debug("{}(): Status code {}({})".format(GET_MY_NAME(), r.status_code, r.reason))
+            self.prglog_mgr.debug("Status code %s(%s)", r.status_code, r.reason)
             return None
 
         return r.content
@@ -252,7 +252,7 @@ class BrowserAutomation:
         Returns:
             text of returned messages (or None)
         """
-        self.prglog_mgr.info("{}(): URL({})".format(GET_MY_NAME(), url))
+        self.prglog_mgr.info("URL(%s)", url)
         cookies = {}
 
         if cc is None and self.cookies != {}:
@@ -269,11 +269,11 @@ class BrowserAutomation:
         try:
             r = requests.get(url, headers=self.headers, cookies=cookies, timeout=5)
         except Exception as e:
-            self.prglog_mgr.debug("{}(): Exception({})".format(GET_MY_NAME(), e))
+            self.prglog_mgr.debug("Exception(%s)", e)
             return False
 
         if r.status_code != 200:
-            self.prglog_mgr.debug("{}(): Status code {}({})".format(GET_MY_NAME(), r.status_code, r.reason))
+            self.prglog_mgr.debug("Status code %s(%s)", r.status_code, r.reason)
             return None
 
         try:
@@ -293,7 +293,7 @@ class BrowserAutomation:
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): URL({})".format(GET_MY_NAME(), url))
+        self.prglog_mgr.info("URL(%s)", url)
 
         cookies = {}
 
@@ -306,11 +306,11 @@ class BrowserAutomation:
         try:
             r = requests.get(url, cookies=cookies, timeout=5)
         except Exception as e:
-            self.prglog_mgr.debug("{}(): Exception({})".format(GET_MY_NAME(), e))
+            self.prglog_mgr.debug("Exception(%s)", e)
             return False
 
         if r.status_code != 200:
-            self.prglog_mgr.debug("{}(): Status code {}({})".format(GET_MY_NAME(), r.status_code, r.reason))
+            self.prglog_mgr.debug("Status code %s(%s)", r.status_code, r.reason)
             return False
 
         with open(outfile, 'wb') as f:
@@ -339,7 +339,7 @@ class BrowserAutomation:
         Returns:
             True or False
         """
-        self.prglog_mgr.info("{}(): PATH({})".format(GET_MY_NAME(), extension_path))
+        self.prglog_mgr.info("PATH(%s)", extension_path)
 
         import string
         import zipfile
@@ -351,11 +351,11 @@ class BrowserAutomation:
             add_or_modify_headers = {}
 
         if not isinstance(remove_headers, list):
-            self.prglog_mgr.debug("{}(): remove_headers must be a list".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("remove_headers must be a list")
             return False
 
         if not isinstance(add_or_modify_headers, dict):
-            self.prglog_mgr.debug("{}(): add_or_modify_headers must be dict".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("add_or_modify_headers must be dict")
             return False
 
         # Only keeping the unique key in remove_headers list
@@ -11,9 +11,15 @@
 """
 
 import os
+import sys
+import mmap
+import array
 import logging
+import struct
 import construct
 import re
+from concurrent.futures import ProcessPoolExecutor
+from pycift.utility.chromium_response_info import HttpResponseInfo
 from pycift.common_defines import *
 
 
@@ -29,6 +35,8 @@ class AddressEntry:
         filename (str): The name of the data file
         initialized (bool): If True, this cache is initialized
     """
+    __slots__ = ['value', 'block_number', 'block_offset', 'block_size', 'filename', 'initialized']
+
     FILE_TYPE_SEPARATE = 0
     FILE_TYPE_BLOCK_RANKINGS = 1
     FILE_TYPE_BLOCK_256 = 2
@@ -46,6 +54,9 @@ class AddressEntry:
         0, 36, 256, 1024, 4096
     ]
 
+    # Names of block files (data_0 ~ data_255) built once instead of per address
+    BLOCK_DATA_FILE_NAMES = ['data_{0}'.format(file_id) for file_id in range(256)]
+
     def __init__(self, address):
         """The constructor
 
@@ -69,7 +80,7 @@ class AddressEntry:
             self.filename = 'f_{0:06x}'.format(file_id)
         elif file_type in self.BLOCK_DATA_FILE_TYPES:
             file_id = ((address & 0x00FF0000) >> 16)
-            self.filename = 'data_{0}'.format(file_id)
+            self.filename = self.BLOCK_DATA_FILE_NAMES[file_id]
             file_block_size = self.FILE_TYPE_BLOCK_SIZES[file_type]
             self.block_number = address & 0x0000FFFF
             self.block_offset = 0x2000 + (self.block_number * file_block_size)
@@ -84,6 +95,7 @@ class IndexFile:
         file_object: The file object (the current index file)
         version (str): The index file version
         creation_time (int): The timestamp
+        table_size (int): The number of buckets of the index table
         index_table (list): The list of indexed cache entries
         prglog_mgr (logging): The progress log manager using the standard Python logging module
     """
@@ -128,8 +140,9 @@ class IndexFile:
         self.file_object = None
         self.version = None
         self.creation_time = None
+        self.table_size = None
         self.index_table = []
-        self.prglog_mgr = logging.getLogger(__name__)
+        self.prglog_mgr = GET_LOGGER(__name__)
 
     def open(self, path_file):
         """Open and process an index file
@@ -145,7 +158,7 @@ class IndexFile:
         try:
             self.file_object = open(path_file, 'rb')
         except IOError as exception:
-            self.prglog_mgr.debug("{}(): Cannot open the file ({})".format(GET_MY_NAME(), path_file))
+            self.prglog_mgr.debug("Cannot open the file (%s)", path_file)
             return False
 
         self.file_object.seek(0, os.SEEK_SET)
@@ -166,12 +179,12 @@ class IndexFile:
 
         try:
             header = self.FILE_HEADER.parse_stream(self.file_object)
-        except construct.FieldError as exception:
-            self.prglog_mgr.debug("{}(): Unable to parse the file header".format(GET_MY_NAME()))
+        except construct.ConstructError as exception:  # e.g. a truncated file (StreamError)
+            self.prglog_mgr.debug("Unable to parse the file header")
             return False
 
         if header.get('signature') != self.SIGNATURE:
-            self.prglog_mgr.debug("{}(): Invalid signature".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("Invalid signature")
             return False
 
         self.version = '{0:d}.{1:d}'.format(
@@ -179,10 +192,11 @@ class IndexFile:
         )
 
         if self.version not in ['2.0', '2.1']:
-            self.prglog_mgr.debug("{}(): Unsupported version".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("Unsupported version")
             return False
 
         self.creation_time = header.get('creation_time')
+        self.table_size = header.get('table_size')
         return True
 
     def process_index_table(self):
@@ -193,19 +207,24 @@ class IndexFile:
         """
         # self.prglog_mgr.info("{}()".format(GET_MY_NAME()))
 
-        bytes4 = self.file_object.read(4)
-
-        while len(bytes4) == 4:
-            # address = construct.ULInt32('address').parse(bytes4)
-            address = construct.Int32ul.parse(bytes4)
-            if address > 0:
-                address_entry = AddressEntry(address)
-                if address_entry.filename != "":
-                    self.index_table.append(address_entry)
-                else:
-                    self.prglog_mgr.debug("{}(): Invalid index entry {0:X}".format(GET_MY_NAME(), address))
-
-            bytes4 = self.file_object.read(4)
+        # Read the whole table at once and decode it as an array of little-endian 32-bit addresses
+        if self.table_size:
+            data = self.file_object.read(self.table_size * 4)
+        else:
+            data = self.file_object.read()
+
+        table = array.array('I')
+        table.frombytes(data[:len(data) - (len(data) % 4)])
+        if sys.byteorder == 'big':
+            table.byteswap()
+
+        # Only live (non-zero) addresses become AddressEntry objects
+        for address in filter(None, table):
+            address_entry = AddressEntry(address)
+            if address_entry.filename != "":
+                self.index_table.append(address_entry)
+            else:
+                self.prglog_mgr.debug("Invalid index entry %X", address)
 
     def close(self):
         """Close this object
@@ -220,24 +239,81 @@ class IndexFile:
 class MainCacheEntry:
     """MainCacheEntry class
         - A structure for storing Chromium's main disk cache entry
+        - Addresses are kept as raw integers, and AddressEntry views are created on access
     """
+    __slots__ = [
+        'hash', '_next_address', '_rankings_node_address', 'reuse_count', 'refetch_count', 'state',
+        'creation_time', 'key_size', 'long_key_address', 'data_stream_sizes', '_data_stream_addresses',
+        'flags', 'self_hash', 'key', 'response_info', 'recovered', 'allocated'
+    ]
+
     def __init__(self):
         """The constructor
         """
         self.hash = None
-        self.next_address = None
-        self.rankings_node_address = None
+        self._next_address = None
+        self._rankings_node_address = None
         self.reuse_count = None
         self.refetch_count = None
         self.state = None
         self.creation_time = None
         self.key_size = None
         self.long_key_address = None
-        self.data_stream_sizes = []
-        self.data_stream_addresses = []
+        self.data_stream_sizes = ()
+        self._data_stream_addresses = ()
         self.flags = None
         self.self_hash = None
         self.key = None  # Usually URL address
+        self.response_info = None  # HttpResponseInfo (stream 0), cf. ChromiumMainCache.get_response_info()
+        self.recovered = False  # True if carved from a data file (not reachable from the index table)
+        self.allocated = None  # For recovered entries, False if the block is free (= deleted or evicted)
+
+    @staticmethod
+    def _to_address(address_entry):
+        return address_entry.value if isinstance(address_entry, AddressEntry) else address_entry
+
+    @property
+    def next_address(self):
+        if self._next_address is None:
+            return None
+        return AddressEntry(self._next_address)
+
+    @next_address.setter
+    def next_address(self, address_entry):
+        self._next_address = self._to_address(address_entry)
+
+    @property
+    def rankings_node_address(self):
+        if self._rankings_node_address is None:
+            return None
+        return AddressEntry(self._rankings_node_address)
+
+    @rankings_node_address.setter
+    def rankings_node_address(self, address_entry):
+        self._rankings_node_address = self._to_address(address_entry)
+
+    @property
+    def data_stream_addresses(self):
+        """AddressEntry views of data stream addresses (0 for unused streams)"""
+        return [self.get_data_stream_address(idx) for idx in range(len(self._data_stream_addresses))]
+
+    @data_stream_addresses.setter
+    def data_stream_addresses(self, address_entries):
+        self._data_stream_addresses = tuple(self._to_address(address_entry) for address_entry in address_entries)
+
+    def get_data_stream_address(self, idx):
+        """Get the address of a data stream
+
+        Args:
+            idx (int): The stream index
+
+        Returns:
+            An instance of AddressEntry or 0 (unused stream)
+        """
+        address = self._data_stream_addresses[idx]
+        if address == 0x00000000:
+            return 0
+        return AddressEntry(address)
 
 
 class DataFile:
@@ -246,13 +322,17 @@ class DataFile:
         - Parsing the 'data_0~3' files having cache entries
 
     Attributes:
-        file_object: The file object (the current index file)
+        file_object: The file object (the current data file)
+        map_object (mmap): The read-only memory map of the current data file
         version (str): The index file version
         block_size (int): The block size
         number_of_entries (int): The number of entries
+        updating (int): Non-zero if the file was not closed cleanly (the allocation map may be stale)
+        allocation_map (bytes): The bitmap of allocated blocks
         prglog_mgr (logging): The progress log manager using the standard Python logging module
     """
     SIGNATURE = 0xC104CAC3
+    BLOCK_HEADER_SIZE = 0x2000
 
     # FILE_HEADER = construct.Struct(
     #     'chrome_cache_data_file_header',
@@ -285,20 +365,32 @@ class DataFile:
         construct.Array(5, 'user' / construct.Int32ul)
     )
 
+    # The fixed part (96 bytes) of a cache entry, compiled once and shared by all entries
+    #   hash, next_address, rankings_node_address, reuse_count, refetch_count, state, creation_time,
+    #   key_size, long_key_address, data_stream_sizes[4], data_stream_addresses[4], flags, (16), self_hash
+    CACHE_ENTRY = struct.Struct('<6IQ2I4I4II16xI')
+
+    # The leading 'hash' and 'next_address' of a cache entry (for walking hash chains)
+    CACHE_ENTRY_LINK = struct.Struct('<2I')
+
     def __init__(self):
         """The constructor
         """
         self.file_object = None
+        self.map_object = None
         self.version = None
         self.block_size = None
         self.number_of_entries = None
-        self.prglog_mgr = logging.getLogger(__name__)
+        self.updating = None
+        self.allocation_map = b''
+        self.prglog_mgr = GET_LOGGER(__name__)
 
-    def open(self, path_file):
+    def open(self, path_file, block_file=True):
         """Open and process a data file
 
         Args:
             path_file (str): The full path of the target file
+            block_file (bool): If False, the file is a separate data file (f_XXXXXX) without a header
 
         Returns:
             True or False
@@ -308,13 +400,18 @@ class DataFile:
         try:
             self.file_object = open(path_file, 'rb')
         except IOError as exception:
-            self.prglog_mgr.debug("{}(): Cannot open the file ({})".format(GET_MY_NAME(), path_file))
+            self.prglog_mgr.debug("Cannot open the file (%s)", path_file)
             return False
 
         self.file_object.seek(0, os.SEEK_SET)
-        if self.process_file_header() is False:
+        if block_file is True and self.process_file_header() is False:
             return False
 
+        try:
+            self.map_object = mmap.mmap(self.file_object.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError) as exception:
+            self.map_object = None  # An empty file or mmap is not available -> use the file object
+
         return True
 
     def process_file_header(self):
@@ -327,12 +424,12 @@ class DataFile:
 
         try:
             header = self.FILE_HEADER.parse_stream(self.file_object)
-        except construct.FieldError as exception:
-            self.prglog_mgr.debug("{}(): Unable to parse the file header".format(GET_MY_NAME()))
+        except construct.ConstructError as exception:  # e.g. a truncated file (StreamError)
+            self.prglog_mgr.debug("Unable to parse the file header")
             return False
 
         if header.get('signature') != self.SIGNATURE:
-            self.prglog_mgr.debug("{}(): Invalid signature".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("Invalid signature")
             return False
 
         self.version = '{0:d}.{1:d}'.format(
@@ -340,11 +437,15 @@ class DataFile:
         )
 
         if self.version not in ['2.0', '2.1']:
-            self.prglog_mgr.debug("{}(): Unsupported version".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("Unsupported version")
             return False
 
         self.block_size = header.get('block_size')
         self.number_of_entries = header.get('number_of_entries')
+        self.updating = header.get('updating')
+
+        # The allocation map fills the rest of the block file header
+        self.allocation_map = self.file_object.read(self.BLOCK_HEADER_SIZE - self.FILE_HEADER.sizeof())
         return True
 
     def process_cache_entry(self, address_entry):
@@ -360,85 +461,152 @@ class DataFile:
         #     GET_MY_NAME(), address_entry.block_offset, address_entry.filename)
         # )
 
-        self.file_object.seek(address_entry.block_offset, os.SEEK_SET)
-
-        # CACHE_ENTRY = construct.Struct(
-        #     'chrome_cache_entry',
-        #     construct.ULInt32('hash'),
-        #     construct.ULInt32('next_address'),
-        #     construct.ULInt32('rankings_node_address'),
-        #     construct.ULInt32('reuse_count'),
-        #     construct.ULInt32('refetch_count'),
-        #     construct.ULInt32('state'),
-        #     construct.ULInt64('creation_time'),
-        #     construct.ULInt32('key_size'),
-        #     construct.ULInt32('long_key_address'),
-        #     construct.Array(4, construct.ULInt32('data_stream_sizes')),
-        #     construct.Array(4, construct.ULInt32('data_stream_addresses')),
-        #     construct.ULInt32('flags'),
-        #     construct.Padding(16),
-        #     construct.ULInt32('self_hash'),
-        #     construct.Array(address_entry.block_size - 96, construct.UBInt8('key'))
-        # )
+        data = self.read_cache_entry(address_entry)
+        if data is None:
+            return None
 
-        CACHE_ENTRY = construct.Struct(
-            'hash' / construct.Int32ul,
-            'next_address' / construct.Int32ul,
-            'rankings_node_address' / construct.Int32ul,
-            'reuse_count' / construct.Int32ul,
-            'refetch_count' / construct.Int32ul,
-            'state' / construct.Int32ul,
-            'creation_time' / construct.Int64ul,
-            'key_size' / construct.Int32ul,
-            'long_key_address' / construct.Int32ul,
-            construct.Array(4, 'data_stream_sizes' / construct.Int32ul),
-            construct.Array(4, 'data_stream_addresses' / construct.Int32ul),
-            'flags' / construct.Int32ul,
-            construct.Padding(16),
-            'self_hash' / construct.Int32ul,
-            construct.Array(address_entry.block_size - 96, 'key'/ construct.Int8ub)
-        ) 
+        return self.decode_cache_entry(data)
 
-        try:
-            items = CACHE_ENTRY.parse_stream(self.file_object)
-        except construct.FieldError as exception:
-            self.prglog_mgr.debug("{}(): Unable to parse the cache entry".format(GET_MY_NAME()))
+    def read_cache_entry(self, address_entry):
+        """Read the raw block of a cache entry
+
+        Args:
+            address_entry (AddressEntry): An instance of AddressEntry
+
+        Returns:
+            The cache entry block (bytes) or None
+        """
+        if address_entry.block_size is None or address_entry.block_size < self.CACHE_ENTRY.size:
+            self.prglog_mgr.debug("Invalid block size for a cache entry")
             return None
 
-        cache_entry = MainCacheEntry()
+        data = self.read_data(address_entry.block_offset, address_entry.block_size, copy=True)
+
+        if len(data) != address_entry.block_size:
+            self.prglog_mgr.debug("Unable to parse the cache entry")
+            return None
+
+        return data
+
+    @classmethod
+    def decode_cache_entry_key(cls, data):
+        """Decode the key of a raw cache entry block
+
+        Args:
+            data (bytes): The cache entry block
+
+        Returns:
+            The key (str)
+        """
+        # The key area fills the rest of the block ('block_size - 96' bytes)
+        key, _, _ = data[cls.CACHE_ENTRY.size:].partition(b'\x00')
+        return key.decode('latin-1')
+
+    def decode_cache_entry(self, data, key=None):
+        """Decode a raw cache entry block
+
+        Args:
+            data (bytes): The cache entry block
+            key (str): The already decoded key (if any)
+
+        Returns:
+            A cache entry (MainCacheEntry)
+        """
+        items = self.CACHE_ENTRY.unpack_from(data)
 
-        cache_entry.hash = items.get('hash')
-        cache_entry.next_address = AddressEntry(items.get('next_address'))
-        cache_entry.rankings_node_address = AddressEntry(items.get('rankings_node_address'))
-        cache_entry.reuse_count = items.get('reuse_count')
-        cache_entry.refetch_count = items.get('refetch_count')
-        cache_entry.state = items.get('state')
-        cache_entry.creation_time = items.get('creation_time')
-        cache_entry.key_size = items.get('key_size')
-        cache_entry.long_key_address = items.get('long_key_address')
+        cache_entry = MainCacheEntry()
 
-        cache_entry.data_stream_sizes = items.get('data_stream_sizes')
-        cache_entry.data_stream_addresses = items.get('data_stream_addresses')
+        cache_entry.hash = items[0]
+        cache_entry.next_address = items[1]
+        cache_entry.rankings_node_address = items[2]
+        cache_entry.reuse_count = items[3]
+        cache_entry.refetch_count = items[4]
+        cache_entry.state = items[5]
+        cache_entry.creation_time = items[6]
+        cache_entry.key_size = items[7]
+        cache_entry.long_key_address = items[8]
 
-        for idx in range(len(cache_entry.data_stream_addresses)):
-            if cache_entry.data_stream_addresses[idx] != 0x00000000:
-                cache_entry.data_stream_addresses[idx] \
-                    = AddressEntry(cache_entry.data_stream_addresses[idx])
+        cache_entry.data_stream_sizes = items[9:13]
+        cache_entry.data_stream_addresses = items[13:17]  # AddressEntry views are created on access
 
-        cache_entry.flags = items.get('flags')
-        cache_entry.self_hash = items.get('self_hash')
+        cache_entry.flags = items[17]
+        cache_entry.self_hash = items[18]
 
-        byte_array = items.get('key')
-        byte_string = ''.join(map(chr, byte_array))
-        cache_entry.key, _, _ = byte_string.partition('\x00')
+        if key is None:
+            key = self.decode_cache_entry_key(data)
+        cache_entry.key = key
 
         return cache_entry
 
+    def is_allocated(self, block_number):
+        """Check if a block is marked as allocated in the allocation map
+
+        Args:
+            block_number (int): The block number
+
+        Returns:
+            True, False or None (unknown)
+        """
+        if block_number >> 3 >= len(self.allocation_map):
+            return None
+        return (self.allocation_map[block_number >> 3] >> (block_number & 7)) & 1 == 1
+
+    def find_blocks(self, signature, offset_in_block=0):
+        """Find blocks having a signature at a fixed offset (the search runs over the whole file in C)
+
+        Args:
+            signature (bytes): The signature
+            offset_in_block (int): The offset of the signature within a block
+
+        Yields:
+            A block number (int)
+        """
+        if self.map_object is None or not self.block_size:
+            return
+
+        base = self.BLOCK_HEADER_SIZE + offset_in_block
+        pos = self.map_object.find(signature, base)
+
+        while pos != -1:
+            block_number, remainder = divmod(pos - base, self.block_size)
+            if remainder == 0:
+                yield block_number
+                pos = self.map_object.find(signature, pos + self.block_size)
+            else:
+                # Resume at the next block boundary
+                pos = self.map_object.find(signature, pos + self.block_size - remainder)
+
+    def read_data(self, offset, size, copy=False):
+        """Read data from this file
+
+        Args:
+            offset (int): The offset within this file
+            size (int): The size of data
+            copy (bool): If False, the data is a zero-copy slice (memoryview) of the memory map
+
+        Returns:
+            Data (memoryview or bytes)
+        """
+        if self.map_object is None:
+            self.file_object.seek(offset, os.SEEK_SET)
+            return self.file_object.read(size)
+
+        if copy is True:
+            return self.map_object[offset: offset + size]
+        return memoryview(self.map_object)[offset: offset + size]
+
     def close(self):
         """Close this object
         """
         # self.prglog_mgr.info("{}()".format(GET_MY_NAME()))
 
+        if self.map_object is not None:
+            try:
+                self.map_object.close()
+            except BufferError:
+                pass  # Slices are still referenced -> unmapped when they are released
+            self.map_object = None
+
         if self.file_object is not None:
             self.file_object.close()
             self.file_object = None
@@ -448,15 +616,27 @@ class ChromiumMainCache:
     """ChromiumMainCache class
 
     Attributes:
+        path_root (str): The full path of the cache directory
         url_pattern (str): A regular expression for storing interesting URLs only
+        index_table (list): The list of indexed cache entries (AddressEntry)
         cache_entries (list): A list of MainCacheEntry instances
+        data_files (dict): Opened data files (DataFile) kept until close() for reading data streams
         prglog_mgr (logging): The progress log manager using the standard Python logging module
     """
+    # ENTRY_NORMAL, ENTRY_EVICTED and ENTRY_DOOMED
+    ENTRY_STATES = [0, 1, 2]
+
+    # Plausible creation times (microseconds since 1601-01-01) for carving: 2000-01-01 ~ 2100-01-01
+    MIN_CREATION_TIME = 12591158400000000
+    MAX_CREATION_TIME = 15746918400000000
 
     def __init__(self):
+        self.path_root = None
         self.url_pattern = None
+        self.index_table = []
         self.cache_entries = None
-        self.prglog_mgr = logging.getLogger(__name__)
+        self.data_files = {}
+        self.prglog_mgr = GET_LOGGER(__name__)
 
     def set_url_pattern(self, pattern):
         """Set the URL pattern
@@ -464,23 +644,49 @@ class ChromiumMainCache:
         Args:
             pattern (str): A regular expression for storing interesting URLs only
         """
-        self.prglog_mgr.info("{}(): \"{}\"".format(GET_MY_NAME(), pattern))
+        self.prglog_mgr.info("\"%s\"", pattern)
 
         self.url_pattern = pattern
 
-    def parse(self, path_root):
+    def parse(self, path_root, workers=1):
         """Parse chrome cache entries
 
         Args:
             path_root (str): The full path of the target directory
+            workers (int): The number of worker processes for walking hash chains (1: no worker process)
+
+        Returns:
+            True or False
         """
-        self.prglog_mgr.info("{}(): Parsing cache entries in \"{}\"".format(GET_MY_NAME(), path_root))
+        self.prglog_mgr.info("Parsing cache entries in \"%s\"", path_root)
+
+        if self.open(path_root) is False:
+            return False
+
+        # Process cache entries
+        if workers > 1:
+            self.process_cache_entries_parallel(self.index_table, workers)
+        else:
+            self.process_cache_entries(self.index_table)
+        return True
+
+    def open(self, path_root):
+        """Open the index and data files without materializing cache entries (cf. iter_entries())
+
+        Args:
+            path_root (str): The full path of the target directory
+
+        Returns:
+            True or False
+        """
+        self.path_root = path_root
+        self.index_table = []
 
         # Build an index table from 'index'
         path_index_file = path_root + "/index"
 
         if not os.path.exists(path_index_file):
-            self.prglog_mgr.debug("{}(): Not found 'index' file".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("Not found 'index' file")
             return False
 
         index_file = IndexFile()
@@ -488,68 +694,367 @@ class ChromiumMainCache:
         index_file.close()
 
         if len(index_file.index_table) == 0:
-            self.prglog_mgr.info("{}(): There is no indexed cache entry".format(GET_MY_NAME()))
+            self.prglog_mgr.info("There is no indexed cache entry")
             return False
 
-        # Open data files
-        data_files = {}
-        for address_entry in index_file.index_table:
-            if address_entry.filename in data_files:
+        # Open data files (they stay open until close() for reading data streams)
+        self.index_table = index_file.index_table
+        for address_entry in self.index_table:
+            self.get_data_file(address_entry.filename)
+        return True
+
+    def get_data_file(self, filename):
+        """Get an opened data file (data_N or f_XXXXXX), opening it at the first request
+
+        Args:
+            filename (str): The name of the data file
+
+        Returns:
+            An instance of DataFile or None
+        """
+        if filename in self.data_files:
+            return self.data_files.get(filename)
+
+        data_file = DataFile()
+        block_file = not filename.startswith('f_')
+        if data_file.open(self.path_root + "/{}".format(filename), block_file) is False:
+            data_file.close()
+            data_file = None
+
+        self.data_files[filename] = data_file  # None also cached for skipping missing files
+        return data_file
+
+    def get_data_stream(self, address_entry, size):
+        """Get a data stream of a cache entry
+
+        Args:
+            address_entry (AddressEntry): The address of the data stream
+            size (int): The size of the data stream
+
+        Returns:
+            Data (memoryview) or None
+        """
+        data_file = self.get_data_file(address_entry.filename)
+        if data_file is None:
+            self.prglog_mgr.debug("Missing data file %s", address_entry.filename)
+            return None
+
+        offset = address_entry.block_offset if address_entry.block_offset is not None else 0
+        return data_file.read_data(offset, size)
+
+    def carve_entries(self, prefix='https://', pattern=None, path_root=None):
+        """Carve cache entries which are not reachable from the index table (e.g. evicted entries)
+
+            - Entry blocks are located by the key signature at the key offset of each 256-byte block
+            - Candidates are validated by the fields of the entry header
+            - The allocation map classifies each recovered entry (allocated or free block)
+            - Without a usable index file (missing, truncated or zeroed), every block is unreferenced
+
+        Args:
+            prefix (str): The key prefix used as the signature of entry blocks
+            pattern (str): A regular expression for interesting URLs (cf. re.match)
+            path_root (str): The full path of the cache directory (default: the path of open() or parse())
+
+        Yields:
+            A recovered cache entry (MainCacheEntry)
+        """
+        if path_root is not None:
+            self.path_root = path_root
+
+        if self.path_root is None or not os.path.isdir(self.path_root):
+            self.prglog_mgr.debug("The path does not exist (%s)", self.path_root)
+            return
+
+        self.prglog_mgr.info("Carving cache entries in \"%s\"", self.path_root)
+
+        regex = re.compile(pattern) if pattern is not None else None
+        signature = prefix.encode('latin-1')
+        referenced = self.get_referenced_blocks()
+
+        filenames = [name for name in os.listdir(self.path_root) if re.match(r'data_\d+$', name)]
+        filenames.sort(key=lambda name: int(name[5:]))
+
+        for filename in filenames:
+            data_file = self.get_data_file(filename)
+            if data_file is None or data_file.block_size != AddressEntry.FILE_TYPE_BLOCK_SIZES[
+                    AddressEntry.FILE_TYPE_BLOCK_256]:
                 continue
 
-            data_file = DataFile()
-            if data_file.open(path_root + "/{}".format(address_entry.filename)) is False:
-                data_file.close()
-            else:
-                data_files[address_entry.filename] = data_file
+            if data_file.updating:
+                self.prglog_mgr.debug("The allocation map of %s may be stale", filename)
 
-        # Process cache entries
-        self.process_cache_entries(index_file.index_table, data_files)
+            file_id = int(filename[5:])
 
-        # Close data files
-        for file_object in iter(data_files.values()):
-            file_object.close()
-        return True
+            for block_number in data_file.find_blocks(signature, DataFile.CACHE_ENTRY.size):
+                if (filename, block_number) in referenced or block_number > 0xFFFF:
+                    continue
+
+                cache_entry = self.carve_entry(data_file, file_id, block_number)
+                if cache_entry is None:
+                    continue
+
+                if regex is not None and regex.match(cache_entry.key) is None:
+                    continue
+
+                yield cache_entry
+
+    def carve_entry(self, data_file, file_id, block_number):
+        """Validate and decode a candidate entry block
+
+        Args:
+            data_file (DataFile): A block file having 256-byte blocks
+            file_id (int): The file number of the block file
+            block_number (int): The block number of the candidate
 
-    def process_cache_entries(self, index_table, data_files):
+        Returns:
+            A recovered cache entry (MainCacheEntry) or None
+        """
+        block_size = data_file.block_size
+        address_entry = AddressEntry(
+            0x80000000 | (AddressEntry.FILE_TYPE_BLOCK_256 << 28) | (file_id << 16) | block_number
+        )
+
+        data = data_file.read_cache_entry(address_entry)
+        if data is None:
+            return None
+
+        items = DataFile.CACHE_ENTRY.unpack_from(data)
+        state = items[5]
+        creation_time = items[6]
+        key_size = items[7]
+        data_stream_sizes = items[9:13]
+        data_stream_addresses = items[13:17]
+
+        if state not in self.ENTRY_STATES:
+            return None
+
+        if not (self.MIN_CREATION_TIME <= creation_time <= self.MAX_CREATION_TIME):
+            return None
+
+        for size, address in zip(data_stream_sizes, data_stream_addresses):
+            if size != 0 and address & 0x80000000 == 0:
+                return None
+
+        # Read all blocks of an entry having a long key (up to 4 blocks)
+        number_of_blocks = min(4, -(-(DataFile.CACHE_ENTRY.size + key_size + 1) // block_size))
+        if number_of_blocks > 1:
+            address_entry = AddressEntry(address_entry.value | ((number_of_blocks - 1) << 24))
+            data = data_file.read_cache_entry(address_entry)
+            if data is None:
+                return None
+
+        key = data_file.decode_cache_entry_key(data)
+        if len(key) != key_size and len(key) < len(data) - DataFile.CACHE_ENTRY.size - 1:
+            return None
+
+        cache_entry = data_file.decode_cache_entry(data, key)
+        cache_entry.recovered = True
+        cache_entry.allocated = data_file.is_allocated(block_number)
+        return cache_entry
+
+    def get_referenced_blocks(self):
+        """Get entry blocks reachable from the index table (empty if there is no index table)
+
+        Returns:
+            A set of (filename, block number)
+        """
+        referenced = set()
+
+        for address_entry in self.index_table:
+            while address_entry.value != 0x00000000:
+                block = (address_entry.filename, address_entry.block_number)
+                if block in referenced:
+                    break  # Looped hash chain
+                referenced.add(block)
+
+                data_file = self.data_files.get(address_entry.filename)
+                if data_file is None:
+                    break
+
+                data = data_file.read_data(address_entry.block_offset, DataFile.CACHE_ENTRY_LINK.size, copy=True)
+                if len(data) != DataFile.CACHE_ENTRY_LINK.size:
+                    break
+
+                _, next_address = DataFile.CACHE_ENTRY_LINK.unpack_from(data)
+                address_entry = AddressEntry(next_address)
+
+        return referenced
+
+    def get_response_info(self, cache_entry):
+        """Get the HTTP response info (stream 0) of a cache entry
+
+        Args:
+            cache_entry (MainCacheEntry): A cache entry
+
+        Returns:
+            An instance of HttpResponseInfo or None
+        """
+        if cache_entry.response_info is not None:
+            return cache_entry.response_info
+
+        address_entry = cache_entry.get_data_stream_address(0)
+        if address_entry == 0:
+            return None
+
+        data = self.get_data_stream(address_entry, cache_entry.data_stream_sizes[0])
+        if data is None:
+            return None
+
+        response_info = HttpResponseInfo()
+        if response_info.parse(data) is False:
+            return None
+
+        cache_entry.response_info = response_info
+        return response_info
+
+    def iter_data_streams(self, cache_entries=None):
+        """Iterate data streams of cache entries in (file, offset) order
+
+        Args:
+            cache_entries (iterable): Cache entries (MainCacheEntry) (default: all parsed entries)
+
+        Yields:
+            (MainCacheEntry, int, memoryview): A cache entry, the stream index and the stream data
+        """
+        if cache_entries is None:
+            cache_entries = self.cache_entries
+
+        streams = []
+        for cache_entry in cache_entries:
+            for idx in range(len(cache_entry.data_stream_sizes)):
+                address_entry = cache_entry.get_data_stream_address(idx)
+                if address_entry == 0:
+                    break
+
+                offset = address_entry.block_offset if address_entry.block_offset is not None else 0
+                streams.append((address_entry.filename, offset, cache_entry, idx, address_entry))
+
+        # Sort by (file, offset) for reading each data file sequentially
+        streams.sort(key=lambda item: (item[0], item[1]))
+
+        for filename, offset, cache_entry, idx, address_entry in streams:
+            data = self.get_data_stream(address_entry, cache_entry.data_stream_sizes[idx])
+            if data is None:
+                continue
+            yield cache_entry, idx, data
+
+    def process_cache_entries(self, index_table):
         """Process cache entries in data_1, data_2 and data_3
 
         Args:
             index_table (list): An index table object
-            data_files (dict): A dictionary containing instances of DataFile
         """
-        self.prglog_mgr.info("{}()".format(GET_MY_NAME()))
+        self.prglog_mgr.info("")
+
+        # Save matched entries to the result list
+        self.cache_entries = list(self.iter_entries(pattern=self.url_pattern, index_table=index_table))
+
+    def process_cache_entries_parallel(self, index_table, workers):
+        """Process cache entries using a pool of worker processes
+
+            - The index table is split into slices, and each worker walks hash chains of its slices
+              with its own read-only mapped data files
+            - Results are merged in the order of slices (= the same order as process_cache_entries())
+            - Workers are started by 'spawn' (cf. get_worker_context())
+
+        Args:
+            index_table (list): An index table object
+            workers (int): The number of worker processes
+        """
+        self.prglog_mgr.info("%s workers", workers)
+
+        # Several slices per worker for balancing long and short hash chains
+        addresses = [address_entry.value for address_entry in index_table]
+        slice_size = max(1, -(-len(addresses) // (workers * 4)))
+        slices = [addresses[idx: idx + slice_size] for idx in range(0, len(addresses), slice_size)]
 
         self.cache_entries = list()
 
+        with ProcessPoolExecutor(max_workers=workers, mp_context=get_worker_context()) as executor:
+            results = executor.map(
+                process_index_table_slice,
+                [self.path_root] * len(slices), slices, [self.url_pattern] * len(slices)
+            )
+            for cache_entries in results:
+                self.cache_entries.extend(cache_entries)
+
+    def iter_entries(self, prefix=None, pattern=None, index_table=None):
+        """Iterate cache entries one at a time (after open() or parse())
+
+            - The hash and key of each entry are decoded first, and non-matching entries are
+              skipped before building a MainCacheEntry
+
+        Args:
+            prefix (str or tuple): URL prefix(es) of interesting entries
+            pattern (str): A regular expression for interesting URLs (cf. re.match)
+            index_table (list): An index table object (default: the whole index table)
+
+        Yields:
+            A cache entry (MainCacheEntry)
+        """
+        regex = re.compile(pattern) if pattern is not None else None
+
+        if index_table is None:
+            index_table = self.index_table
+
         for address_entry in index_table:
             while address_entry.value != 0x00000000:
-                data_file = data_files.get(address_entry.filename)
+                data_file = self.data_files.get(address_entry.filename)
                 if data_file is None:
-                    self.prglog_mgr.debug("{}(): Missing data file {}".format(
-                        GET_MY_NAME(), address_entry.filename)
-                    )
+                    self.prglog_mgr.debug("Missing data file %s", address_entry.filename)
                     break
 
-                cache_entry = data_file.process_cache_entry(address_entry)
-                if cache_entry is None:
+                data = data_file.read_cache_entry(address_entry)
+                if data is None:
                     break
 
-                # Save this entry to the result list
-                if self.url_pattern is None:
-                    self.cache_entries.append(cache_entry)
-                else:
-                    if re.match(self.url_pattern, cache_entry.key):
-                        self.cache_entries.append(cache_entry)
+                key = data_file.decode_cache_entry_key(data)
+
+                if (prefix is not None and not key.startswith(prefix)) or \
+                   (regex is not None and regex.match(key) is None):
+                    _, next_address = data_file.CACHE_ENTRY_LINK.unpack_from(data)
+                    address_entry = AddressEntry(next_address)
+                    continue
+
+                cache_entry = data_file.decode_cache_entry(data, key)
+                yield cache_entry
 
                 address_entry = cache_entry.next_address
 
     def close(self):
         """Close this object
         """
-        self.prglog_mgr.info("{}()".format(GET_MY_NAME()))
+        self.prglog_mgr.info("")
 
         self.url_pattern = None
-        self.cache_entries.clear()
-        self.cache_entries = None
+        if self.cache_entries is not None:
+            self.cache_entries.clear()
+            self.cache_entries = None
+
+        for data_file in iter(self.data_files.values()):
+            if data_file is not None:
+                data_file.close()
+        self.data_files.clear()
+
+
+def process_index_table_slice(path_root, addresses, pattern):
+    """Walk hash chains of a slice of the index table (the job of a worker process)
+
+    Args:
+        path_root (str): The full path of the cache directory
+        addresses (list): Addresses (int) of a slice of the index table
+        pattern (str): A regular expression for storing interesting URLs only
+
+    Returns:
+        A list of MainCacheEntry instances
+    """
+    chrome_cache = ChromiumMainCache()
+    chrome_cache.path_root = path_root
+    chrome_cache.index_table = [AddressEntry(address) for address in addresses]
+
+    for address_entry in chrome_cache.index_table:
+        chrome_cache.get_data_file(address_entry.filename)
 
+    cache_entries = list(chrome_cache.iter_entries(pattern=pattern))
+    chrome_cache.close()
+    return cache_entries
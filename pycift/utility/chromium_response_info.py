@@ -0,0 +1,143 @@
+"""pycift.utility.chromium_response_info
+
+    * Description
+        Chromium's HTTP response info parser
+        (a pickled HttpResponseInfo stored as the stream 0 of main and simple disk cache entries)
+
+    * Reference
+        Chromium projects (https://www.chromium.org/)
+            - net/http/http_response_info.cc
+            - base/pickle.cc
+"""
+
+import logging
+import struct
+from pycift.common_defines import *
+
+
+class HttpResponseInfo:
+    """HttpResponseInfo class
+        - Interpreting the HTTP response info of a cache entry
+
+    Attributes:
+        version (int): The version of the pickled HttpResponseInfo
+        flags (int): The response info flags
+        request_time (int): Unix millisecond time when the request was issued
+        response_time (int): Unix millisecond time when the response was received
+        status (int): The HTTP status code
+        headers (dict): HTTP response headers (lower-cased names)
+        content_type (str): The media type of 'Content-Type' (e.g. application/json)
+        content_encoding (str): The value of 'Content-Encoding' (e.g. gzip)
+        prglog_mgr (logging): The progress log manager using the standard Python logging module
+    """
+    RESPONSE_INFO_VERSION_MIN = 1
+    RESPONSE_INFO_VERSION_MAX = 3
+    RESPONSE_INFO_VERSION_MASK = 0xFF
+
+    # Pickle header (payload size) + flags + request time + response time + length of raw headers
+    PICKLE_HEADER = struct.Struct('<IiqqI')
+
+    # Microseconds between 1601-01-01 (Chromium's base::Time) and 1970-01-01
+    TIME_DELTA_1601_TO_1970 = 11644473600000000
+
+    # Content types which may carry JSON even though they do not say so
+    JSON_COMPATIBLE_TYPES = ['text/plain', 'application/octet-stream']
+
+    def __init__(self):
+        """The constructor
+        """
+        self.version = None
+        self.flags = None
+        self.request_time = None
+        self.response_time = None
+        self.status = None
+        self.headers = {}
+        self.content_type = ""
+        self.content_encoding = ""
+        self.prglog_mgr = GET_LOGGER(__name__)
+
+    def parse(self, data):
+        """Parse a pickled HttpResponseInfo
+
+        Args:
+            data (bytes or memoryview): The stream 0 of a cache entry
+
+        Returns:
+            True or False
+        """
+        if len(data) < self.PICKLE_HEADER.size:
+            return False
+
+        payload_size, flags, request_time, response_time, headers_size = self.PICKLE_HEADER.unpack_from(data)
+
+        self.version = flags & self.RESPONSE_INFO_VERSION_MASK
+        if not (self.RESPONSE_INFO_VERSION_MIN <= self.version <= self.RESPONSE_INFO_VERSION_MAX):
+            self.prglog_mgr.debug("Unknown version (%s)", self.version)
+            return False
+
+        if payload_size + 4 > len(data) or \
+           self.PICKLE_HEADER.size + headers_size > len(data):
+            self.prglog_mgr.debug("Invalid size")
+            return False
+
+        self.flags = flags
+        self.request_time = self.convert_time(request_time)
+        self.response_time = self.convert_time(response_time)
+
+        # Raw headers: "HTTP/1.1 200 OK\0Name: Value\0...\0\0"
+        offset = self.PICKLE_HEADER.size
+        raw_headers = bytes(data[offset: offset + headers_size]).decode('latin-1')
+        lines = raw_headers.split('\x00')
+
+        items = lines[0].split(' ')
+        if len(items) >= 2 and items[1].isdigit():
+            self.status = int(items[1])
+
+        for line in lines[1:]:
+            name, sep, value = line.partition(':')
+            if sep == "":
+                continue
+            self.headers[name.strip().lower()] = value.strip()
+
+        self.content_type = self.headers.get('content-type', "").split(';')[0].strip().lower()
+        self.content_encoding = self.headers.get('content-encoding', "").strip().lower()
+        return True
+
+    def convert_time(self, value):
+        """Convert Chromium's internal time (microseconds since 1601-01-01) to unix millisecond time
+
+        Args:
+            value (int): Chromium's internal time
+
+        Returns:
+            Unix millisecond time (int) or None
+        """
+        if value <= self.TIME_DELTA_1601_TO_1970:
+            return None
+        return (value - self.TIME_DELTA_1601_TO_1970) // 1000
+
+    def is_successful(self):
+        """Check if the response has a 2xx status (or an unknown status)
+
+        Returns:
+            True or False
+        """
+        return self.status is None or 200 <= self.status < 300
+
+    def may_be_json(self):
+        """Check if the response body may be JSON data (unknown content types are allowed)
+
+        Returns:
+            True or False
+        """
+        if self.content_type == "" or 'json' in self.content_type:
+            return True
+        return self.content_type in self.JSON_COMPATIBLE_TYPES
+
+    def may_be_gzip(self):
+        """Check if the response body may be gzip compressed (unknown encodings are allowed)
+
+        Returns:
+            True or False
+        """
+        return self.content_encoding == "" or 'gzip' in self.content_encoding
@@ -5,11 +5,16 @@
 
     * Reference
         Chromium projects (https://www.chromium.org/)
+            - net/disk_cache/simple/simple_index_file.cc (index-dir/the-real-index)
 """
 
 import os
+import re
+import struct
+import zlib
 import logging
 from pycift.utility.pt_utils import PtUtils
+from pycift.utility.chromium_response_info import HttpResponseInfo
 from pycift.common_defines import *
 
 
@@ -58,18 +63,261 @@ class CHROMIUM_SIMPLE_CACHE_EOS_V5(LittleEndianStructure):
     _pack_ = 4
 
 
+class SimpleIndexEntry:
+    """SimpleIndexEntry class
+        - A structure for storing an entry of the simple cache index
+
+    Attributes:
+        hash (int): The entry hash (the first 8 bytes of SHA-1 of the key)
+        last_used_time (int): Unix millisecond time when this entry was used last
+        entry_size (int): The approximate size of all files of this entry
+    """
+    __slots__ = ['hash', 'last_used_time', 'entry_size']
+
+    def __init__(self, hash, last_used_time, entry_size):
+        """The constructor
+        """
+        self.hash = hash
+        self.last_used_time = last_used_time
+        self.entry_size = entry_size
+
+    @property
+    def filename(self):
+        """The name of the entry file having the key and streams 0 and 1"""
+        return '{:016x}_0'.format(self.hash)
+
+
+class SimpleIndexFile:
+    """SimpleIndexFile class
+        - Parsing the 'index-dir/the-real-index' file of a simple disk cache
+
+    Attributes:
+        version (int): The index file version
+        entry_count (int): The number of entries
+        cache_size (int): The total size of the cache
+        last_modified_time (int): Unix millisecond time when the cache directory was modified
+        index_entries (list): The list of SimpleIndexEntry instances
+        prglog_mgr (logging): The progress log manager using the standard Python logging module
+    """
+    MAGIC = 0x656E74657220796F
+    MIN_VERSION = 6
+    MAX_VERSION = 9
+
+    # Pickle header: payload size + CRC32 of the payload
+    PICKLE_HEADER = struct.Struct('<II')
+
+    # Magic + version + entry count + cache size
+    INDEX_METADATA = struct.Struct('<QIQQ')
+
+    # Hash + last used time + (packed) entry size
+    INDEX_ENTRY = struct.Struct('<QqQ')
+
+    # Microseconds between 1601-01-01 (Chromium's base::Time) and 1970-01-01
+    TIME_DELTA_1601_TO_1970 = 11644473600000000
+
+    def __init__(self):
+        """The constructor
+        """
+        self.version = None
+        self.entry_count = None
+        self.cache_size = None
+        self.last_modified_time = None
+        self.index_entries = []
+        self.prglog_mgr = GET_LOGGER(__name__)
+
+    def parse(self, path_file):
+        """Parse an index file
+
+        Args:
+            path_file (str): The full path of 'the-real-index'
+
+        Returns:
+            True or False
+        """
+        try:
+            with open(path_file, 'rb') as file_object:
+                data = file_object.read()
+        except IOError:
+            self.prglog_mgr.debug("Unable to open the index file")
+            return False
+
+        if len(data) < self.PICKLE_HEADER.size + self.INDEX_METADATA.size:
+            self.prglog_mgr.debug("Invalid index file")
+            return False
+
+        payload_size, crc32 = self.PICKLE_HEADER.unpack_from(data)
+        offset = self.PICKLE_HEADER.size
+
+        if offset + payload_size > len(data):
+            self.prglog_mgr.debug("Invalid payload size")
+            return False
+
+        if zlib.crc32(data[offset: offset + payload_size]) != crc32:
+            self.prglog_mgr.debug("CRC32 mismatch (the index may be stale)")
+
+        magic, self.version, self.entry_count, self.cache_size = self.INDEX_METADATA.unpack_from(data, offset)
+        offset += self.INDEX_METADATA.size
+
+        if magic != self.MAGIC:
+            self.prglog_mgr.debug("Unknown signature (%X)", magic)
+            return False
+
+        if not (self.MIN_VERSION <= self.version <= self.MAX_VERSION):
+            self.prglog_mgr.debug("Unsupported version (%s)", self.version)
+            return False
+
+        if self.version >= 7:
+            offset += 4  # The reason of writing this index
+
+        end = self.PICKLE_HEADER.size + payload_size
+        if offset + self.entry_count * self.INDEX_ENTRY.size > end:
+            self.prglog_mgr.debug("Invalid entry count (%s)", self.entry_count)
+            return False
+
+        self.index_entries = []
+        for hash, last_used_time, entry_size in self.INDEX_ENTRY.iter_unpack(
+                data[offset: offset + self.entry_count * self.INDEX_ENTRY.size]):
+            if self.version >= 8:
+                entry_size = (entry_size >> 8) * 256  # 256-byte chunks (the low byte is in-memory data)
+            self.index_entries.append(
+                SimpleIndexEntry(hash, self.convert_time(last_used_time), entry_size)
+            )
+        offset += self.entry_count * self.INDEX_ENTRY.size
+
+        if offset + 8 <= end:
+            self.last_modified_time = self.convert_time(struct.unpack_from('<q', data, offset)[0])
+        return True
+
+    def convert_time(self, value):
+        """Convert Chromium's internal time (microseconds since 1601-01-01) to unix millisecond time
+
+        Args:
+            value (int): Chromium's internal time
+
+        Returns:
+            Unix millisecond time (int) or None
+        """
+        if value <= self.TIME_DELTA_1601_TO_1970:
+            return None
+        return (value - self.TIME_DELTA_1601_TO_1970) // 1000
+
+
+class SimpleCacheStream:
+    """SimpleCacheStream class
+        - A lazy view of a stream within a simple disk cache entry file (loaded on demand)
+
+    Attributes:
+        file_path (str): The full path of the entry file
+        offset (int): The offset of the stream
+        size (int): The size of the stream
+    """
+    __slots__ = ['file_path', 'offset', 'size', '_data']
+
+    def __init__(self, file_path, offset, size, data=None):
+        """The constructor
+
+        Args:
+            file_path (str): The full path of the entry file
+            offset (int): The offset of the stream
+            size (int): The size of the stream
+            data (bytes): The stream data if already read
+        """
+        self.file_path = file_path
+        self.offset = offset
+        self.size = size
+        self._data = data
+
+    def __len__(self):
+        return self.size
+
+    def __bytes__(self):
+        return self.read()
+
+    def read(self, size=None):
+        """Read the stream (the whole stream is kept after the first full read)
+
+        Args:
+            size (int): The number of leading bytes to read (default: all)
+
+        Returns:
+            The stream data (bytes)
+        """
+        if self._data is not None:
+            return self._data if size is None else self._data[:size]
+
+        length = self.size if size is None else min(size, self.size)
+
+        try:
+            with open(self.file_path, 'rb') as file_object:
+                file_object.seek(self.offset)
+                data = file_object.read(length)
+        except IOError:
+            return b''
+
+        if size is None:
+            self._data = data
+        return data
+
+    def compute_crc32(self, chunk_size=1024 * 1024):
+        """Compute CRC32 of the stream (read in chunks into a reused buffer unless already loaded)
+
+        Args:
+            chunk_size (int): The read size
+
+        Returns:
+            CRC32 (int) or None
+        """
+        if self._data is not None:
+            return zlib.crc32(self._data)
+
+        crc32 = 0
+        remaining = self.size
+        buffer = bytearray(min(chunk_size, max(self.size, 1)))
+        view = memoryview(buffer)
+
+        try:
+            with open(self.file_path, 'rb', buffering=0) as file_object:
+                file_object.seek(self.offset)
+                while remaining > 0:
+                    length = file_object.readinto(view[:min(remaining, len(buffer))])
+                    if not length:
+                        return None  # Truncated
+                    crc32 = zlib.crc32(view[:length], crc32)
+                    remaining -= length
+        except IOError:
+            return None
+
+        return crc32
+
+    def startswith(self, prefix):
+        """Check the leading bytes without loading the whole stream
+
+        Args:
+            prefix (bytes): The prefix
+
+        Returns:
+            True or False
+        """
+        return self.read(len(prefix)) == prefix
+
+
 class SimpleCacheEntry:
     """SimpleCacheEntry class
         - A structure for storing Chromium's simple disk cache entry
     """
+    __slots__ = ['version', 'key', 'streams', 'crc32', 'crc32_flags', 'crc32_verified', 'key_sha256', 'response_info']
+
     def __init__(self):
         """The constructor
         """
         self.version = SimpleCacheVersion.UNKNOWN
         self.key = ""  # Usually URL address
-        self.streams = []
-        self.crc32 = []
+        self.streams = []  # SimpleCacheStream instances
+        self.crc32 = []  # CRC32 of each stream (EOS)
+        self.crc32_flags = []  # Flags of each EOS (b(1): CRC32 is valid)
+        self.crc32_verified = []  # True, False or None (not verified) for each stream
         self.key_sha256 = None
+        self.response_info = None  # HttpResponseInfo (stream 0, v5 only)
 
 
 class ChromiumSimpleCache:
@@ -79,42 +327,134 @@ class ChromiumSimpleCache:
         cache_entry (list): A list of SimpleCacheEntry instances
         prglog_mgr (logging): The progress log manager using the standard Python logging module
     """
+    # The tail of an entry file read at once (EOS records, stream 0 and the key hash usually fit in)
+    TAIL_READ_SIZE = 8192
+
+    # The flag of an EOS record having a valid CRC32
+    FLAG_HAS_CRC32 = 0x00000001
+
+    # The name of an entry file having the key and streams 0 and 1 ('<entry hash>_0')
+    ENTRY_FILE_NAME = re.compile(r'^[0-9a-f]{16}_0$')
 
     def __init__(self):
         self.cache_entry = []
-        self.prglog_mgr = logging.getLogger(__name__)
+        self.prglog_mgr = GET_LOGGER(__name__)
+
+    @classmethod
+    def is_entry_file(cls, filename):
+        """Check if a file name is an entry file name
+
+        Args:
+            filename (str): The file name
 
-    def parse(self, file_path):
+        Returns:
+            True or False
+        """
+        return cls.ENTRY_FILE_NAME.match(filename) is not None
+
+    @staticmethod
+    def get_index_entries(path_root):
+        """Get entries of the simple cache index ('index-dir/the-real-index') within a cache directory
+
+        Args:
+            path_root (str): The cache directory
+
+        Returns:
+            A dict of {entry file name: SimpleIndexEntry} or None
+        """
+        path_index_file = os.path.join(path_root, 'index-dir', 'the-real-index')
+        if not os.path.isfile(path_index_file):
+            return None
+
+        index_file = SimpleIndexFile()
+        if index_file.parse(path_index_file) is False:
+            return None
+
+        return {index_entry.filename: index_entry for index_entry in index_file.index_entries}
+
+    def parse(self, file_path, verify_crc32=False):
         """Parse chrome cache entries
+            - Only the header, the key and the tail (EOS records) are read
+            - Streams are returned as SimpleCacheStream (loaded on demand)
 
         Args:
             file_path (str): The full path of the target file
+            verify_crc32 (bool): If True, streams are verified by CRC32 of EOS records
+                                 (cf. SimpleCacheEntry.crc32_verified)
         """
-        self.prglog_mgr.info("{}(): Parsing cache entries in \"{}\"".format(GET_MY_NAME(), file_path))
+        self.prglog_mgr.info("Parsing cache entries in \"%s\"", file_path)
 
         file_size = os.path.getsize(file_path)
 
         if file_size < sizeof(CHROMIUM_SIMPLE_CACHE_HEADER) * 2:
-            self.prglog_mgr.debug("{}(): Invalid simple disk cache format".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("Invalid simple disk cache format")
             return False
 
         try:
             file_object = open(file_path, 'rb')
         except IOError as exception:
-            self.prglog_mgr.debug("{}(): Exception occurred".format(GET_MY_NAME()))
+            self.prglog_mgr.debug("Exception occurred")
             return False
 
-        data = file_object.read()
-        file_object.close()
+        try:
+            result = self.parse_file(file_object, file_path, file_size)
+        finally:
+            file_object.close()
+
+        if result is True and verify_crc32 is True:
+            self.verify_streams()
+        return result
+
+    def verify_streams(self):
+        """Verify streams of the current entry by CRC32 of EOS records
+
+        Returns:
+            True (all verifiable streams are intact) or False
+        """
+        self.cache_entry.crc32_verified = []
+
+        for idx, stream in enumerate(self.cache_entry.streams):
+            crc32 = self.cache_entry.crc32[idx] if idx < len(self.cache_entry.crc32) else None
+            flags = self.cache_entry.crc32_flags[idx] if idx < len(self.cache_entry.crc32_flags) else None
+
+            if crc32 is None or flags is None or (flags & self.FLAG_HAS_CRC32) == 0:
+                self.cache_entry.crc32_verified.append(None)
+                continue
+
+            verified = stream.compute_crc32() == crc32
+            if verified is False:
+                self.prglog_mgr.debug("CRC32 mismatch (%s, offset %s)", stream.file_path, stream.offset)
+            self.cache_entry.crc32_verified.append(verified)
+
+        return False not in self.cache_entry.crc32_verified
+
+    def parse_file(self, file_object, file_path, file_size):
+        """Parse an opened entry file
+
+        Args:
+            file_object: The file object
+            file_path (str): The full path of the target file
+            file_size (int): The file size
+
+        Returns:
+            True or False
+        """
+        tail_offset = max(0, file_size - self.TAIL_READ_SIZE)
+        tail = None
+
+        def read_at(offset, size):
+            # Serve reads from the tail buffer, or seek and read
+            if tail is not None and tail_offset <= offset and offset + size <= file_size:
+                return tail[offset - tail_offset: offset - tail_offset + size]
+            file_object.seek(offset)
+            return file_object.read(size)
 
         offset = 0
-        header = PtUtils.static_cast(
-            data[offset: offset + sizeof(CHROMIUM_SIMPLE_CACHE_HEADER)],
-            CHROMIUM_SIMPLE_CACHE_HEADER
-        )
+        header_data = file_object.read(sizeof(CHROMIUM_SIMPLE_CACHE_HEADER))
+        header = CHROMIUM_SIMPLE_CACHE_HEADER.from_buffer_copy(header_data)
 
         if header.magic != SIG_CHROMIUM_SIMPLE_CACHE_INITIAL_MAGIC:
-            self.prglog_mgr.debug("{}(): Unknown signature ({})".format(GET_MY_NAME(), header.magic))
+            self.prglog_mgr.debug("Unknown signature (%s)", header.magic)
             return False
 
         # Create an instance
@@ -132,7 +472,7 @@ class ChromiumSimpleCache:
         elif 5 <= header.version and header.padding == 0:
             self.cache_entry.version = SimpleCacheVersion.V5_T2
         else:
-            self.prglog_mgr.debug("{}(): Unknown version ({})".format(GET_MY_NAME(), header.version))
+            self.prglog_mgr.debug("Unknown version (%s)", header.version)
             return False
 
         # Skip the header area
@@ -142,30 +482,39 @@ class ChromiumSimpleCache:
         else:
             offset += (sizeof(CHROMIUM_SIMPLE_CACHE_HEADER) - 4)
 
+        # Read the tail at once (EOS records are located from the end of the file)
+        file_object.seek(tail_offset)
+        tail = file_object.read()
+
         # Get the key
-        self.cache_entry.key = data[offset: offset + header.keysize].decode("utf-8")
+        key = read_at(offset, header.keysize)
+        self.cache_entry.key = key.decode("utf-8")
         offset += header.keysize
 
         # Parse the data area (v1)
         if self.cache_entry.version == SimpleCacheVersion.V1:
-            stream = data[offset:]
+            stream = SimpleCacheStream(file_path, offset, file_size - offset)
             self.cache_entry.streams.append(stream)
 
         # Parse the data area (v2 ~ v4)
         elif (self.cache_entry.version & SimpleCacheVersion.V2) == SimpleCacheVersion.V2:
             offset_saved = offset
             offset = file_size - sizeof(CHROMIUM_SIMPLE_CACHE_EOS_V2)
-            eos = PtUtils.static_cast(data[offset:], CHROMIUM_SIMPLE_CACHE_EOS_V2)
+            eos = CHROMIUM_SIMPLE_CACHE_EOS_V2.from_buffer_copy(
+                read_at(offset, sizeof(CHROMIUM_SIMPLE_CACHE_EOS_V2))
+            )
 
             if eos.magic != SIG_CHROMIUM_SIMPLE_CACHE_EOS_MAGIC:
-                self.prglog_mgr.debug("{}(): Invalid EOS".format(GET_MY_NAME()))
+                self.prglog_mgr.debug("Invalid EOS")
                 self.cache_entry.crc32.append(None)
-                stream = data[offset_saved:]
+                self.cache_entry.crc32_flags.append(None)
+                stream = SimpleCacheStream(file_path, offset_saved, file_size - offset_saved)
                 self.cache_entry.streams.append(stream)
 
             else:
                 self.cache_entry.crc32.append(eos.crc32)
-                stream = data[offset_saved: file_size - sizeof(CHROMIUM_SIMPLE_CACHE_EOS_V2)]
+                self.cache_entry.crc32_flags.append(eos.flags)
+                stream = SimpleCacheStream(file_path, offset_saved, offset - offset_saved)
                 self.cache_entry.streams.append(stream)
 
         # Parse the data area (v5)
@@ -177,34 +526,57 @@ class ChromiumSimpleCache:
             # Stream 0
             offset_saved = offset
             offset = file_size - size_of_eos
-            eos = PtUtils.static_cast(data[offset:], CHROMIUM_SIMPLE_CACHE_EOS_V5)
+            eos = CHROMIUM_SIMPLE_CACHE_EOS_V5.from_buffer_copy(
+                read_at(offset, sizeof(CHROMIUM_SIMPLE_CACHE_EOS_V5))
+            )
 
             if eos.magic != SIG_CHROMIUM_SIMPLE_CACHE_EOS_MAGIC:
-                self.prglog_mgr.debug("{}(): Invalid EOS for Stream 0".format(GET_MY_NAME()))
+                self.prglog_mgr.debug("Invalid EOS for Stream 0")
                 self.cache_entry.crc32.append(None)
-                stream = data[offset_saved:]
+                self.cache_entry.crc32_flags.append(None)
+                stream = SimpleCacheStream(file_path, offset_saved, file_size - offset_saved)
                 self.cache_entry.streams.append(stream)
 
             else:
                 if (eos.flags & 0x00000002) == 0x00000002:
                     offset -= 32
-                    self.cache_entry.key_sha256 = data[offset:offset+32]
+                    self.cache_entry.key_sha256 = read_at(offset, 32)
 
+                if eos.streamsize > offset - offset_saved:
+                    self.prglog_mgr.debug("Invalid size of Stream 0")
+                    return False
+
+                # Stream 0 is the HTTP response info (small, so it is read here)
                 self.cache_entry.crc32.append(eos.crc32)
+                self.cache_entry.crc32_flags.append(eos.flags)
                 offset -= eos.streamsize
-                stream = data[offset: offset + eos.streamsize]
+                data = read_at(offset, eos.streamsize)
+                stream = SimpleCacheStream(file_path, offset, eos.streamsize, data)
                 self.cache_entry.streams.append(stream)
 
+                response_info = HttpResponseInfo()
+                if response_info.parse(data) is True:
+                    self.cache_entry.response_info = response_info
+
                 # Stream 1
                 offset -= size_of_eos
-                eos = PtUtils.static_cast(data[offset:], CHROMIUM_SIMPLE_CACHE_EOS_V5)
+                if offset < offset_saved:
+                    self.prglog_mgr.debug("Invalid EOS for Stream 1")
+                    return True
+
+                eos = CHROMIUM_SIMPLE_CACHE_EOS_V5.from_buffer_copy(
+                    read_at(offset, sizeof(CHROMIUM_SIMPLE_CACHE_EOS_V5))
+                )
 
                 if eos.magic != SIG_CHROMIUM_SIMPLE_CACHE_EOS_MAGIC:
-                    self.prglog_mgr.debug("{}(): Invalid EOS for Stream 1".format(GET_MY_NAME()))
+                    self.prglog_mgr.debug("Invalid EOS for Stream 1")
+                elif eos.streamsize > offset - offset_saved:
+                    self.prglog_mgr.debug("Invalid size of Stream 1")
                 else:
                     self.cache_entry.crc32.append(eos.crc32)
+                    self.cache_entry.crc32_flags.append(eos.flags)
                     offset -= eos.streamsize
-                    stream = data[offset: offset + eos.streamsize]
+                    stream = SimpleCacheStream(file_path, offset, eos.streamsize)
                     self.cache_entry.streams.append(stream)
 
         return True
@@ -212,7 +584,7 @@ class ChromiumSimpleCache:
     def close(self):
         """Close this object
         """
-        self.prglog_mgr.info("{}()".format(GET_MY_NAME()))
+        self.prglog_mgr.info("")
 
         self.cache_entry = None
 
@@ -20,11 +20,41 @@ import re
 import json
 from ctypes import *
 import gzip
+import zlib
 import random
+import functools
 import iso8601
+from enum import IntEnum
+from concurrent.futures import ThreadPoolExecutor
+
+
+class GzipStatus(IntEnum):
+    """GzipStatus class
+        - The result of PtUtils.decompress_gzip_incremental()
+    """
+    OK          = 0x00000000  # Completely decompressed
+    TRUNCATED   = 0x00000001  # Truncated or corrupted after some output (the recovered part is returned)
+    NOT_MATCHED = 0x00000002  # The output does not start with any of the expected prefixes
+    TOO_LARGE   = 0x00000003  # The output exceeds the maximum size
+    INVALID     = 0x00000004  # Nothing was recovered
 
 
 class PtUtils:
+    # The maximum output size of gzip decompression (against gzip bombs)
+    GZIP_MAX_OUTPUT_SIZE = 64 * 1024 * 1024
+
+    # The input chunk size of gzip decompression
+    GZIP_INPUT_CHUNK_SIZE = 64 * 1024
+
+    # The read size of hashing files (hashlib releases the GIL while hashing each chunk)
+    HASH_BUFFER_SIZE = 1024 * 1024
+
+    # The timezone setting (computed once per run, cf. get_timezone())
+    TIMEZONE = None
+
+    # The number of cached timestamp conversions
+    TIMESTAMP_CACHE_SIZE = 65536
+
     def __init__(self):
         return
 
@@ -96,6 +126,26 @@ class PtUtils:
     def get_timezone():
         """Get the timezone setting
 
+        Returns:
+            Timezone (str): (UTC OO) Timezone
+        """
+        if PtUtils.TIMEZONE is None:
+            PtUtils.TIMEZONE = PtUtils.compute_timezone()
+        return PtUtils.TIMEZONE
+
+    @staticmethod
+    def reset_timezone():
+        """Reset the cached timezone setting and timestamp conversions (e.g. after changing TZ)
+        """
+        PtUtils.TIMEZONE = None
+        PtUtils.convert_unix_second_to_str.cache_clear()
+        PtUtils.convert_iso8602_to_str.cache_clear()
+        PtUtils.convert_str_to_unix_second.cache_clear()
+
+    @staticmethod
+    def compute_timezone():
+        """Compute the timezone setting
+
         Returns:
             Timezone (str): (UTC OO) Timezone
         """
@@ -159,6 +209,71 @@ class PtUtils:
         except:
             pass
 
+    @staticmethod
+    def copy_file_and_hash(src, dst, algorithms=('sha1',), head_size=8):
+        """Copy the src to the dst while hashing it (the src is read exactly once)
+
+            - 'dst' can be a function deciding the destination path from the leading bytes of the src
+              (e.g. the extension by the magic)
+            - Without algorithms, the rest of the src is copied in the kernel (os.copy_file_range)
+
+        Args:
+            src (str): The source path
+            dst (str or function): The destination path (or a function of the leading bytes)
+            algorithms (tuple): Names of hashlib algorithms
+            head_size (int): The size of the leading bytes
+
+        Returns:
+            The destination path (str) or None
+            A dict of {algorithm: hash value}
+            The leading bytes (bytes)
+        """
+        hash_contexts = [(algorithm, hashlib.new(algorithm)) for algorithm in algorithms]
+        buffer = bytearray(PtUtils.HASH_BUFFER_SIZE)
+        view = memoryview(buffer)
+
+        try:
+            with open(src, "rb", buffering=0) as f_src:
+                length = f_src.readinto(buffer)
+                head = bytes(view[:min(head_size, length)])
+                path_dst = dst(head) if callable(dst) else dst
+
+                with open(path_dst, "wb") as f_dst:
+                    while length:
+                        for _, hash_context in hash_contexts:
+                            hash_context.update(view[:length])
+                        f_dst.write(view[:length])
+
+                        if not hash_contexts:
+                            f_dst.flush()
+                            PtUtils.copy_file_range(f_src, f_dst)
+                            break
+
+                        length = f_src.readinto(buffer)
+
+            shutil.copymode(src, path_dst)
+        except OSError:
+            return None, {}, b''
+
+        return path_dst, {algorithm: hash_context.hexdigest() for algorithm, hash_context in hash_contexts}, head
+
+    @staticmethod
+    def copy_file_range(f_src, f_dst):
+        """Copy the rest of an opened file to another (in the kernel if possible)
+
+        Args:
+            f_src: The source file object (the current position is the start)
+            f_dst: The destination file object (flushed)
+        """
+        try:
+            while os.copy_file_range(f_src.fileno(), f_dst.fileno(), PtUtils.HASH_BUFFER_SIZE * 8) > 0:
+                pass
+            return
+        except (AttributeError, OSError):
+            pass  # Not supported (platforms or file systems)
+
+        shutil.copyfileobj(f_src, f_dst, PtUtils.HASH_BUFFER_SIZE)
+
     @staticmethod
     def delete_file(path):
         """Delete a file
@@ -234,14 +349,7 @@ class PtUtils:
         Returns:
             SHA1 hash value
         """
-        hash_context = hashlib.sha1()
-        if filemode is False:
-            hash_context.update(data)
-        else:
-            with open(data, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_context.update(chunk)
-        return hash_context.hexdigest()
+        return PtUtils.hash_multiple(data, ('sha1',), filemode).get('sha1')
 
     @staticmethod
     def hash_sha256(data, filemode=False):
@@ -254,14 +362,55 @@ class PtUtils:
         Returns:
             SHA256 hash value
         """
-        hash_context = hashlib.sha256()
+        return PtUtils.hash_multiple(data, ('sha256',), filemode).get('sha256')
+
+    @staticmethod
+    def hash_multiple(data, algorithms=('sha1', 'sha256', 'md5'), filemode=False):
+        """Calculate several hash values in one pass
+
+        Args:
+            data (bytes, bytearray or memoryview): Data (or the file path if filemode is True)
+            algorithms (tuple): Names of hashlib algorithms
+            filemode (bool): If True, 'data' is the file path (read once in large chunks)
+
+        Returns:
+            A dict of {algorithm: hash value}
+        """
+        hash_contexts = [(algorithm, hashlib.new(algorithm)) for algorithm in algorithms]
+
         if filemode is False:
-            hash_context.update(data)
+            for _, hash_context in hash_contexts:
+                hash_context.update(data)
         else:
-            with open(data, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_context.update(chunk)
-        return hash_context.hexdigest()
+            buffer = bytearray(PtUtils.HASH_BUFFER_SIZE)
+            view = memoryview(buffer)
+            with open(data, "rb", buffering=0) as f:
+                for length in iter(lambda: f.readinto(buffer), 0):
+                    for _, hash_context in hash_contexts:
+                        hash_context.update(view[:length])
+
+        return {algorithm: hash_context.hexdigest() for algorithm, hash_context in hash_contexts}
+
+    @staticmethod
+    def hash_files(paths, algorithms=('sha1', 'sha256', 'md5'), workers=None):
+        """Calculate several hash values of files using a thread pool
+
+        Args:
+            paths (list): File paths
+            algorithms (tuple): Names of hashlib algorithms
+            workers (int): The number of threads (default: the number of CPUs)
+
+        Returns:
+            A list of {algorithm: hash value} (None for unreadable files) in the order of paths
+        """
+        def hash_file(path):
+            try:
+                return PtUtils.hash_multiple(path, algorithms, filemode=True)
+            except OSError:
+                return None
+
+        with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as executor:
+            return list(executor.map(hash_file, paths))
 
     @staticmethod
     def get_valid_filename(s):
@@ -287,12 +436,103 @@ class PtUtils:
             The converted date (str): YYYY-MM-DD
             The converted time (str): hh:mm:ss
         """
-        ts = datetime.datetime.fromtimestamp(int(value/1000))
+        d, t = PtUtils.convert_unix_second_to_str(int(value/1000))
+        return d, u"{}.{:03}".format(t, int(value%1000))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+    def convert_unix_second_to_str(value):
+        """Convert a unix time to string (local time, cached)
+
+        Args:
+            value (int): Unix time
+
+        Returns:
+            The converted date (str): YYYY-MM-DD
+            The converted time (str): hh:mm:ss
+        """
+        ts = datetime.datetime.fromtimestamp(value)
         d = u"{:4}-{:02}-{:02}".format(ts.year, ts.month, ts.day)
-        t = u"{:02}:{:02}:{:02}.{:03}".format(ts.hour, ts.minute, ts.second, int(value%1000))
+        t = u"{:02}:{:02}:{:02}".format(ts.hour, ts.minute, ts.second)
         return d, t
 
     @staticmethod
+    def convert_unix_milliseconds_to_str(values):
+        """Convert unix millisecond times to strings (local time) at once
+
+        Args:
+            values (iterable): Unix millisecond times (None is allowed)
+
+        Returns:
+            The converted dates (list): YYYY-MM-DD (None for None)
+            The converted times (list): hh:mm:ss.sss (None for None)
+        """
+        dates = []
+        times = []
+        converted = {}
+
+        for value in values:
+            if value is None:
+                dates.append(None)
+                times.append(None)
+                continue
+
+            result = converted.get(value)
+            if result is None:
+                result = converted[value] = PtUtils.convert_unix_millisecond_to_str(value)
+
+            dates.append(result[0])
+            times.append(result[1])
+
+        return dates, times
+
+    @staticmethod
+    def convert_str_to_unix_millisecond(d, t):
+        """Convert date & time strings (local time) to a unix millisecond
+            - The inverse of convert_unix_millisecond_to_str()
+
+        Args:
+            d (str): YYYY-MM-DD
+            t (str): hh:mm:ss or hh:mm:ss.sss
+
+        Returns:
+            Unix millisecond time (int) or None
+        """
+        if not isinstance(d, str) or not isinstance(t, str) or len(t) < 8:
+            return None
+
+        seconds = PtUtils.convert_str_to_unix_second(d, t[:8])
+        if seconds is None:
+            return None
+
+        milliseconds = 0
+        if len(t) > 9 and t[8] == '.':
+            try:
+                milliseconds = int(t[9:12].ljust(3, '0'))
+            except ValueError:
+                return None
+        return seconds * 1000 + milliseconds
+
+    @staticmethod
+    @functools.lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+    def convert_str_to_unix_second(d, t):
+        """Convert date & time strings (local time) to a unix time (cached)
+
+        Args:
+            d (str): YYYY-MM-DD
+            t (str): hh:mm:ss
+
+        Returns:
+            Unix time (int) or None
+        """
+        try:
+            ts = datetime.datetime.strptime("{} {}".format(d, t), "%Y-%m-%d %H:%M:%S")
+            return int(ts.timestamp())  # A naive datetime is treated as local time
+        except (ValueError, OverflowError, OSError):
+            return None
+
+    @staticmethod
+    @functools.lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
     def convert_iso8602_to_str(value, millisecond=True):
         """Convert a iso8602 to string (local time)
 
@@ -314,6 +554,21 @@ class PtUtils:
             t = u"{:02}:{:02}:{:02}".format(ts.hour, ts.minute, ts.second)
         return d, t
 
+    @staticmethod
+    @functools.lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+    def convert_iso8602_to_unix_millisecond(value):
+        """Convert a iso8602 to a unix millisecond (the same instant as convert_iso8602_to_str())
+
+        Args:
+            value (string): iso8601
+
+        Returns:
+            Unix millisecond time (int)
+        """
+        ts = iso8601.parse_date(value)
+        ts = ts.replace(tzinfo=timezone.utc)
+        return int(ts.replace(microsecond=0).timestamp()) * 1000 + ts.microsecond // 1000
+
     @staticmethod
     def make_iso8602(d, t, millisecond=True):
         """Make a iso8602 using date and time strings
@@ -393,12 +648,97 @@ class PtUtils:
         Returns:
             Decompressed data (bytes)
         """
-        try:
-            data = gzip.decompress(data)
-        except:
+        data, status = PtUtils.decompress_gzip_incremental(data)
+        if status != GzipStatus.OK:
             return b''
         return data
 
+    @staticmethod
+    def decompress_gzip_incremental(data, prefixes=None, max_size=None):
+        """Decompress gzip compressed data incrementally
+
+            - If 'prefixes' is given, decompression stops after the first few output bytes
+              unless the output starts with one of them (e.g. (b'{', b'[') for JSON)
+            - Decompression stops if the output exceeds 'max_size'
+            - The recovered part of a truncated (or corrupted) stream is returned with TRUNCATED
+
+        Args:
+            data (bytes or memoryview): Compressed data (one or more gzip members)
+            prefixes (tuple): Expected prefixes of the output (bytes)
+            max_size (int): The maximum output size (default: PtUtils.GZIP_MAX_OUTPUT_SIZE)
+
+        Returns:
+            Decompressed data (bytes)
+            The status (GzipStatus)
+        """
+        if max_size is None:
+            max_size = PtUtils.GZIP_MAX_OUTPUT_SIZE
+
+        sniff_size = max(len(prefix) for prefix in prefixes) if prefixes else 0
+        chunk_size = PtUtils.GZIP_INPUT_CHUNK_SIZE
+
+        view = memoryview(data)
+        output = []
+        output_size = 0
+        offset = 0
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+        try:
+            while True:
+                if decompressor.unconsumed_tail:
+                    chunk = decompressor.unconsumed_tail
+                elif offset < len(view):
+                    chunk = view[offset: offset + chunk_size]
+                    offset += len(chunk)
+                else:
+                    break
+
+                # Limit the output to what is needed for sniffing (at first) or to the maximum size
+                if output_size < sniff_size:
+                    limit = sniff_size - output_size
+                else:
+                    limit = max_size - output_size + 1
+
+                piece = decompressor.decompress(chunk, limit)
+                output.append(piece)
+                output_size += len(piece)
+
+                if output_size > max_size:
+                    return b'', GzipStatus.TOO_LARGE
+
+                if sniff_size and output_size >= sniff_size:
+                    head = b''.join(output)
+                    if not head.startswith(tuple(prefixes)):
+                        return b'', GzipStatus.NOT_MATCHED
+                    output = [head]
+                    sniff_size = 0
+
+                if decompressor.eof:
+                    # The next gzip member (if any)
+                    unused_data = decompressor.unused_data + bytes(view[offset:])
+                    if not unused_data.startswith(b'\x1f\x8b'):
+                        break
+                    view = memoryview(unused_data)
+                    offset = 0
+                    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+        except zlib.error:
+            if output_size == 0:
+                return b'', GzipStatus.INVALID
+            return b''.join(output), GzipStatus.TRUNCATED
+
+        output = b''.join(output)
+
+        if sniff_size and not output.startswith(tuple(prefixes)):
+            return b'', GzipStatus.NOT_MATCHED
+
+        if not decompressor.eof:
+            if output_size == 0:
+                return b'', GzipStatus.INVALID
+            return output, GzipStatus.TRUNCATED
+
+        return output, GzipStatus.OK
+
     @staticmethod
     def encode_url(u):
         """Build up a query string to go into a URL